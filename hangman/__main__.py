@@ -0,0 +1,189 @@
+"""Command line entry point: ``python -m hangman <command>``.
+
+Only argparse is imported up front. Each command imports what it needs
+when it runs, so a headless command never loads tkinter, numpy or the
+network stack unless it uses them:
+
+    play      play in the terminal
+    gui       the Tk window (same as python -m hangman.gui)
+    simulate  bulk random games with numpy
+    serve     the headless JSON server
+    bench     the micro-benchmark suite
+    tournament  bots against word pools on every core
+    loadtest  simulated players with latency percentiles
+"""
+
+import argparse
+import sys
+
+LEVELS = ("basic", "intermediate", "easy", "medium", "hard", "expert")
+
+
+def play(args) -> int:
+    """Play games in the terminal until the player stops."""
+    import time  # pylint: disable=import-outside-toplevel
+    from hangman.game import GuessResult, HangmanGame, GUESS_SECONDS  # noqa: E501 pylint: disable=import-outside-toplevel
+    from hangman.selector import Level, WordSelector  # noqa: E501 pylint: disable=import-outside-toplevel
+    game_cls = HangmanGame
+    if args.evil:
+        from hangman.evil import EvilHangmanGame  # noqa: E501 pylint: disable=import-outside-toplevel
+        game_cls = EvilHangmanGame
+    if args.fresh:
+        from hangman.weighted import WeightedWordSelector  # noqa: E501 pylint: disable=import-outside-toplevel
+        selector = WeightedWordSelector(seed=args.seed)
+    else:
+        selector = WordSelector(seed=args.seed)
+    level = Level[args.level.upper()]
+    messages = {
+        GuessResult.CORRECT: "Correct!",
+        GuessResult.INCORRECT: "Wrong guess.",
+        GuessResult.REPEATED: "Already guessed.",
+        GuessResult.INVALID: "Enter a single letter.",
+    }
+    while True:
+        game = game_cls(selector, level, max_lives=args.lives)
+        while not game.is_won() and not game.is_lost():
+            guessed = ", ".join(sorted(game.guessed)) or "_"
+            print(f"\n{game.masked()}   Lives: {game.lives}   Guessed: {guessed}")  # noqa: E501 pylint: disable= [C0301]
+            start = time.monotonic()
+            try:
+                guess = input(f"Guess ({GUESS_SECONDS}s): ").strip()
+            except EOFError:
+                return 0
+            late = int((time.monotonic() - start) // GUESS_SECONDS)
+            if late and not args.no_timer:
+                print(f"Time's up! You lose {min(late, game.lives)} life(s).")  # noqa: E501 pylint: disable= [C0301]
+                for _ in range(min(late, game.lives)):
+                    game.time_out()
+                if game.is_lost():
+                    break
+            print(messages[game.guess_letter(guess[:1] if guess else "")])
+        if game.is_won():
+            print(f"\nYou won! The answer was: {game.answer}")
+        else:
+            print(f"\nGame over! The answer was: {game.answer}")
+        try:
+            again = input("Play again? [y/N] ").strip().lower()
+        except EOFError:
+            return 0
+        if again != "y":
+            return 0
+
+
+def gui(_args) -> int:
+    """Open the Tk window."""
+    from hangman.gui import main  # pylint: disable=import-outside-toplevel
+    main()
+    return 0
+
+
+def simulate(args) -> int:
+    """Simulate random-guessing games and print the win rate."""
+    import json  # pylint: disable=import-outside-toplevel
+    import time  # pylint: disable=import-outside-toplevel
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    from hangman import simulate as sim  # noqa: E501 pylint: disable=import-outside-toplevel
+    from hangman.selector import Level, WordSelector  # noqa: E501 pylint: disable=import-outside-toplevel
+    pool = WordSelector().pool(Level[args.level.upper()])
+    words = [word.decode("UTF-8") if isinstance(word, bytes) else word
+             for word in pool]
+    picks = np.random.default_rng(args.seed).integers(len(words),
+                                                      size=args.games)
+    answers = sim.encode_answers([words[i] for i in picks])
+    start = time.perf_counter()
+    moves = sim.random_moves(args.games, timeout_rate=args.timeout_rate,
+                             seed=args.seed)
+    result = sim.simulate(answers, moves, args.lives)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "games": args.games,
+        "level": args.level,
+        "max_lives": args.lives,
+        "win_rate": result.win_rate,
+        "seconds": elapsed,
+        "games_per_second": args.games / elapsed if elapsed else 0.0,
+    }, indent=2))
+    return 0
+
+
+def serve(args) -> int:
+    """Run the headless server with the remaining arguments."""
+    from hangman.server import main  # pylint: disable=import-outside-toplevel
+    main(args.rest)
+    return 0
+
+
+def bench(args) -> int:
+    """Run the benchmarks with the remaining arguments."""
+    from hangman.bench import main  # pylint: disable=import-outside-toplevel
+    main(args.rest)
+    return 0
+
+
+def tournament(args) -> int:
+    """Run a bot tournament with the remaining arguments."""
+    from hangman.tournament import main  # pylint: disable=import-outside-toplevel
+    main(args.rest)
+    return 0
+
+
+def loadtest(args) -> int:
+    """Run the load generator with the remaining arguments."""
+    from hangman.loadtest import main  # pylint: disable=import-outside-toplevel
+    main(args.rest)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """The argument parser for every command."""
+    parser = argparse.ArgumentParser(prog="python -m hangman",
+                                     description="Hangman game and tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    play_parser = commands.add_parser("play", help="play in the terminal")
+    play_parser.add_argument("--level", default="basic", choices=LEVELS)
+    play_parser.add_argument("--evil", action="store_true",
+                             help="the game dodges your guesses")
+    play_parser.add_argument("--lives", type=int, default=6)
+    play_parser.add_argument("--seed", type=int)
+    play_parser.add_argument("--fresh", action="store_true",
+                             help="random picks that favour unseen words")
+    play_parser.add_argument("--no-timer", action="store_true",
+                             help="do not take lives for slow guesses")
+    play_parser.set_defaults(run=play)
+
+    gui_parser = commands.add_parser("gui", help="open the game window")
+    gui_parser.set_defaults(run=gui)
+
+    sim_parser = commands.add_parser("simulate",
+                                     help="simulate random games (numpy)")
+    sim_parser.add_argument("--games", type=int, default=100_000)
+    sim_parser.add_argument("--level", default="basic", choices=LEVELS)
+    sim_parser.add_argument("--lives", type=int, default=6)
+    sim_parser.add_argument("--timeout-rate", type=float, default=0.0)
+    sim_parser.add_argument("--seed", type=int)
+    sim_parser.set_defaults(run=simulate)
+
+    for name, run, text in (("serve", serve, "run the headless server"),
+                            ("bench", bench, "run the benchmarks"),
+                            ("tournament", tournament,
+                             "play bots against word pools"),
+                            ("loadtest", loadtest,
+                             "load-test a game host")):
+        sub = commands.add_parser(name, help=text, add_help=False)
+        sub.set_defaults(run=run, forward=True)
+    return parser
+
+
+def main(argv=None) -> int:
+    """Dispatch to the chosen command."""
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+    if rest and not getattr(args, "forward", False):
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    args.rest = rest
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Micro-benchmarks for the game and selector hot paths.
+
+Run with ``python -m hangman.bench``. Each case reports operations per
+second (best of several repeats) plus the peak memory traced while it
+runs and the bytes it leaves allocated per operation. Results are
+written as JSON so two runs can be compared with ``--compare``.
+
+The benchmarks run offline: the word list comes from the cache or the
+bundled copy, never from the network.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from string import ascii_lowercase
+from typing import Callable, Dict, List, Tuple
+from hangman import game as engines  # pylint: disable= [E0401]
+from hangman import snapshot  # pylint: disable= [E0401]
+from hangman.selector import (  # pylint: disable= [E0401]
+    FixedWordSelector, Level, WordSelector, basic_words)
+from hangman.source import OFFLINE_ENV  # pylint: disable= [E0401]
+
+# Each case builds its state and returns (operation, ops per call).
+Case = Callable[[], Tuple[Callable[[], object], int]]
+CASES: Dict[str, Case] = {}
+
+PHRASE = "test driven development"
+
+
+def case(name: str):
+    """Register a benchmark case under name."""
+    def register(func: Case) -> Case:
+        CASES[name] = func
+        return func
+    return register
+
+
+@case("selector.pick_a_word[BASIC]")
+def bench_pick_basic():
+    """Pick a basic word."""
+    selector = WordSelector()
+    return lambda: selector.pick_a_word(Level.BASIC), 1
+
+
+@case("selector.pick_a_word[INTERMEDIATE]")
+def bench_pick_intermediate():
+    """Pick an intermediate phrase."""
+    selector = WordSelector()
+    return lambda: selector.pick_a_word(Level.INTERMEDIATE), 1
+
+
+@case("selector.pick_a_word[BASIC, weighted]")
+def bench_pick_weighted():
+    """Pick a basic word by weight, marking it seen."""
+    from hangman.weighted import WeightedWordSelector  # noqa: E501 pylint: disable=import-outside-toplevel
+    selector = WeightedWordSelector(seed=1)
+    return lambda: selector.pick_a_word(Level.BASIC), 1
+
+
+def _engine_cases(engine: str):
+    """Register the per-method cases for one game engine."""
+    cls = getattr(engines, engine)
+    selector = FixedWordSelector(word=PHRASE)
+
+    def mid_game():
+        game = cls(selector, Level.BASIC)
+        for letter in "etsv":
+            game.guess_letter(letter)
+        return game
+
+    @case(f"{engine}.__post_init__")
+    def bench_init():
+        return lambda: cls(selector, Level.BASIC), 1
+
+    @case(f"{engine}.guess_letter")
+    def bench_guess():
+        def sweep():
+            game = cls(selector, Level.BASIC, max_lives=26)
+            for letter in ascii_lowercase:
+                game.guess_letter(letter)
+        return sweep, 26
+
+    @case(f"{engine}.masked")
+    def bench_masked():
+        return mid_game().masked, 1
+
+    @case(f"{engine}.is_won")
+    def bench_is_won():
+        return mid_game().is_won, 1
+
+    @case(f"{engine}.is_lost")
+    def bench_is_lost():
+        return mid_game().is_lost, 1
+
+    @case(f"{engine}.to_bytes")
+    def bench_to_bytes():
+        game = mid_game()
+        return lambda: snapshot.to_bytes(game), 1
+
+    @case(f"{engine}.from_bytes")
+    def bench_from_bytes():
+        data = snapshot.to_bytes(mid_game())
+        return lambda: snapshot.from_bytes(data, selector, cls), 1
+
+    @case(f"{engine}.playthrough")
+    def bench_playthrough():
+        rng = random.Random(0)
+        selectors = [FixedWordSelector(word=word.decode("UTF-8"))
+                     for word in basic_words()[:500]]
+        orders = [rng.sample(ascii_lowercase, 26) for _ in range(64)]
+        counter = itertools.count()
+
+        def play():
+            i = next(counter)
+            game = cls(selectors[i % len(selectors)], Level.BASIC)
+            for letter in orders[i % len(orders)]:
+                game.guess_letter(letter)
+                game.masked()
+                if game.is_won() or game.is_lost():
+                    break
+        return play, 1
+
+
+for _engine in ("HangmanGame", "BitmaskGame"):
+    _engine_cases(_engine)
+
+
+def measure(op: Callable[[], object], per_call: int, repeat: int = 5,
+            target: float = 0.2) -> Dict[str, float]:
+    """Time op and trace its allocations."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            op()
+        if time.perf_counter() - start >= target or calls >= 1 << 22:
+            break
+        calls *= 2
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            op()
+        best = min(best, time.perf_counter() - start)
+    ops = calls * per_call
+    traced = max(1, calls // 10)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for _ in range(traced):
+        op()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ops_per_sec": ops / best,
+        "ns_per_op": best / ops * 1e9,
+        "peak_bytes": peak - before,
+        "retained_bytes_per_op": (after - before) / (traced * per_call),
+    }
+
+
+def run(names: List[str], repeat: int = 5, target: float = 0.2) -> dict:
+    """Run the named cases and return the report."""
+    results = {}
+    for name in names:
+        op, per_call = CASES[name]()
+        results[name] = measure(op, per_call, repeat, target)
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict) -> List[str]:
+    """Describe the change in ops/sec against a baseline report."""
+    lines = []
+    for name, result in report["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if old:
+            ratio = result["ops_per_sec"] / old["ops_per_sec"]
+            lines.append(f"{name:40} {ratio:6.2f}x")
+    return lines
+
+
+def main(argv=None):
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description="Hangman micro-benchmarks.")
+    parser.add_argument("-k", "--filter", default="",
+                        help="only run cases whose name contains this")
+    parser.add_argument("-o", "--out", help="write the JSON report here")
+    parser.add_argument("--compare", help="baseline JSON report to compare")
+    parser.add_argument("--quick", action="store_true",
+                        help="fewer, shorter repeats")
+    args = parser.parse_args(argv)
+    os.environ.setdefault(OFFLINE_ENV, "1")
+    names = [name for name in CASES if args.filter in name]
+    report = run(names, *((2, 0.05) if args.quick else (5, 0.2)))
+    for name, result in report["results"].items():
+        print(f"{name:40} {result['ops_per_sec']:>14,.0f} ops/s "
+              f"{result['ns_per_op']:>10,.0f} ns/op "
+              f"{result['peak_bytes']:>10,} B peak "
+              f"{result['retained_bytes_per_op']:>8,.1f} B/op retained")
+    if args.out:
+        with open(args.out, "w", encoding="UTF-8") as out:
+            json.dump(report, out, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="UTF-8") as baseline:
+            print("\n".join(compare(report, json.load(baseline))))
+    return report
+
+
+if __name__ == "__main__":
+    main()
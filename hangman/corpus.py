@@ -0,0 +1,327 @@
+"""Stream huge local wordlists into a bounded-memory word pool.
+
+Files are read line by line (gzip files are detected by their magic
+bytes), so input of any size is never held in memory. Each line is
+normalised and filtered by a CorpusFilter, duplicates are dropped with a
+Bloom filter, and the survivors become either:
+
+* a uniform sample of at most ``size`` entries (reservoir sampling,
+  Algorithm L), held in memory as a list of bytes; or
+* an on-disk hangman.wordindex file holding every entry, memory-mapped.
+
+Both results can be passed straight to ``WordSelector(basic_pool=...)``.
+The Bloom filter bounds the memory used for dedupe whatever the input
+size, at the cost of dropping some new words as duplicates. How many
+depends on how full it gets: size it from the expected number of
+distinct entries (--expected on the command line) to keep that near
+FALSE_POSITIVE_RATE. The estimated rate is reported with the progress,
+and a warning is raised once the filter is more than SATURATION_FILL
+full.
+"""
+
+import argparse
+import gzip
+import math
+import random
+import sys
+import time
+import warnings
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Union  # noqa: E501 pylint: disable= [C0301]
+from hangman.wordindex import WordIndex, build_index  # noqa: E501 pylint: disable= [E0401]
+
+GZIP_MAGIC = b"\x1f\x8b"
+READ_BUFFER = 1 << 20
+
+# Default Bloom filter size: 128 Mbit (16 MiB) gives about 0.04% false
+# positives at 3 million distinct entries and 1.7% at 13 million.
+DEDUPE_BITS = 1 << 27
+
+# False-positive rate a filter sized from an expected count aims for.
+FALSE_POSITIVE_RATE = 0.001
+
+# Fraction of set bits past which the filter warns it is saturated; about
+# 1% of new entries are then taken for duplicates.
+SATURATION_FILL = 0.3
+
+# How often progress callbacks fire.
+PROGRESS_SECONDS = 1.0
+
+
+@dataclass
+class CorpusFilter:
+    """Which lines become pool entries, and how they are normalised."""
+    min_length: int = 1
+    max_length: int = 64
+    max_words: int = 1
+    ascii_only: bool = True
+
+    def accept(self, line: bytes) -> Optional[bytes]:
+        """Return the normalised entry for line, or None to skip it."""
+        if self.ascii_only:
+            if not line.isascii():
+                return None
+            words = line.lower().split()
+        else:
+            try:
+                words = [word.encode("UTF-8") for word in
+                         line.decode("UTF-8").lower().split()]
+            except UnicodeDecodeError:
+                return None
+        if not words or len(words) > self.max_words:
+            return None
+        for word in words:
+            if not (word.isalpha() if self.ascii_only
+                    else word.decode("UTF-8").isalpha()):
+                return None
+        entry = b" ".join(words)
+        size = len(entry) if self.ascii_only else len(entry.decode("UTF-8"))
+        if not self.min_length <= size <= self.max_length:
+            return None
+        return entry
+
+
+class BloomFilter:
+    """Fixed-size set membership with no false negatives.
+
+    Blocked layout: an item's four bits all live in one 64-bit word, so a
+    lookup is one hash, one word read and one mask test.
+    """
+    def __init__(self, bits: int = DEDUPE_BITS):
+        self._words = array("Q", bytes(8 * max(1, bits // 64)))
+        self.set_bits = 0
+        # Sum over words of popcount ** 4, for the false-positive estimate.
+        self._power = 0
+
+    @classmethod
+    def for_count(cls, expected: int,
+                  rate: float = FALSE_POSITIVE_RATE) -> "BloomFilter":
+        """The smallest filter holding expected items at about rate."""
+        low, high = 0, 1
+        while _blocked_rate(expected / high) > rate:
+            low, high = high, 2 * high
+        while low + 1 < high:
+            middle = (low + high) // 2
+            if _blocked_rate(expected / middle) > rate:
+                low = middle
+            else:
+                high = middle
+        return cls(64 * high)
+
+    @property
+    def fill(self) -> float:
+        """Fraction of the filter's bits that are set."""
+        return self.set_bits / (64 * len(self._words))
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Estimated chance that a new item is taken for a duplicate."""
+        return self._power / (len(self._words) * 64 ** 4)
+
+    def add(self, item: bytes) -> bool:
+        """Add item; return False if it was (probably) already present."""
+        value = hash(item) & 0xFFFFFFFFFFFFFFFF
+        slot = (value & 0xFFFFFFFF) % len(self._words)
+        mask = ((1 << (value >> 40 & 63)) | (1 << (value >> 46 & 63))
+                | (1 << (value >> 52 & 63)) | (1 << (value >> 58)))
+        word = self._words[slot]
+        if word & mask == mask:
+            return False
+        before, after = word.bit_count(), (word | mask).bit_count()
+        self._words[slot] = word | mask
+        self.set_bits += after - before
+        self._power += after ** 4 - before ** 4
+        return True
+
+
+def _blocked_rate(per_word: float) -> float:
+    """Expected false-positive rate at per_word items per 64-bit word."""
+    if per_word > 500:
+        return 1.0
+    rate, chance, items = 0.0, math.exp(-per_word), 0
+    while items <= per_word or chance > 1e-12:
+        rate += chance * (1 - (63 / 64) ** (4 * items)) ** 4
+        items += 1
+        chance *= per_word / items
+    return rate
+
+
+@dataclass
+class Progress:
+    """Running totals for a load, reported while it streams."""
+    lines: int = 0
+    bytes_read: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    false_positive_rate: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the load started."""
+        return time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        """One line with totals and throughput."""
+        elapsed = max(self.elapsed, 1e-9)
+        return (f"{self.lines:,} lines, {self.bytes_read / 1e6:,.1f} MB, "
+                f"{self.accepted:,} kept, {self.duplicates:,} duplicates "
+                f"(~{self.false_positive_rate:.2%} false), "
+                f"{self.lines / elapsed:,.0f} lines/s, "
+                f"{self.bytes_read / 1e6 / elapsed:,.1f} MB/s")
+
+
+Reporter = Callable[[Progress], None]
+PathLike = Union[str, Path]
+
+
+def open_lines(path: PathLike):
+    """Open a plain or gzip file for binary line iteration."""
+    with open(path, "rb") as probe:
+        magic = probe.read(2)
+    if magic == GZIP_MAGIC:
+        return gzip.open(path, "rb")
+    return open(path, "rb", buffering=READ_BUFFER)  # noqa: E501 pylint: disable=consider-using-with
+
+
+def stream(paths: Iterable[PathLike], corpus_filter: Optional[CorpusFilter] = None,  # noqa: E501 pylint: disable= [C0301]
+           progress: Optional[Progress] = None,
+           report: Optional[Reporter] = None,
+           dedupe: Optional[BloomFilter] = None) -> Iterator[bytes]:
+    """Yield the filtered, deduplicated entries of every file in order."""
+    corpus_filter = corpus_filter or CorpusFilter()
+    progress = progress if progress is not None else Progress()
+    dedupe = dedupe if dedupe is not None else BloomFilter()
+    accept = corpus_filter.accept
+    saturated = False
+    next_report = time.perf_counter() + PROGRESS_SECONDS
+    for path in paths:
+        with open_lines(path) as lines:
+            for line in lines:
+                progress.lines += 1
+                progress.bytes_read += len(line)
+                entry = accept(line)
+                if entry is not None:
+                    if dedupe.add(entry):
+                        progress.accepted += 1
+                        yield entry
+                    else:
+                        progress.duplicates += 1
+                if not progress.lines & 0x3FFF:
+                    saturated = saturated or _warn_if_saturated(dedupe)
+                    if report and time.perf_counter() >= next_report:
+                        progress.false_positive_rate = dedupe.false_positive_rate  # noqa: E501 pylint: disable= [C0301]
+                        report(progress)
+                        next_report = time.perf_counter() + PROGRESS_SECONDS
+    if not saturated:
+        _warn_if_saturated(dedupe)
+    progress.false_positive_rate = dedupe.false_positive_rate
+    if report:
+        report(progress)
+
+
+def _warn_if_saturated(dedupe: BloomFilter) -> bool:
+    """Warn and return True once dedupe is past SATURATION_FILL."""
+    if dedupe.fill <= SATURATION_FILL:
+        return False
+    warnings.warn(f"dedupe filter is {dedupe.fill:.0%} full; about "
+                  f"{dedupe.false_positive_rate:.1%} of new entries are "
+                  "dropped as duplicates (pass a larger expected count)",
+                  RuntimeWarning, stacklevel=3)
+    return True
+
+
+def _uniform(rng: random.Random) -> float:
+    """Uniform float in the open interval (0, 1)."""
+    value = rng.random()
+    while value == 0.0:
+        value = rng.random()
+    return value
+
+
+def reservoir(entries: Iterable[bytes], size: int,
+              rng: Optional[random.Random] = None) -> List[bytes]:
+    """Uniform sample of up to size entries in one pass (Algorithm L).
+
+    Instead of drawing a random number per entry, it draws how many
+    entries to skip before the next replacement.
+    """
+    rng = rng or random.Random()
+    entries = iter(entries)
+    sample = [entry for _, entry in zip(range(size), entries)]
+    if len(sample) < size or size == 0:
+        return sample
+    weight = math.exp(math.log(_uniform(rng)) / size)
+    while True:
+        skip = math.floor(math.log(_uniform(rng)) / math.log1p(-weight))
+        entry = next(islice(entries, skip, None), None)
+        if entry is None:
+            return sample
+        sample[rng.randrange(size)] = entry
+        weight *= math.exp(math.log(_uniform(rng)) / size)
+
+
+def load_pool(paths: Sequence[PathLike], size: Optional[int] = None,
+              index_path: Optional[PathLike] = None,
+              corpus_filter: Optional[CorpusFilter] = None,
+              seed: Optional[int] = None,
+              report: Optional[Reporter] = None,
+              expected: Optional[int] = None) -> Sequence[bytes]:
+    """Build a word pool from local files for WordSelector(basic_pool=...).
+
+    With index_path every entry is written to an on-disk index and a
+    WordIndex is returned; otherwise a reservoir sample of size entries
+    (10000 if not given) is returned as a list. expected, the number of
+    distinct entries the files hold, sizes the dedupe filter.
+    """
+    dedupe = BloomFilter.for_count(expected) if expected else None
+    entries = stream(paths, corpus_filter, report=report, dedupe=dedupe)
+    if index_path is not None:
+        build_index(entries, index_path)
+        return WordIndex(index_path)
+    return reservoir(entries, size or 10000, random.Random(seed))
+
+
+def print_progress(progress: Progress):
+    """Report progress on stderr."""
+    print(progress.summary(), file=sys.stderr)
+
+
+def main():
+    """Build a word pool from local corpora on the command line."""
+    parser = argparse.ArgumentParser(description="Stream wordlists into a "
+                                     "sampled list or a word index.")
+    parser.add_argument("paths", nargs="+", type=Path,
+                        help="plain or gzip wordlists, one entry per line")
+    out = parser.add_mutually_exclusive_group(required=True)
+    out.add_argument("--index", type=Path, help="write a word index here")
+    out.add_argument("--sample", type=Path,
+                     help="write a reservoir sample here, one per line")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--min-length", type=int, default=1)
+    parser.add_argument("--max-length", type=int, default=64)
+    parser.add_argument("--max-words", type=int, default=1,
+                        help="allow phrases of up to this many words")
+    parser.add_argument("--unicode", action="store_true",
+                        help="keep non-ASCII letters")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--expected", type=int,
+                        help="distinct entries expected; sizes the dedupe "
+                        "filter (default: 16 MiB)")
+    args = parser.parse_args()
+    corpus_filter = CorpusFilter(args.min_length, args.max_length,
+                                 args.max_words, not args.unicode)
+    pool = load_pool(args.paths, args.size, args.index, corpus_filter,
+                     args.seed, print_progress, args.expected)
+    if args.sample:
+        with open(args.sample, "wb") as sample:
+            for entry in pool:
+                sample.write(entry + b"\n")
+    print(f"Wrote {len(pool)} entries to {args.index or args.sample}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Precomputed difficulty scores and the graded levels built from them.
+
+A word's score is how many wrong guesses the entropy solver makes before
+finding it with unlimited lives. Scoring runs on a process pool and the
+scores are cached as JSON, keyed by word, so when the word list changes
+only the new words are scored. Graded levels are the four rank quartiles
+of the scores, so picking from one is O(1).
+
+Requires numpy (through hangman.solver) only when words must be scored.
+"""
+
+import argparse
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+from hangman.game import HangmanGame  # pylint: disable= [E0401]
+from hangman.selector import (  # pylint: disable= [E0401]
+    FixedWordSelector, INTERMEDIATE_PHRASES, Level, basic_words)
+from hangman.source import CACHE_DIR, DATA_DIR  # pylint: disable= [E0401]
+
+GRADES = (Level.EASY, Level.MEDIUM, Level.HARD, Level.EXPERT)
+SCORES_NAME = "difficulty.json"
+BUNDLED_SCORES = DATA_DIR / SCORES_NAME
+
+# Lives given to the solver so that every game runs to a win.
+SCORE_LIVES = 26
+
+_SOLVER = None
+_POOLS: Optional[Dict[Level, List[str]]] = None
+
+
+def corpus() -> List[str]:
+    """Every basic word and intermediate phrase, lowercased."""
+    words = [word.decode("UTF-8").lower() for word in basic_words()]
+    return list(dict.fromkeys(words + INTERMEDIATE_PHRASES))
+
+
+def _init_worker(pool: Sequence[str]):
+    """Build one solver per worker process."""
+    global _SOLVER  # pylint: disable=global-statement
+    from hangman.solver import EntropySolver  # noqa: E501 pylint: disable=import-outside-toplevel
+    _SOLVER = EntropySolver(pool)
+
+
+def _score_chunk(words: Sequence[str]) -> List[tuple]:
+    """Score a chunk of words with the worker's solver."""
+    scored = []
+    for word in words:
+        game = HangmanGame(FixedWordSelector(word=word), Level.BASIC,
+                           max_lives=SCORE_LIVES)
+        _SOLVER.play(game)
+        scored.append((word, SCORE_LIVES - game.lives))
+    return scored
+
+
+def load_scores(path: Path) -> Dict[str, int]:
+    """Read a score file, or return nothing if it is missing or corrupt."""
+    try:
+        return json.loads(Path(path).read_text())["scores"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def save_scores(scores: Dict[str, int], path: Path):
+    """Write scores atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": 1, "scores": scores},
+                              sort_keys=True, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def build_scores(words: Iterable[str], path: Optional[Path] = None,
+                 workers: Optional[int] = None,
+                 chunk: int = 250) -> Dict[str, int]:
+    """Score words, reusing scores already in path, and save the result."""
+    words = list(dict.fromkeys(words))
+    known = load_scores(path) if path else {}
+    todo = [word for word in words if word not in known]
+    scores = {word: known[word] for word in words if word in known}
+    if todo:
+        chunks = [todo[i:i + chunk] for i in range(0, len(todo), chunk)]
+        if workers == 1:
+            _init_worker(words)
+            for scored in map(_score_chunk, chunks):
+                scores.update(scored)
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(words,)) as pool:
+                for scored in pool.map(_score_chunk, chunks):
+                    scores.update(scored)
+    if path and (todo or len(scores) != len(known)):
+        save_scores(scores, path)
+    return scores
+
+
+def grade(scores: Dict[str, int]) -> Dict[Level, List[str]]:
+    """Split words into equal rank quartiles, easiest first."""
+    ranked = sorted(scores, key=lambda word: (scores[word], word))
+    size = len(ranked)
+    return {level: ranked[i * size // len(GRADES):(i + 1) * size // len(GRADES)]  # noqa: E501 pylint: disable= [C0301]
+            for i, level in enumerate(GRADES)}
+
+
+def graded_pools(workers: Optional[int] = None) -> Dict[Level, List[str]]:
+    """Graded word pools, scoring any words the cache does not know yet."""
+    global _POOLS  # pylint: disable=global-statement
+    if _POOLS is None:
+        path = CACHE_DIR / SCORES_NAME
+        if not path.exists() and BUNDLED_SCORES.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(BUNDLED_SCORES, path)
+        _POOLS = grade(build_scores(corpus(), path, workers))
+    return _POOLS
+
+
+def main():
+    """Rebuild the difficulty scores from the command line."""
+    parser = argparse.ArgumentParser(description="Score word difficulty.")
+    parser.add_argument("--out", type=Path, default=CACHE_DIR / SCORES_NAME)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+    scores = build_scores(corpus(), args.out, args.workers)
+    for level, words in grade(scores).items():
+        print(f"{level.name.lower()}: {len(words)} words, "
+              f"score {scores[words[0]]}-{scores[words[-1]]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""Append-only binary log of game events with streaming replay.
+
+An EventLog is a GameObserver: pass it as a game's observer and it
+records the answer, every guess with its GuessResult, every timeout and
+the outcome. Records are buffered in memory and appended in batches.
+
+File layout (all integers little-endian):
+
+    magic   4 bytes  b"HLOG"
+    version uint8
+    records uint16 payload length, then the payload:
+
+    OPEN     kind, 0 uint32 (written each time a writer opens the file)
+    START    kind, game id uint32, level uint8, max_lives int16, answer
+    GUESS    kind, game id uint32, result uint8, lives int16, guess
+    TIMEOUT  kind, game id uint32, lives int16
+    END      kind, game id uint32, won uint8, lives int16, answer
+
+Text fields are UTF-8 and run to the end of the payload; a GUESS keeps
+at most MAX_GUESS_CHARS of what was typed. END repeats the
+answer because an evil game only settles on one at the end. Game ids are
+numbered per writer, so several runs can append to one file: the OPEN
+record tells the reader that ids start over.
+
+Reading is a generator over the file, so replaying or aggregating a log
+keeps only the games still in progress in memory, never the whole file.
+"""
+
+import argparse
+import json
+import os
+import struct
+import threading
+import weakref
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from hangman.game import GameObserver, GuessResult, HangmanGame  # noqa: E501 pylint: disable= [E0401]
+from hangman.selector import Level  # pylint: disable= [E0401]
+
+MAGIC = b"HLOG"
+VERSION = 1
+HEADER = struct.Struct("<4sB")
+LENGTH = struct.Struct("<H")
+PREFIX = struct.Struct("<BI")
+START = struct.Struct("<BIBh")
+GUESS = struct.Struct("<BIBh")
+TIMEOUT = struct.Struct("<BIh")
+END = struct.Struct("<BIBh")
+
+# Characters of a guess that are logged; longer (invalid) input is cut.
+MAX_GUESS_CHARS = 16
+
+# Buffered bytes that trigger a write to disk.
+FLUSH_BYTES = 64 * 1024
+READ_CHUNK = 1 << 20
+
+
+class Kind(IntEnum):
+    """Type byte at the start of every record."""
+    OPEN = 0
+    START = 1
+    GUESS = 2
+    TIMEOUT = 3
+    END = 4
+
+
+@dataclass
+class Event:
+    """One decoded log record; unused fields keep their defaults."""
+    kind: Kind
+    game_id: int
+    lives: int = 0
+    level: Optional[Level] = None
+    result: Optional[GuessResult] = None
+    text: str = ""
+    won: bool = False
+
+
+@dataclass
+class LoggedGame:
+    """A finished game rebuilt from its records."""
+    game_id: int
+    answer: str
+    level: Level
+    max_lives: int
+    guesses: List[Tuple[str, GuessResult]] = field(default_factory=list)
+    timeouts: int = 0
+    won: bool = False
+    lives: int = 0
+
+
+class EventLog(GameObserver):
+    """Buffered, append-only writer that observes HangmanGame instances."""
+    def __init__(self, path, flush_bytes: int = FLUSH_BYTES):
+        self.path = Path(path)
+        self.flush_bytes = flush_bytes
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._ids: Dict[int, int] = {}
+        self._next_id = 1
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")  # pylint: disable=consider-using-with
+        if self._file.tell() == 0:
+            self._buffer += HEADER.pack(MAGIC, VERSION)
+        self._append(PREFIX.pack(Kind.OPEN, 0))
+
+    def _append(self, payload: bytes):
+        """Queue one length-prefixed record and flush a full batch."""
+        with self._lock:
+            self._buffer += LENGTH.pack(len(payload))
+            self._buffer += payload
+            if len(self._buffer) >= self.flush_bytes:
+                self._flush()
+
+    def _flush(self):
+        """Write the buffer out; the caller holds the lock."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+
+    def flush(self):
+        """Write every buffered record to disk."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Flush and close the file."""
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------------- GameObserver ----------------
+    def on_start(self, game: HangmanGame):
+        """Give the game an id and record its answer."""
+        key = id(game)
+        with self._lock:
+            game_id = self._ids[key] = self._next_id
+            self._next_id += 1
+        # Forget abandoned games, before their id() can be reused.
+        weakref.finalize(game, self._forget, key, game_id)
+        record = START.pack(Kind.START, game_id, game.level.value,
+                            game.max_lives)
+        self._append(record + game.answer.encode("UTF-8"))
+
+    def on_guess(self, game: HangmanGame, guess: str, result: GuessResult):
+        """Record a guess, and the outcome if it ended the game."""
+        game_id = self._ids.get(id(game))
+        if game_id is None:
+            return
+        self._append(GUESS.pack(Kind.GUESS, game_id, result.value, game.lives)
+                     + guess[:MAX_GUESS_CHARS].encode("UTF-8", "replace"))
+        if result in (GuessResult.CORRECT, GuessResult.INCORRECT):
+            self._check_end(game, game_id)
+
+    def on_timeout(self, game: HangmanGame):
+        """Record a timeout, and the outcome if it ended the game."""
+        game_id = self._ids.get(id(game))
+        if game_id is None:
+            return
+        self._append(TIMEOUT.pack(Kind.TIMEOUT, game_id, game.lives))
+        self._check_end(game, game_id)
+
+    def _forget(self, key: int, game_id: int):
+        """Drop a collected game's id unless a newer game took it over."""
+        with self._lock:
+            if self._ids.get(key) == game_id:
+                del self._ids[key]
+
+    def _check_end(self, game: HangmanGame, game_id: int):
+        """Record the outcome once the game is won or lost."""
+        won = game.is_won()
+        if won or game.is_lost():
+            self._ids.pop(id(game), None)
+            self._append(END.pack(Kind.END, game_id, won, game.lives)
+                         + game.answer.encode("UTF-8"))
+
+
+def _decode(payload: bytes) -> Event:
+    """Turn one record payload into an Event."""
+    kind, game_id = PREFIX.unpack_from(payload)
+    if kind == Kind.OPEN:
+        return Event(Kind.OPEN, game_id)
+    if kind == Kind.START:
+        _, _, level, lives = START.unpack_from(payload)
+        return Event(Kind.START, game_id, lives, level=Level(level),
+                     text=payload[START.size:].decode("UTF-8"))
+    if kind == Kind.GUESS:
+        _, _, result, lives = GUESS.unpack_from(payload)
+        return Event(Kind.GUESS, game_id, lives, result=GuessResult(result),
+                     text=payload[GUESS.size:].decode("UTF-8"))
+    if kind == Kind.TIMEOUT:
+        _, _, lives = TIMEOUT.unpack_from(payload)
+        return Event(Kind.TIMEOUT, game_id, lives)
+    if kind == Kind.END:
+        _, _, won, lives = END.unpack_from(payload)
+        return Event(Kind.END, game_id, lives, won=bool(won),
+                     text=payload[END.size:].decode("UTF-8"))
+    raise ValueError(f"unknown record kind {kind}")
+
+
+def _payloads(path) -> Iterator[bytes]:
+    """Yield raw record payloads, stopping quietly at a torn last record."""
+    with open(path, "rb", buffering=READ_CHUNK) as log:
+        header = log.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return
+        magic, version = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an event log")
+        while True:
+            prefix = log.read(LENGTH.size)
+            if len(prefix) < LENGTH.size:
+                return
+            (size,) = LENGTH.unpack(prefix)
+            payload = log.read(size)
+            if len(payload) < size:
+                return
+            yield payload
+
+
+def read_events(path) -> Iterator[Event]:
+    """Iterate over every event in a log, lazily."""
+    return map(_decode, _payloads(path))
+
+
+def replay(path) -> Iterator[LoggedGame]:
+    """Yield each finished game; only games in progress are held."""
+    open_games: Dict[int, LoggedGame] = {}
+    for event in read_events(path):
+        if event.kind == Kind.OPEN:
+            open_games.clear()
+            continue
+        if event.kind == Kind.START:
+            open_games[event.game_id] = LoggedGame(
+                event.game_id, event.text, event.level, event.lives,
+                lives=event.lives)
+            continue
+        game = open_games.get(event.game_id)
+        if game is None:
+            continue
+        game.lives = event.lives
+        if event.kind == Kind.GUESS:
+            game.guesses.append((event.text, event.result))
+        elif event.kind == Kind.TIMEOUT:
+            game.timeouts += 1
+        else:
+            del open_games[event.game_id]
+            game.answer = event.text
+            game.won = event.won
+            yield game
+
+
+def win_rates(path) -> Dict[str, Tuple[int, int]]:
+    """Map each answer to (wins, games) without replaying guesses."""
+    totals: Dict[str, List[int]] = {}
+    for payload in _payloads(path):
+        if payload[0] == Kind.END:
+            entry = totals.setdefault(payload[END.size:].decode("UTF-8"), [0, 0])  # noqa: E501 pylint: disable= [C0301]
+            entry[0] += payload[PREFIX.size]
+            entry[1] += 1
+    return {word: (wins, games) for word, (wins, games) in totals.items()}
+
+
+def main():
+    """Summarize an event log from the command line."""
+    parser = argparse.ArgumentParser(description="Hangman event log stats.")
+    parser.add_argument("log", type=Path)
+    parser.add_argument("--top", type=int, default=10,
+                        help="show the hardest words with this many games")
+    parser.add_argument("--min-games", type=int, default=1)
+    args = parser.parse_args()
+    rates = win_rates(args.log)
+    games = sum(total for _, total in rates.values())
+    wins = sum(won for won, _ in rates.values())
+    hardest = sorted((won / total, word) for word, (won, total)
+                     in rates.items() if total >= args.min_games)
+    print(json.dumps({
+        "bytes": os.path.getsize(args.log),
+        "games": games,
+        "win_rate": wins / games if games else 0.0,
+        "words": len(rates),
+        "hardest": [{"word": word, "win_rate": rate}
+                    for rate, word in hardest[:args.top]],
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Adversarial ("evil") Hangman that never commits to an answer early.
+
+The game keeps every word of the right shape as a candidate. On each guess
+the candidates are split by the pattern the letter would reveal, and the
+largest class survives. Each word is pre-encoded as 26 position bitmasks
+(bit p of row c is set when letter c sits at position p), so a guess is
+one row gather over the surviving candidates plus a count of their keys.
+When at least half of them lack the letter, that class is the largest and
+nothing is counted. Otherwise keys are counted densely when the key range
+is small next to the candidates, and by sorting when it is not, so no
+guess allocates a table of 2**length counts.
+
+A game's candidates depend only on the letters guessed so far, so splits
+are memoised per group by that guess path, least recently used first out,
+within MEMO_BUDGET stored candidate indices shared by every group. Games
+replaying a common opening then pay for a split only once. Indexes are
+kept for the MAX_INDEXES most recently used pools; a dropped group's
+splits leave the memo once no game uses the group any more.
+
+Measured on one core with a synthetic bucket of 1M ten-letter words, a
+memoised move takes about 0.01 ms. The first split of each letter over
+the whole group costs 6-13 ms, once per group. Unmemoised later moves
+take about 2 ms for the second move (~250k candidates), about 1 ms for
+the third, and under 0.5 ms after that. So guesses are only
+sub-millisecond once fewer than roughly 200k candidates are left.
+
+numpy is used when installed; otherwise, and for words longer than 64
+letters, a pure Python path does the same.
+"""
+
+import threading
+import weakref
+from collections import Counter, OrderedDict
+from string import ascii_lowercase
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from hangman.game import HangmanGame, GuessResult, LETTER_BITS  # noqa: E501 pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Keys are counted with bincount while the largest key is below this many
+# times the number of candidates (or below DENSE_MIN), else with np.unique.
+DENSE_RATIO = 4
+DENSE_MIN = 1 << 12
+
+# Candidate indices kept in the memo of splits, over all groups.
+MEMO_BUDGET = 4_000_000
+
+# Pools whose EvilIndex stays cached.
+MAX_INDEXES = 8
+
+# Longest word whose position masks fit a numpy integer.
+NUMPY_LENGTH = 64
+
+Path = Tuple[str, ...]
+MemoKey = Tuple[int, Path]
+
+Shape = Tuple[int, Tuple[Tuple[int, str], ...]]
+
+
+def shape_of(word: str) -> Shape:
+    """Length plus the positions of non-letters, e.g. spaces in phrases."""
+    return len(word), tuple((i, ch) for i, ch in enumerate(word)
+                            if not ch.isalpha())
+
+
+class SplitMemo:
+    """Splits of every group by guess path, least recently used out first."""
+    def __init__(self):
+        self._splits: "OrderedDict[MemoKey, tuple]" = OrderedDict()
+        self.size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._splits)
+
+    def get(self, key: MemoKey) -> Optional[tuple]:
+        """The memoised split, marked as just used, or None."""
+        with self._lock:
+            split = self._splits.get(key)
+            if split is not None:
+                self._splits.move_to_end(key)
+            return split
+
+    def put(self, key: MemoKey, split: tuple):
+        """Memoise a split, dropping the least recently used over budget."""
+        size = len(split[1])
+        if size > MEMO_BUDGET:
+            return
+        with self._lock:
+            old = self._splits.pop(key, None)
+            self.size += size - (len(old[1]) if old is not None else 0)
+            self._splits[key] = split
+            while self.size > MEMO_BUDGET:
+                _, (_, dropped) = self._splits.popitem(last=False)
+                self.size -= len(dropped)
+
+    def forget(self, owner: int):
+        """Drop every split of one group."""
+        with self._lock:
+            for key in [key for key in self._splits if key[0] == owner]:
+                self.size -= len(self._splits.pop(key)[1])
+
+
+_SPLITS = SplitMemo()
+
+
+class CandidateGroup:
+    """All pool words sharing one shape, with their position masks."""
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.length = len(words[0])
+        self.numpy = np is not None and self.length <= NUMPY_LENGTH
+        weakref.finalize(self, _SPLITS.forget, id(self)).atexit = False
+        if self.numpy:
+            self.masks = self._encode_numpy(words)
+        else:
+            self.masks = [[sum(1 << i for i, ch in enumerate(word) if ch == letter)  # noqa: E501 pylint: disable= [C0301]
+                           for word in words] for letter in ascii_lowercase]
+
+    def _encode_numpy(self, words: List[str]):
+        """Build the (26, n) mask matrix without a per-word loop."""
+        dtype = np.uint32 if self.length <= 32 else np.uint64
+        raw = np.frombuffer("".join(words).encode("ascii"),
+                            dtype=np.uint8).reshape(len(words), self.length)
+        weights = np.left_shift(dtype(1), np.arange(self.length, dtype=dtype))
+        masks = np.zeros((26, len(words)), dtype=dtype)
+        for row in range(26):
+            masks[row] = ((raw == 97 + row) * weights).sum(axis=1, dtype=dtype)  # noqa: E501 pylint: disable= [C0301]
+        return masks
+
+    def all(self):
+        """Indices of every word in the group."""
+        if self.numpy:
+            return np.arange(len(self.words), dtype=np.int32)
+        return list(range(len(self.words)))
+
+    def partition(self, candidates, letter: str, path: Optional[Path] = None):  # noqa: E501 pylint: disable= [C0301]
+        """Return (reveal mask, surviving candidates) for the largest class.
+
+        path lists the letters already guessed, in order, since candidates
+        were all(); with it the split is memoised. Without it only splits
+        of the full group are.
+        """
+        everyone = len(candidates) == len(self.words)
+        if path is None:
+            if not everyone:
+                return self._split(candidates, letter, False)
+            path = ()
+        key = (id(self), path + (letter,))
+        split = _SPLITS.get(key)
+        if split is None:
+            split = self._split(candidates, letter, everyone)
+            _SPLITS.put(key, split)
+        return split
+
+    def _split(self, candidates, letter: str, everyone: bool):
+        """Partition candidates by the positions letter would reveal."""
+        masks = self.masks[LETTER_BITS[letter].bit_length() - 1]
+        if not self.numpy:
+            keys = [masks[i] for i in candidates]
+            counts = Counter(keys)
+            best = max(counts, key=lambda key: (counts[key], key == 0, -key))
+            return best, [i for i, key in zip(candidates, keys) if key == best]
+        keys = masks if everyone else masks.take(candidates)
+        size = len(keys)
+        # Ties go to the smallest key, so an absent letter wins a tie.
+        if 2 * (size - np.count_nonzero(keys)) >= size:
+            best = 0
+        elif int(keys.max()) < max(DENSE_RATIO * size, DENSE_MIN):
+            best = int(np.argmax(np.bincount(keys)))
+        else:
+            uniq, counts = np.unique(keys, return_counts=True)
+            best = int(uniq[np.argmax(counts)])
+        if everyone:
+            return best, np.flatnonzero(keys == best).astype(np.int32)
+        # np.compress is several times faster than boolean indexing here.
+        return best, np.compress(keys == best, candidates)
+
+
+class EvilIndex:
+    """Candidate groups for one word pool, keyed by shape."""
+    def __init__(self, words: Sequence):
+        groups: Dict[Shape, List[str]] = {}
+        for word in words:
+            if isinstance(word, bytes):
+                word = word.decode("UTF-8")
+            word = word.lower()
+            if word and word.isascii():
+                groups.setdefault(shape_of(word), []).append(word)
+        self.groups = {shape: CandidateGroup(sorted(set(group)))
+                       for shape, group in groups.items()}
+
+
+_INDEXES: "OrderedDict[int, Tuple[Sequence, EvilIndex]]" = OrderedDict()
+
+
+def index_for(pool: Sequence) -> EvilIndex:
+    """Return the cached EvilIndex for a pool, building it once."""
+    cached = _INDEXES.get(id(pool))
+    if cached is None or cached[0] is not pool:
+        cached = _INDEXES[id(pool)] = (pool, EvilIndex(pool))
+        while len(_INDEXES) > MAX_INDEXES:
+            _INDEXES.popitem(last=False)
+    _INDEXES.move_to_end(id(pool))
+    return cached[1]
+
+
+class EvilHangmanGame(HangmanGame):
+    """HangmanGame that dodges guesses by keeping the largest word class.
+
+    The selector's pick only fixes the shape of the answer. answer always
+    holds a representative of the surviving class, so masked(), is_won()
+    and is_lost() work exactly as in HangmanGame.
+    """
+
+    def __post_init__(self):
+        """Pick a shape and start with every pool word of that shape."""
+        super().__post_init__()
+        group = None
+        try:
+            group = index_for(self.selector.pool(self.level)).groups.get(shape_of(self.answer))  # noqa: E501 pylint: disable= [C0301]
+        except ValueError:
+            pass
+        if group is None:
+            group = CandidateGroup([self.answer]) if self.answer.isascii() else None  # noqa: E501 pylint: disable= [C0301]
+        self.group = group
+        self.candidates = group.all() if group else None
+        self._path: Path = ()
+        self._settle()
+
+    @classmethod
+    def from_state(cls, answer: str, level: Level, guessed: Iterable[str],  # noqa: E501 pylint: disable= [C0301]
+                   lives: int, max_lives: int = 6,
+                   selector: Optional[WordSelector] = None) -> "EvilHangmanGame":  # noqa: E501 pylint: disable= [C0301]
+        """Rebuild a game whose answer is now fixed to the saved one."""
+        game = super().from_state(answer, level, guessed, lives, max_lives,
+                                  selector)
+        game.group = CandidateGroup([game.answer]) if game.answer.isascii() else None  # noqa: E501 pylint: disable= [C0301]
+        game.candidates = game.group.all() if game.group else None
+        game._path = ()  # pylint: disable=protected-access
+        return game
+
+    def _settle(self):
+        """Make answer the first surviving candidate and re-index it."""
+        if self.group is not None:
+            self.answer = self.group.words[int(self.candidates[0])]
+            self._index_answer()
+
+    @property
+    def remaining(self) -> int:
+        """Number of words still consistent with the game so far."""
+        return len(self.candidates) if self.group is not None else 1
+
+    def _guess(self, guess: str) -> GuessResult:
+        """Apply a letter guess, revealing as little as possible."""
+        guess = guess.lower()
+        if guess not in LETTER_BITS or self.group is None:
+            return super()._guess(guess)
+        if guess in self.guessed:
+            return GuessResult.REPEATED
+        self.guessed.add(guess)
+        reveal, self.candidates = self.group.partition(self.candidates, guess,
+                                                       self._path)
+        self._path += (guess,)
+        self._settle()
+        if reveal:
+            return GuessResult.CORRECT
+        self.lives -= 1
+        return GuessResult.INCORRECT
+
@@ -1,12 +1,34 @@
 """Core logic for the Hangman game."""
 
+from collections.abc import MutableSet
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Set, List
-from hangman.selector import WordSelector, Level  # noqa: E501 pylint: disable= [E0401]
+from functools import lru_cache
+from string import ascii_lowercase
+from typing import Dict, Iterable, Optional, Set, List, Tuple
+from hangman.selector import WordSelector, FixedWordSelector, Level  # noqa: E501 pylint: disable= [E0401]
 
 MASK_CHAR = "_"
 
+# Seconds a player has for each guess before losing a life.
+GUESS_SECONDS = 15
+
+# Bit assigned to each ASCII letter by the bitmask engine.
+LETTER_BITS: Dict[str, int] = {ch: 1 << i for i, ch in enumerate(ascii_lowercase)}  # noqa: E501 pylint: disable= [C0301]
+
+
+@lru_cache(maxsize=4096)
+def _answer_index(answer: str) -> Tuple[Dict[str, List[int]], str]:
+    """Letter positions and the fully masked board, shared per answer.
+
+    Games only read the result, so games with the same answer share it.
+    """
+    positions: Dict[str, List[int]] = {}
+    for i, ch in enumerate(answer):
+        if ch.isalpha():
+            positions.setdefault(ch, []).append(i)
+    return positions, "".join(MASK_CHAR if ch.isalpha() else ch for ch in answer)  # noqa: E501 pylint: disable= [C0301]
+
 
 class GuessResult(Enum):
     """Result of a guess attempt."""
@@ -16,6 +38,39 @@ class GuessResult(Enum):
     INVALID = auto()
 
 
+class GameObserver:
+    """Receives a game's events; subclass and override what you need."""
+    def on_start(self, game: "HangmanGame"):
+        """Called once the answer has been picked."""
+
+    def on_guess(self, game: "HangmanGame", guess: str, result: GuessResult):  # noqa: E501 pylint: disable= [C0301]
+        """Called after every guess with its result."""
+
+    def on_timeout(self, game: "HangmanGame"):
+        """Called after a timeout has cost a life."""
+
+
+class Observers(GameObserver):
+    """Pass every event on to several observers, in order."""
+    def __init__(self, *observers: GameObserver):
+        self.observers = list(observers)
+
+    def on_start(self, game: "HangmanGame"):
+        """Forward the start."""
+        for observer in self.observers:
+            observer.on_start(game)
+
+    def on_guess(self, game: "HangmanGame", guess: str, result: GuessResult):  # noqa: E501 pylint: disable= [C0301]
+        """Forward the guess."""
+        for observer in self.observers:
+            observer.on_guess(game, guess, result)
+
+    def on_timeout(self, game: "HangmanGame"):
+        """Forward the timeout."""
+        for observer in self.observers:
+            observer.on_timeout(game)
+
+
 @dataclass
 class HangmanGame:
     """State and logic for a Hangman game session."""
@@ -25,21 +80,70 @@ class HangmanGame:
     answer: str = field(init=False)
     lives: int = max_lives
     guessed: Set[str] = field(default_factory=set, init=False)
+    observer: Optional[GameObserver] = field(default=None, repr=False,
+                                             compare=False)
 
     def __post_init__(self):
         """Initialize the game with a riddle and maximum lives."""
         self.answer = self.selector.pick_a_word(self.level).lower()
         self.lives = self.max_lives
+        self._index_answer()
+        if self.observer is not None:
+            self.observer.on_start(self)
+
+    @classmethod
+    def from_state(cls, answer: str, level: Level, guessed: Iterable[str],  # noqa: E501 pylint: disable= [C0301]
+                   lives: int, max_lives: int = 6,
+                   selector: Optional[WordSelector] = None) -> "HangmanGame":  # noqa: E501 pylint: disable= [C0301]
+        """Rebuild a game from saved state without picking a new word.
+
+        __init__ and __post_init__ are skipped: the fields are assigned
+        directly and only the answer is indexed, so restoring is cheap.
+        """
+        game = cls.__new__(cls)
+        game.selector = selector if selector is not None else FixedWordSelector(word=answer)  # noqa: E501 pylint: disable= [C0301]
+        game.level = level
+        game.max_lives = max_lives
+        game.observer = None
+        game.answer = answer.lower()
+        game.guessed = set(guessed)
+        game.lives = lives
+        game._index_answer()  # pylint: disable=protected-access
+        return game
+
+    def _index_answer(self):
+        """Map each letter to its positions and start a fully masked buffer."""
+        self._positions, self._blank = _answer_index(self.answer)
+        self._reset_mask()
+
+    def _reset_mask(self):
+        """Hide every letter again and forget which guesses were applied."""
+        self._buffer = list(self._blank)
+        self._masked = self._blank
+        self._applied: Set[str] = set()
+
+    def _reveal(self, letter: str):
+        """Uncover only the positions holding letter."""
+        positions = self._positions.get(letter)
+        if positions:
+            for i in positions:
+                self._buffer[i] = letter
+            self._masked = "".join(self._buffer)
 
     def masked(self) -> str:
         """Reveal found letters; keep spaces and non-letters as-is."""
-        masked_chars: List[str] = []
-        for ch in self.answer:
-            if ch.isalpha():
-                masked_chars.append(ch if ch in self.guessed else MASK_CHAR)
-            else:
-                masked_chars.append(ch)
-        return "".join(masked_chars)
+        if self._applied != self.guessed:
+            self._sync_mask()
+        return self._masked
+
+    def _sync_mask(self):
+        """Catch up with guesses made by editing guessed directly."""
+        guessed = set(self.guessed)
+        if not self._applied <= guessed:
+            self._reset_mask()
+        for letter in guessed - self._applied:
+            self._reveal(letter)
+        self._applied = guessed
 
     def valid_guess(self, guess: str) -> bool:
         """Check if the guess is a single alphabetic character."""
@@ -47,12 +151,22 @@ class HangmanGame:
 
     def guess_letter(self, guess: str) -> GuessResult:
         """Process a letter guess and return guess result."""
-        if not self.valid_guess(guess.lower()):
+        result = self._guess(guess)
+        if self.observer is not None:
+            self.observer.on_guess(self, guess, result)
+        return result
+
+    def _guess(self, guess: str) -> GuessResult:
+        """Apply a guess; subclasses override this rather than guess_letter."""
+        guess = guess.lower()
+        if not self.valid_guess(guess):
             return GuessResult.INVALID
-        if guess.lower() in self.guessed:
+        if guess in self.guessed:
             return GuessResult.REPEATED
-        self.guessed.add(guess.lower())
-        if guess.lower() in self.answer:
+        self.guessed.add(guess)
+        self._applied.add(guess)
+        if guess in self._positions:
+            self._reveal(guess)
             return GuessResult.CORRECT
         self.lives -= 1
         return GuessResult.INCORRECT
@@ -71,3 +185,170 @@ class HangmanGame:
     def time_out(self):
         """Call this when the player times out on a guess."""
         self.lives -= 1
+        if self.observer is not None:
+            self.observer.on_timeout(self)
+
+
+def letter_mask(text: Iterable[str]) -> int:
+    """Return the 26-bit set of ASCII letters appearing in text."""
+    mask = 0
+    for ch in text:
+        mask |= LETTER_BITS.get(ch, 0)
+    return mask
+
+
+def mask_letters(mask: int) -> List[str]:
+    """Return the ASCII letters in a letter_mask(), visiting set bits only."""
+    letters = []
+    while mask:
+        low = mask & -mask
+        letters.append(ascii_lowercase[low.bit_length() - 1])
+        mask ^= low
+    return letters
+
+
+class GuessedLetters(MutableSet):  # pylint: disable=too-many-ancestors
+    """Live set view of a BitmaskGame's guesses that writes to its masks."""
+    __slots__ = ("_game",)
+
+    def __init__(self, game: "BitmaskGame"):
+        self._game = game
+
+    @classmethod
+    def _from_iterable(cls, it):
+        """Set operators such as | and & return plain sets."""
+        return set(it)
+
+    def __contains__(self, ch) -> bool:
+        bit = LETTER_BITS.get(ch)
+        if bit is None:
+            return ch in self._game._guessed_extra  # pylint: disable=protected-access
+        return bool(self._game._guessed_mask & bit)  # pylint: disable=protected-access
+
+    def __iter__(self):
+        game = self._game
+        yield from mask_letters(game._guessed_mask)  # pylint: disable=protected-access
+        yield from list(game._guessed_extra)  # pylint: disable=protected-access
+
+    def __len__(self) -> int:
+        game = self._game
+        return bin(game._guessed_mask).count("1") + len(game._guessed_extra)  # noqa: E501 pylint: disable=protected-access
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    def add(self, value: str):
+        """Mark a letter guessed; masked() reveals it on its next call."""
+        # pylint: disable=protected-access
+        game = self._game
+        bit = LETTER_BITS.get(value)
+        if bit is not None:
+            game._guessed_mask |= bit
+        elif value not in game._guessed_extra:
+            game._guessed_extra.add(value)
+            game._applied_mask = -1
+
+    def discard(self, value: str):
+        """Forget a guess; masked() hides the letter again."""
+        # pylint: disable=protected-access
+        game = self._game
+        bit = LETTER_BITS.get(value)
+        if bit is not None:
+            game._guessed_mask &= ~bit
+        elif value in game._guessed_extra:
+            game._guessed_extra.discard(value)
+            game._applied_mask = -1
+
+
+class BitmaskGame(HangmanGame):
+    """HangmanGame whose letter bookkeeping is done with 26-bit integers.
+
+    The answer's letters and the guesses are each kept as a bitmask, so
+    win, loss, repeat and correct checks are single integer operations.
+    Letters outside a-z (which isalpha() also accepts) fall back to sets.
+    """
+
+    def _index_answer(self):
+        """Index the answer and precompute its letter mask."""
+        super()._index_answer()
+        self._answer_mask = letter_mask(self._positions)
+        self._answer_extra = {ch for ch in self._positions
+                              if ch not in LETTER_BITS}
+
+    @property
+    def guessed(self) -> GuessedLetters:
+        """Letters guessed so far, as a live view of the masks."""
+        return GuessedLetters(self)
+
+    @guessed.setter
+    def guessed(self, letters: Iterable[str]):
+        self._guessed_extra = set()
+        self._guessed_mask = 0
+        for ch in letters:
+            bit = LETTER_BITS.get(ch)
+            if bit is None:
+                self._guessed_extra.add(ch)
+            else:
+                self._guessed_mask |= bit
+        self._applied_mask = -1
+
+    def _reset_mask(self):
+        """Hide every ASCII letter again; other guesses are kept revealed."""
+        super()._reset_mask()
+        self._applied_mask = 0
+        for ch in self._guessed_extra:
+            self._reveal(ch)
+
+    def masked(self) -> str:
+        """Reveal found letters; keep spaces and non-letters as-is."""
+        if self._applied_mask != self._guessed_mask:
+            self._sync_bits()
+        return self._masked
+
+    def _sync_bits(self):
+        """Reveal the letters guessed since masked() last ran."""
+        if self._applied_mask & ~self._guessed_mask:
+            self._reset_mask()
+        pending = self._guessed_mask & ~self._applied_mask
+        while pending:
+            low = pending & -pending
+            self._reveal(ascii_lowercase[low.bit_length() - 1])
+            pending ^= low
+        self._applied_mask = self._guessed_mask
+
+    def _guess(self, guess: str) -> GuessResult:
+        """Apply a guess with bit operations where possible."""
+        guess = guess.lower()
+        bit = LETTER_BITS.get(guess)
+        if bit is None:
+            return self._guess_other(guess)
+        if self._guessed_mask & bit:
+            return GuessResult.REPEATED
+        self._guessed_mask |= bit
+        if self._answer_mask & bit:
+            return GuessResult.CORRECT
+        self.lives -= 1
+        return GuessResult.INCORRECT
+
+    def _guess_other(self, guess: str) -> GuessResult:
+        """Handle guesses that are not a single ASCII letter."""
+        if not self.valid_guess(guess):
+            return GuessResult.INVALID
+        if guess in self._guessed_extra:
+            return GuessResult.REPEATED
+        self._guessed_extra.add(guess)
+        if guess in self._positions:
+            self._reveal(guess)
+            return GuessResult.CORRECT
+        self.lives -= 1
+        return GuessResult.INCORRECT
+
+    def is_won(self) -> bool:
+        """Check if the game is won."""
+        if self._answer_mask & ~self._guessed_mask:
+            return False
+        return self._answer_extra <= self._guessed_extra
+
+    def is_lost(self) -> bool:
+        """Check if the game is lost."""
+        return self.lives <= 0 and not self.is_won()
@@ -1,9 +1,15 @@
 """A simple GUI for the Hangman game using Tkinter."""
 
+import math
+import os
+import time
 import tkinter as tk
 from tkinter import messagebox
-from hangman.game import HangmanGame, GuessResult   # pylint: disable= [E0401]
+from hangman.game import HangmanGame, GuessResult, GUESS_SECONDS   # noqa: E501 pylint: disable= [E0401]
 from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+from hangman import metrics  # pylint: disable= [E0401]
+from hangman.prefetch import GamePool  # pylint: disable= [E0401]
+from hangman.timers import WheelDriver  # pylint: disable= [E0401]
 
 
 # pylint: disable=too-many-instance-attributes
@@ -17,8 +23,9 @@ class HangmanGUI:
         # Level selection area
         self.level_var = tk.StringVar(value="Basic")
         tk.Label(root, text="Select Level:").pack(pady=5)
-        tk.Radiobutton(root, text="Basic", variable=self.level_var, value="Basic").pack()    # noqa: E501 pylint: disable= [C0301]
-        tk.Radiobutton(root, text="Intermediate", variable=self.level_var, value="Intermediate").pack()  # noqa: E501 pylint: disable= [C0301]
+        tk.Radiobutton(root, text="Basic", variable=self.level_var, value="Basic", command=self.prefetch).pack()    # noqa: E501 pylint: disable= [C0301]
+        tk.Radiobutton(root, text="Intermediate", variable=self.level_var, value="Intermediate", command=self.prefetch).pack()  # noqa: E501 pylint: disable= [C0301]
+        tk.Radiobutton(root, text="Evil", variable=self.level_var, value="Evil", command=self.prefetch).pack()  # noqa: E501 pylint: disable= [C0301]
 
         self.start_btn = tk.Button(root, text="Start Game", command=self.start_game)  # noqa: E501
         self.start_btn.pack(pady=10)
@@ -43,11 +50,32 @@ class HangmanGUI:
         self.guessed_label = tk.Label(root, text="", font=("Arial", 12))
         self.guessed_label.pack(pady=10)
 
+        # One timing wheel, woken by a single root.after, runs the countdown.
+        self.timers = WheelDriver.for_tk(root)
         self.timer_job = None
+        self.deadline = 0.0
         self.remaining_time = 0
         self.game = None
+        # One selector for the session so words do not repeat between games.
+        self.selector = WordSelector()
+        # Games for the selected level are built ahead on a worker thread.
+        self.games = GamePool(self.selector)
+        # However the window goes away, the worker thread goes with it.
+        root.protocol("WM_DELETE_WINDOW", self.close)
+        root.bind("<Destroy>", self.on_destroy, add="+")
+        self.prefetch()
         self.reset_game()
 
+    def close(self):
+        """Close the window from its close button."""
+        self.cancel_timer()
+        self.root.destroy()
+
+    def on_destroy(self, event):
+        """Stop the prefetch thread once the main window is destroyed."""
+        if event.widget is self.root:
+            self.games.close()
+
     def update_display(self):
         """Update the GUI display based on current game state."""
         self.word_label.config(text=self.game.masked())
@@ -55,17 +83,29 @@ class HangmanGUI:
         guessed = ", ".join(sorted(self.game.guessed)) if self.game.guessed else "_"  # noqa: E501
         self.guessed_label.config(text=f"Guessed: {guessed}")
 
+    def selected_kind(self):
+        """The level and game class for the selected radio button."""
+        if self.level_var.get() == "Basic":
+            return Level.BASIC, HangmanGame
+        if self.level_var.get() == "Evil":
+            # Imported here: hangman.evil loads numpy, slowing startup.
+            from hangman.evil import EvilHangmanGame  # noqa: E501 pylint: disable=import-outside-toplevel
+            return Level.BASIC, EvilHangmanGame
+        return Level.INTERMEDIATE, HangmanGame
+
+    def prefetch(self):
+        """Have games of the selected level built in the background."""
+        self.games.warm(*self.selected_kind())
+
     def start_game(self):
         """Initialize and start a new game."""
-        if self.level_var.get() == "Basic":
-            level = Level.BASIC
-        else:
-            level = Level.INTERMEDIATE
-        selector = WordSelector()
-        self.game = HangmanGame(selector, level, max_lives=6)
+        started = time.perf_counter()
+        self.game = self.games.take(*self.selected_kind())
+        metrics.count("gui.start")
         self.update_display()
         self.start_timer()
         self.start_btn.config(state=tk.DISABLED)
+        metrics.observe("gui.start_seconds", time.perf_counter() - started)
 
     def reset_game(self):
         """Reset game-related variables."""
@@ -77,23 +117,36 @@ class HangmanGUI:
     # ---------------- Timer handling ----------------
     def start_timer(self):
         """Start or restart the countdown timer and update the display"""
-        self.remaining_time = 15
+        self.deadline = self.timers.now() + GUESS_SECONDS
         self.update_timer()
 
     def update_timer(self):
-        """Update the timer display every second."""
-        self.timer_label.config(text=f"Time left: {self.remaining_time}s")
-        if self.remaining_time <= 0:
+        """Show the seconds left and wake again on the next whole second."""
+        self.cancel_timer()
+        left = max(0, math.ceil(self.deadline - self.timers.now()))
+        self.timer_label.config(text=f"Time left: {left}s")
+        if left <= 0:
             self.time_expired()
             return
-        self.remaining_time -= 1
-        self.timer_job = self.root.after(1000, self.update_timer)
+        # Whole seconds left at the next wakeup; always derived from deadline.
+        self.remaining_time = left - 1
+        # The last wakeup lands on the deadline itself, however late the
+        # earlier ones ran.
+        self.timer_job = self.timers.call_at(self.deadline - self.remaining_time,  # noqa: E501 pylint: disable= [C0301]
+                                             self.update_timer)
+
+    def cancel_timer(self):
+        """Stop the countdown if it is running."""
+        if self.timer_job:
+            self.timer_job.cancel()
+            self.timer_job = None
 
     def time_expired(self):
         """When time is up, lose one life and continue."""
         if not self.game:
             return
         self.game.time_out()
+        metrics.count("gui.time_expired")
         messagebox.showwarning("Time's up!", "Lost 1 life.")
         self.update_display()
         self.check_endgame()
@@ -102,8 +155,7 @@ class HangmanGUI:
 
     def reset_timer(self):
         """Reset the timer for the next guess."""
-        if self.timer_job:
-            self.root.after_cancel(self.timer_job)
+        self.cancel_timer()
         self.start_timer()
 
     # ---------------- Guess handling ----------------
@@ -115,6 +167,7 @@ class HangmanGUI:
             return
 
         result = self.game.guess_letter(guess[0])
+        metrics.count(f"gui.guess.{result.name}")
         if result == GuessResult.INVALID:
             messagebox.showinfo("Invalid", "Enter a single alphabetic letter.")
         elif result == GuessResult.REPEATED:
@@ -129,22 +182,26 @@ class HangmanGUI:
     def check_endgame(self):
         """Check if the game needs to be ended."""
         if self.game.is_won():
-            if self.timer_job:  # Cancel the timer if it's running
-                self.root.after_cancel(self.timer_job)
+            self.cancel_timer()
+            metrics.count("gui.won")
             messagebox.showinfo("Victory!", f"You found it! The answer was: {self.game.answer}")  # noqa: E501 pylint: disable= [C0301]
             self.reset_game()
         elif self.game.is_lost():
-            if self.timer_job:  # Cancel the timer if it's running
-                self.root.after_cancel(self.timer_job)
+            self.cancel_timer()
+            metrics.count("gui.lost")
             messagebox.showerror("Game Over", f"Out of lives! The answer was: {self.game.answer}")  # noqa: E501 pylint: disable= [C0301]
             self.reset_game()
 
 
 def main():
     """Run the Hangman GUI application."""
+    if os.environ.get("HANGMAN_METRICS"):
+        metrics.instrument()
     root = tk.Tk()
     HangmanGUI(root)
     root.mainloop()
+    if metrics.enabled():
+        print(metrics.render_text(), end="")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,470 @@
+"""Load generator: many simulated players against a game host.
+
+Players are asyncio tasks. Each one plays games back to back, guessing in
+English frequency order (``script``) or a fresh random order
+(``random``), waiting a random think time between moves and now and then
+stalling on purpose until the guess times out. They can play against:
+
+    direct     HangmanGame objects in this process
+    inprocess  a GameServer in this process, called without sockets
+    loopback   a GameServer over TCP, started here unless --connect
+               points at one already running
+
+Every operation's latency goes into a histogram with 5% wide buckets, so
+p50/p95/p99 cost the same memory however long the run. The process RSS
+(and the traced Python heap with --trace-malloc) is sampled while the
+players run. The JSON report can be compared with an earlier one.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import secrets
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from string import ascii_lowercase
+from typing import Dict, List, Optional
+from hangman.game import HangmanGame  # pylint: disable= [E0401]
+from hangman.metrics import Histogram  # pylint: disable= [E0401]
+from hangman.scheduler import splitmix64  # pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+from hangman.server import GameClient, GameServer  # pylint: disable= [E0401]
+from hangman.solver import FREQUENCY_ORDER  # pylint: disable= [E0401]
+from hangman.source import OFFLINE_ENV  # pylint: disable= [E0401]
+
+# Latency buckets: 1 us growing 5% a step, to about 100 s.
+LATENCY_BOUNDS: List[float] = [1e-6 * 1.05 ** i for i in range(380)]
+
+# Extra wait past a host's timeout before checking that it fired.
+TIMEOUT_MARGIN = 0.05
+
+PLAYING = "playing"
+WON = "won"
+
+
+@dataclass
+class LoadConfig:
+    """What to run; every field is also a command line option."""
+    # pylint: disable=too-many-instance-attributes
+    players: int = 100
+    duration: float = 10.0
+    games: int = 0
+    target: str = "direct"
+    level: str = "basic"
+    strategy: str = "random"
+    think: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 0.5
+    max_lives: int = 6
+    seed: Optional[int] = None
+    sample: float = 1.0
+    connect: Optional[str] = None
+    trace_malloc: bool = False
+
+
+# ---------------- Hosts ----------------
+class DirectLink:
+    """One player's games as HangmanGame objects."""
+    expire_wait = 0.0
+
+    def __init__(self, selector: WordSelector, max_lives: int):
+        self.selector = selector
+        self.max_lives = max_lives
+        self.game: Optional[HangmanGame] = None
+
+    @staticmethod
+    def _status(game: HangmanGame) -> str:
+        """The game's status as the server reports it."""
+        if game.is_won():
+            return WON
+        return "lost" if game.is_lost() else PLAYING
+
+    async def start(self, level: Level) -> str:
+        """Begin a game."""
+        self.game = HangmanGame(self.selector, level, max_lives=self.max_lives)
+        return self._status(self.game)
+
+    async def guess(self, letter: str) -> str:
+        """Guess a letter."""
+        self.game.guess_letter(letter)
+        return self._status(self.game)
+
+    async def expire(self) -> str:
+        """Let the guess time out."""
+        self.game.time_out()
+        return self._status(self.game)
+
+    async def close(self):
+        """Nothing to release."""
+
+
+class ServerLink:
+    """One player's games on an in-process GameServer."""
+    def __init__(self, server: GameServer):
+        self.server = server
+        self.expire_wait = server.timeout + TIMEOUT_MARGIN
+        self.session = None
+
+    async def request(self, **request) -> dict:
+        """Send one request."""
+        return self.server.handle(request)
+
+    def _status(self, reply: dict) -> str:
+        """Check the reply and return the game status."""
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error", "request failed"))
+        return reply["status"]
+
+    async def start(self, level: Level) -> str:
+        """Begin a game."""
+        reply = await self.request(op="start", level=level.name.lower())
+        self.session = reply.get("session")
+        return self._status(reply)
+
+    async def guess(self, letter: str) -> str:
+        """Guess a letter."""
+        return self._status(await self.request(op="guess", session=self.session,  # noqa: E501 pylint: disable= [C0301]
+                                               letter=letter))
+
+    async def expire(self) -> str:
+        """Check the state after the host's timeout should have fired."""
+        return self._status(await self.request(op="state", session=self.session))  # noqa: E501 pylint: disable= [C0301]
+
+    async def close(self):
+        """Nothing to release."""
+
+
+class ClientLink(ServerLink):
+    """One player's games over its own TCP connection.
+
+    The server may be remote with its own timeout, so the wait before
+    checking a timeout comes from the time_left of its last reply.
+    """
+    def __init__(self, client: GameClient, timeout: float):
+        # pylint: disable=super-init-not-called
+        self.client = client
+        self.expire_wait = timeout + TIMEOUT_MARGIN
+        self.session = None
+
+    async def request(self, **request) -> dict:
+        """Send one request over the connection."""
+        return await self.client.request(**request)
+
+    def _status(self, reply: dict) -> str:
+        """Check the reply and note how long until its guess times out."""
+        status = super()._status(reply)
+        if "time_left" in reply:
+            self.expire_wait = reply["time_left"] + TIMEOUT_MARGIN
+        return status
+
+    async def close(self):
+        """Close the connection."""
+        await self.client.close()
+
+
+class Host:
+    """Creates each player's link to the configured target."""
+    def __init__(self, config: LoadConfig, seed: int):
+        self.config = config
+        self.selector = WordSelector(seed=seed)
+        self.server: Optional[GameServer] = None
+        self._tcp = None
+        self.address = ("", 0)
+
+    async def open(self):
+        """Start the in-process or loopback server if there is one."""
+        config = self.config
+        if config.target == "direct":
+            return
+        if config.target == "loopback" and config.connect:
+            host, _, port = config.connect.rpartition(":")
+            self.address = (host or "127.0.0.1", int(port))
+            return
+        self.server = GameServer(self.selector, timeout=config.timeout,
+                                 max_lives=config.max_lives)
+        if config.target == "inprocess":
+            self.server.start_timers()
+        else:
+            self._tcp = await self.server.serve("127.0.0.1", 0)
+            self.address = self._tcp.sockets[0].getsockname()[:2]
+
+    async def link(self):
+        """A new player's connection to the host."""
+        if self.config.target == "direct":
+            return DirectLink(self.selector, self.config.max_lives)
+        if self.config.target == "inprocess":
+            return ServerLink(self.server)
+        return ClientLink(await GameClient.connect(*self.address),
+                          self.config.timeout)
+
+    async def close(self):
+        """Stop the loopback server."""
+        if self._tcp is not None:
+            self._tcp.close()
+            await self._tcp.wait_closed()
+
+    def live_sessions(self) -> int:
+        """Games the in-process server is holding."""
+        return len(self.server.sessions) if self.server else 0
+
+
+# ---------------- Measurement ----------------
+def rss_bytes() -> int:
+    """Resident memory of this process (peak where current is unknown)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class LoadStats:
+    """Running totals and latency histograms for a run."""
+    games: int = 0
+    wins: int = 0
+    started: int = 0
+    errors: int = 0
+    latency: Dict[str, Histogram] = field(default_factory=dict)
+    samples: List[dict] = field(default_factory=list)
+
+    def observe(self, op: str, seconds: float):
+        """Record one operation's latency."""
+        hist = self.latency.get(op)
+        if hist is None:
+            hist = self.latency[op] = Histogram(LATENCY_BOUNDS)
+        hist.observe(seconds)
+
+    def ops(self) -> int:
+        """Operations recorded so far."""
+        return sum(hist.count for hist in self.latency.values())
+
+
+async def timed(stats: LoadStats, op: str, call) -> str:
+    """Await call and record how long it took."""
+    start = time.perf_counter()
+    result = await call
+    stats.observe(op, time.perf_counter() - start)
+    return result
+
+
+async def play(index: int, host: Host, config: LoadConfig, seed: int,
+               stats: LoadStats, end: float):
+    """One simulated player: games back to back until the run ends.
+
+    A game the host refuses part way (say its timer ended the game just
+    before a guess) counts as an error and the player starts another; a
+    lost connection ends the player.
+    """
+    # pylint: disable=too-many-arguments
+    rng = random.Random(splitmix64(seed ^ index))
+    level = Level[config.level.upper()]
+    loop = asyncio.get_running_loop()
+    link = await host.link()
+    try:
+        while loop.time() < end and not (config.games and stats.started >= config.games):  # noqa: E501 pylint: disable= [C0301]
+            stats.started += 1
+            try:
+                status = await play_game(link, level, config, rng, stats, end)
+            except (RuntimeError, ValueError):
+                stats.errors += 1
+                continue
+            if status != PLAYING:
+                stats.games += 1
+                stats.wins += status == WON
+    except ConnectionError:
+        stats.errors += 1
+    finally:
+        await link.close()
+
+
+async def play_game(link, level: Level, config: LoadConfig,
+                    rng: random.Random, stats: LoadStats, end: float) -> str:
+    """Play one game until it ends or the run does; return its status."""
+    # pylint: disable=too-many-arguments
+    loop = asyncio.get_running_loop()
+    status = await timed(stats, "start", link.start(level))
+    letters = (FREQUENCY_ORDER if config.strategy == "script"
+               else rng.sample(ascii_lowercase, 26))
+    moves = iter(letters)
+    while status == PLAYING and loop.time() < end:
+        if config.think:
+            await asyncio.sleep(rng.expovariate(1 / config.think))
+        else:
+            await asyncio.sleep(0)
+        if rng.random() < config.timeout_rate:
+            await asyncio.sleep(link.expire_wait)
+            status = await timed(stats, "timeout", link.expire())
+            continue
+        letter = next(moves, None)
+        if letter is None:
+            break
+        status = await timed(stats, "guess", link.guess(letter))
+    return status
+
+
+async def sample_memory(host: Host, stats: LoadStats, interval: float,
+                        started: float):
+    """Record memory and progress every interval until cancelled."""
+    while True:
+        entry = {
+            "seconds": round(time.perf_counter() - started, 3),
+            "rss_bytes": rss_bytes(),
+            "games": stats.games,
+            "ops": stats.ops(),
+            "live_sessions": host.live_sessions(),
+        }
+        if tracemalloc.is_tracing():
+            entry["heap_bytes"] = tracemalloc.get_traced_memory()[0]
+        stats.samples.append(entry)
+        await asyncio.sleep(interval)
+
+
+async def run_async(config: LoadConfig) -> dict:
+    """Run the players and build the report."""
+    seed = secrets.randbits(64) if config.seed is None else config.seed
+    host = Host(config, seed)
+    await host.open()
+    stats = LoadStats()
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    sampler = asyncio.create_task(sample_memory(host, stats, config.sample,
+                                                started))
+    try:
+        await asyncio.gather(*(play(i, host, config, seed, stats,
+                                    loop.time() + config.duration)
+                               for i in range(config.players)))
+    finally:
+        sampler.cancel()
+        await host.close()
+    elapsed = time.perf_counter() - started
+    stats.samples.append({"seconds": round(elapsed, 3),
+                          "rss_bytes": rss_bytes(), "games": stats.games,
+                          "ops": stats.ops(),
+                          "live_sessions": host.live_sessions()})
+    return report(config, seed, stats, elapsed)
+
+
+def report(config: LoadConfig, seed: int, stats: LoadStats,
+           elapsed: float) -> dict:
+    """The JSON-ready summary of a run."""
+    samples = stats.samples
+    return {
+        "config": {**asdict(config), "seed": seed},
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "seconds": elapsed,
+        "games": stats.games,
+        "wins": stats.wins,
+        "errors": stats.errors,
+        "games_per_second": stats.games / elapsed if elapsed else 0.0,
+        "ops_per_second": stats.ops() / elapsed if elapsed else 0.0,
+        "latency": {op: {
+            "count": hist.count,
+            "mean": hist.total / hist.count if hist.count else 0.0,
+            "p50": hist.quantile(0.5),
+            "p95": hist.quantile(0.95),
+            "p99": hist.quantile(0.99),
+        } for op, hist in sorted(stats.latency.items())},
+        "memory": {
+            "rss_growth_bytes": samples[-1]["rss_bytes"] - samples[0]["rss_bytes"] if samples else 0,  # noqa: E501 pylint: disable= [C0301]
+            "samples": samples,
+        },
+    }
+
+
+def run(config: LoadConfig) -> dict:
+    """Run a load test to completion."""
+    if config.trace_malloc:
+        tracemalloc.start()
+    try:
+        return asyncio.run(run_async(config))
+    finally:
+        if config.trace_malloc:
+            tracemalloc.stop()
+
+
+def compare(result: dict, baseline: dict) -> List[str]:
+    """Describe throughput and p99 changes against a baseline report."""
+    lines = []
+    if baseline.get("games_per_second"):
+        ratio = result["games_per_second"] / baseline["games_per_second"]
+        lines.append(f"{'games/s':20} {ratio:6.2f}x")
+    for op, latency in result["latency"].items():
+        old = baseline.get("latency", {}).get(op)
+        if old and old["p99"]:
+            lines.append(f"{op + ' p99':20} {latency['p99'] / old['p99']:6.2f}x")  # noqa: E501 pylint: disable= [C0301]
+    return lines
+
+
+def main(argv=None):
+    """Run a load test from the command line."""
+    defaults = LoadConfig()
+    parser = argparse.ArgumentParser(description="Hangman load generator.")
+    parser.add_argument("--players", type=int, default=defaults.players)
+    parser.add_argument("--duration", type=float, default=defaults.duration,
+                        help="seconds to run")
+    parser.add_argument("--games", type=int, default=defaults.games,
+                        help="stop after starting this many games (0: no cap)")  # noqa: E501 pylint: disable= [C0301]
+    parser.add_argument("--target", default=defaults.target,
+                        choices=["direct", "inprocess", "loopback"])
+    parser.add_argument("--connect", help="host:port of a running server "
+                        "(loopback target)")
+    parser.add_argument("--level", default=defaults.level,
+                        choices=[level.name.lower() for level in Level])
+    parser.add_argument("--strategy", default=defaults.strategy,
+                        choices=["random", "script"])
+    parser.add_argument("--think", type=float, default=defaults.think,
+                        help="mean think time between guesses, seconds")
+    parser.add_argument("--timeout-rate", type=float,
+                        default=defaults.timeout_rate,
+                        help="chance of stalling until a guess times out")
+    parser.add_argument("--timeout", type=float, default=defaults.timeout,
+                        help="server guess timeout, seconds; with --connect "
+                        "the running server's own timeout applies")
+    parser.add_argument("--lives", type=int, default=defaults.max_lives)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--sample", type=float, default=defaults.sample,
+                        help="seconds between memory samples")
+    parser.add_argument("--trace-malloc", action="store_true",
+                        help="also sample the Python heap (slower)")
+    parser.add_argument("-o", "--out", help="write the JSON report here")
+    parser.add_argument("--compare", help="baseline JSON report to compare")
+    args = parser.parse_args(argv)
+    os.environ.setdefault(OFFLINE_ENV, "1")
+    config = LoadConfig(args.players, args.duration, args.games, args.target,
+                        args.level, args.strategy, args.think,
+                        args.timeout_rate, args.timeout, args.lives,
+                        args.seed, args.sample, args.connect,
+                        args.trace_malloc)
+    result = run(config)
+    print(f"{result['games']:,} games, {result['games_per_second']:,.0f} games/s, "  # noqa: E501 pylint: disable= [C0301]
+          f"{result['ops_per_second']:,.0f} ops/s, {result['errors']} errors, "
+          f"RSS {result['memory']['rss_growth_bytes'] / 1e6:+,.1f} MB")
+    for op, latency in result["latency"].items():
+        print(f"{op:10} p50 {latency['p50'] * 1e6:>10,.1f} us  "
+              f"p95 {latency['p95'] * 1e6:>10,.1f} us  "
+              f"p99 {latency['p99'] * 1e6:>10,.1f} us")
+    if args.out:
+        with open(args.out, "w", encoding="UTF-8") as out:
+            json.dump(result, out, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="UTF-8") as baseline:
+            print("\n".join(compare(result, json.load(baseline))))
+    return result
+
+
+if __name__ == "__main__":
+    main()
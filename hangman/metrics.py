@@ -0,0 +1,250 @@
+"""Optional counters and latency histograms for game and selector events.
+
+Nothing is measured until instrument() is called. It wraps guess_letter,
+time_out, is_won and is_lost on HangmanGame and its subclasses, and
+pick_a_word on WordSelector and its subclasses. uninstrument() puts the
+original methods back, so the disabled path costs nothing. count() is a
+cheap hook for other code such as the GUI event handlers.
+
+Metrics can be read with snapshot() or dumped as text with render_text().
+"""
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+from hangman.game import HangmanGame  # pylint: disable= [E0401]
+from hangman.selector import WordSelector  # pylint: disable= [E0401]
+
+# Histogram bucket upper bounds in seconds: 1us doubling up to ~8s.
+BOUNDS: List[float] = [1e-6 * 2 ** i for i in range(24)]
+
+GAME_METHODS = ("guess_letter", "time_out", "is_won", "is_lost")
+SELECTOR_METHODS = ("pick_a_word",)
+
+
+class Histogram:
+    """Fixed log-spaced latency buckets with count and sum; thread-safe."""
+    __slots__ = ("bounds", "buckets", "count", "total", "_lock")
+
+    def __init__(self, bounds: Optional[List[float]] = None):
+        self.bounds = BOUNDS if bounds is None else bounds
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """Record one duration."""
+        bucket = bisect_left(self.bounds, seconds)
+        with self._lock:
+            self.buckets[bucket] += 1
+            self.count += 1
+            self.total += seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return self.bounds[i] if i < len(self.bounds) else float("inf")  # noqa: E501 pylint: disable= [C0301]
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        """Summary of the histogram."""
+        with self._lock:
+            return self._summary()
+
+    def _summary(self) -> dict:
+        """Summary of the histogram; the caller holds the lock."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {f"{bound:g}": n for bound, n in zip(self.bounds, self.buckets) if n},  # noqa: E501 pylint: disable= [C0301]
+        }
+
+
+class Registry:
+    """Named counters and histograms."""
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, n: int = 1):
+        """Add n to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def histogram(self, name: str) -> Histogram:
+        """Get or create a histogram."""
+        hist = self.histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self.histograms.setdefault(name, Histogram())
+        return hist
+
+    def reset(self):
+        """Forget every recorded value."""
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> dict:
+        """All metrics as plain data."""
+        with self._lock:
+            counters, histograms = dict(self.counters), dict(self.histograms)
+        return {
+            "counters": counters,
+            "histograms": {name: hist.snapshot()
+                           for name, hist in histograms.items()},
+        }
+
+    def render_text(self) -> str:
+        """Metrics in a Prometheus-style text format."""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items())
+        for name, value in counters:
+            lines.append(f"{_metric(name)}_total {value}")
+        for name, hist in histograms:
+            base = _metric(name)
+            seen = 0
+            for bound, n in zip(hist.bounds, hist.buckets):
+                seen += n
+                lines.append(f'{base}_bucket{{le="{bound:g}"}} {seen}')
+            lines.append(f'{base}_bucket{{le="+Inf"}} {hist.count}')
+            lines.append(f"{base}_sum {hist.total}")
+            lines.append(f"{base}_count {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _metric(name: str) -> str:
+    """Turn a dotted name into a metric identifier."""
+    return "hangman_" + "".join(ch if ch.isalnum() else "_" for ch in name)
+
+
+REGISTRY = Registry()
+_ORIGINALS: Dict[tuple, Callable] = {}
+_ACTIVE: Optional[Registry] = None
+
+
+def enabled() -> bool:
+    """Check whether instrumentation is active."""
+    return _ACTIVE is not None
+
+
+def count(name: str, n: int = 1):
+    """Bump a counter if instrumentation is active."""
+    if _ACTIVE is not None:
+        _ACTIVE.inc(name, n)
+
+
+def observe(name: str, seconds: float):
+    """Record a duration if instrumentation is active."""
+    if _ACTIVE is not None:
+        _ACTIVE.histogram(name).observe(seconds)
+
+
+def _timed(name: str, func: Callable, registry: Registry) -> Callable:
+    """Wrap func to record its latency under name."""
+    hist = registry.histogram(f"{name}.seconds")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            hist.observe(time.perf_counter() - start)
+    return wrapper
+
+
+def _guess_wrapper(func: Callable, registry: Registry) -> Callable:
+    """Wrap guess_letter to time it and count each GuessResult."""
+    timed = _timed("game.guess_letter", func, registry)
+
+    @functools.wraps(func)
+    def wrapper(self, guess):
+        result = timed(self, guess)
+        registry.inc(f"game.guess.{result.name}")
+        return result
+    return wrapper
+
+
+def _timeout_wrapper(func: Callable, registry: Registry) -> Callable:
+    """Wrap time_out to count timeouts."""
+    timed = _timed("game.time_out", func, registry)
+
+    @functools.wraps(func)
+    def wrapper(self):
+        registry.inc("game.timeout")
+        return timed(self)
+    return wrapper
+
+
+def _classes(base: type) -> List[type]:
+    """base and every subclass currently defined."""
+    found, todo = [], [base]
+    while todo:
+        cls = todo.pop()
+        found.append(cls)
+        todo.extend(cls.__subclasses__())
+    return found
+
+
+def _wrap(cls: type, method: str, prefix: str, registry: Registry):
+    """Replace one method defined directly on cls."""
+    func = cls.__dict__.get(method)
+    if func is None or (cls, method) in _ORIGINALS:
+        return
+    _ORIGINALS[cls, method] = func
+    if method == "guess_letter":
+        wrapped = _guess_wrapper(func, registry)
+    elif method == "time_out":
+        wrapped = _timeout_wrapper(func, registry)
+    else:
+        wrapped = _timed(f"{prefix}.{method}", func, registry)
+    setattr(cls, method, wrapped)
+
+
+def instrument(registry: Optional[Registry] = None):
+    """Start recording game and selector metrics."""
+    global _ACTIVE  # pylint: disable=global-statement
+    if _ACTIVE is not None:
+        uninstrument()
+    registry = registry or REGISTRY
+    for cls in _classes(HangmanGame):
+        for method in GAME_METHODS:
+            _wrap(cls, method, "game", registry)
+    for cls in _classes(WordSelector):
+        for method in SELECTOR_METHODS:
+            _wrap(cls, method, "selector", registry)
+    _ACTIVE = registry
+
+
+def uninstrument():
+    """Restore the original methods and stop recording."""
+    global _ACTIVE  # pylint: disable=global-statement
+    for (cls, method), func in _ORIGINALS.items():
+        setattr(cls, method, func)
+    _ORIGINALS.clear()
+    _ACTIVE = None
+
+
+def snapshot() -> dict:
+    """Snapshot of the default registry."""
+    return REGISTRY.snapshot()
+
+
+def render_text() -> str:
+    """Text dump of the default registry."""
+    return REGISTRY.render_text()
@@ -0,0 +1,99 @@
+"""Index of candidate words for a masked pattern such as "_a__a_".
+
+Words are bucketed by length. Inside a bucket every word has a bit
+number, and Python ints serve as bitsets: one per (position, character)
+pair and one per letter appearing anywhere in the word. A query is a
+handful of AND / AND-NOT operations over those bitsets instead of a scan
+over the word list.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from hangman.game import MASK_CHAR  # pylint: disable= [E0401]
+from hangman.selector import INTERMEDIATE_PHRASES, basic_words  # noqa: E501 pylint: disable= [E0401]
+
+
+class Bucket:  # pylint: disable=too-few-public-methods
+    """Bitsets for all words of one length."""
+    __slots__ = ("words", "at", "has", "alpha_at", "all")
+
+    def __init__(self, length: int):
+        self.words: List[str] = []
+        self.at: Dict[Tuple[int, str], int] = {}
+        self.has: Dict[str, int] = {}
+        self.alpha_at: List[int] = [0] * length
+        self.all = 0
+
+    def add(self, word: str):
+        """Give word the next bit number and set its bits."""
+        bit = 1 << len(self.words)
+        self.words.append(word)
+        self.all |= bit
+        for pos, ch in enumerate(word):
+            self.at[pos, ch] = self.at.get((pos, ch), 0) | bit
+            if ch.isalpha():
+                self.alpha_at[pos] |= bit
+                self.has[ch] = self.has.get(ch, 0) | bit
+
+
+class PatternIndex:
+    """Answer which words still fit a masked pattern and wrong letters."""
+    def __init__(self, words: Iterable[str]):
+        self.buckets: Dict[int, Bucket] = {}
+        for word in dict.fromkeys(w.lower() for w in words):
+            if word:
+                bucket = self.buckets.get(len(word))
+                if bucket is None:
+                    bucket = self.buckets[len(word)] = Bucket(len(word))
+                bucket.add(word)
+
+    def __len__(self) -> int:
+        return sum(len(bucket.words) for bucket in self.buckets.values())
+
+    def bits(self, pattern: str, excluded: Iterable[str] = ()) -> Tuple[Optional[Bucket], int]:  # noqa: E501 pylint: disable= [C0301]
+        """Return the pattern's bucket and the bitset of matching words."""
+        pattern = pattern.lower()
+        bucket = self.buckets.get(len(pattern))
+        if bucket is None:
+            return None, 0
+        candidates = bucket.all
+        hidden: List[int] = []
+        revealed = set()
+        for pos, ch in enumerate(pattern):
+            if ch == MASK_CHAR:
+                hidden.append(pos)
+                candidates &= bucket.alpha_at[pos]
+            else:
+                candidates &= bucket.at.get((pos, ch), 0)
+                if ch.isalpha():
+                    revealed.add(ch)
+            if not candidates:
+                return bucket, 0
+        for ch in set(excluded) - revealed:
+            candidates &= ~bucket.has.get(ch.lower(), 0)
+        # A revealed letter is revealed everywhere, so no hidden slot holds it.
+        for ch in revealed:
+            for pos in hidden:
+                candidates &= ~bucket.at.get((pos, ch), 0)
+        return bucket, candidates
+
+    def match(self, pattern: str, excluded: Iterable[str] = ()) -> List[str]:
+        """Return the words that fit pattern and contain no excluded letter."""  # noqa: E501 pylint: disable= [C0301]
+        bucket, candidates = self.bits(pattern, excluded)
+        matches: List[str] = []
+        while candidates:
+            low = candidates & -candidates
+            matches.append(bucket.words[low.bit_length() - 1])
+            candidates ^= low
+        return matches
+
+    def count(self, pattern: str, excluded: Iterable[str] = ()) -> int:
+        """Return how many words match without building the list."""
+        return self.bits(pattern, excluded)[1].bit_count()
+
+
+@lru_cache(maxsize=1)
+def default_index() -> PatternIndex:
+    """Index over BASIC_WORDS and INTERMEDIATE_PHRASES, built once."""
+    words = [word.decode("UTF-8") for word in basic_words()]
+    return PatternIndex(words + INTERMEDIATE_PHRASES)
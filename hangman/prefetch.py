@@ -0,0 +1,128 @@
+"""Games built ahead of time on a worker thread, handed out instantly.
+
+Building a game picks a word, which may load a word list or read a
+disk-backed pool, and an EvilHangmanGame also indexes its candidates.
+A GamePool keeps the next ``depth`` games ready for each (level, game
+class) it has been asked for, refilling in the background, so take()
+is a deque pop instead of that work. When nothing is ready take() builds
+the game itself, so it never waits on the worker.
+
+Prebuilt games have no observer; take() attaches one and only then
+fires its on_start, so logs and metrics see the game when it is played.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple, Type
+from hangman.game import GameObserver, HangmanGame  # pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+
+# Games kept ready per (level, game class).
+PREFETCH_DEPTH = 2
+
+Key = Tuple[Level, Type[HangmanGame]]
+
+
+class GamePool:
+    """Per-level queues of ready games, refilled by a daemon thread."""
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, selector: Optional[WordSelector] = None,
+                 depth: int = PREFETCH_DEPTH, max_lives: int = 6):
+        self.selector = selector or WordSelector()
+        self.depth = depth
+        self.max_lives = max_lives
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._ready: Dict[Key, Deque[HangmanGame]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def warm(self, level: Level, game_cls: Type[HangmanGame] = HangmanGame):
+        """Start keeping games of this kind ready."""
+        with self._cond:
+            self._ready.setdefault((level, game_cls), deque())
+            self._start()
+            self._cond.notify()
+
+    def take(self, level: Level, game_cls: Type[HangmanGame] = HangmanGame,
+             observer: Optional[GameObserver] = None) -> HangmanGame:
+        """A ready game of this kind, or a freshly built one."""
+        key = (level, game_cls)
+        with self._cond:
+            ready = self._ready.setdefault(key, deque())
+            game = ready.popleft() if ready else None
+            if game is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self._start()
+            self._cond.notify()
+        if game is None:
+            game = self._build(key)
+        if observer is not None:
+            game.observer = observer
+            observer.on_start(game)
+        return game
+
+    def ready(self, level: Level,
+              game_cls: Type[HangmanGame] = HangmanGame) -> int:
+        """How many games of this kind are waiting."""
+        with self._cond:
+            return len(self._ready.get((level, game_cls), ()))
+
+    def close(self):
+        """Stop the worker and drop the ready games."""
+        with self._cond:
+            self._closed = True
+            self._ready.clear()
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _build(self, key: Key) -> HangmanGame:
+        """Make one game of a kind."""
+        level, game_cls = key
+        return game_cls(self.selector, level, max_lives=self.max_lives)
+
+    def _start(self):
+        """Start the worker if needed; the caller holds the lock."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name="hangman-prefetch")
+            self._thread.start()
+
+    def _wanted(self) -> Optional[Key]:
+        """The kind with the fewest ready games below depth, if any."""
+        key, size = None, self.depth
+        for candidate, ready in self._ready.items():
+            if len(ready) < size:
+                key, size = candidate, len(ready)
+        return key
+
+    def _run(self):
+        """Worker loop: build games until every queue is full."""
+        while True:
+            with self._cond:
+                key = None
+                while not self._closed:
+                    key = self._wanted()
+                    if key is not None:
+                        break
+                    self._cond.wait()
+                if self._closed:
+                    return
+            try:
+                game = self._build(key)
+            except Exception:  # pylint: disable=broad-except
+                # Leave the error to take(), which builds on the caller's
+                # thread; stop prefetching this kind until it is taken.
+                with self._cond:
+                    self.errors += 1
+                    self._ready.pop(key, None)
+                continue
+            with self._cond:
+                ready = self._ready.get(key)
+                if ready is not None and not self._closed:
+                    ready.append(game)
@@ -0,0 +1,356 @@
+"""Spectator rooms: stream a live game's state to many local watchers.
+
+A Room is a GameObserver. After each change to its game it builds one
+compact binary frame and hands that same bytes object to every
+subscriber's bounded asyncio queue, so the cost per watcher is one
+queue put. A subscriber whose queue is full is dropped rather than
+allowed to hold up the game or the other watchers; it can subscribe
+again and will start from a fresh SYNC frame.
+
+Frames (all integers little-endian):
+
+    SYNC   kind, seq uint32, lives int16, max_lives int16, board_len
+           uint16, board UTF-8, then the guessed letters UTF-8
+    DELTA  kind, seq uint32, lives_delta int8, letter_len uint8, letter
+           UTF-8, then each newly revealed board position as uint16
+    END    kind, seq uint32, won uint8, then the answer UTF-8
+
+A new subscriber first gets a SYNC frame of the current state, then the
+DELTA frames that follow; a timeout is a DELTA with no letter. seq
+counts frames per room, so a gap means frames were missed. A SYNC built
+while a frame is on its way from the game thread already holds that
+change, so SpectatorView skips frames whose seq it has already seen. It
+rebuilds what HangmanGUI.update_display shows from the frames.
+"""
+
+import asyncio
+import struct
+import threading
+import weakref
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, List, Optional, Set
+from hangman.game import GameObserver, GuessResult, HangmanGame  # noqa: E501 pylint: disable= [E0401]
+
+HEADER = struct.Struct("<BI")
+SYNC = struct.Struct("<BIhhH")
+DELTA = struct.Struct("<BIbB")
+END = struct.Struct("<BIB")
+POSITION = struct.Struct("<H")
+
+# Frames a subscriber may fall behind before it is dropped.
+QUEUE_FRAMES = 64
+
+
+class Kind(IntEnum):
+    """Type byte at the start of every frame."""
+    SYNC = 0
+    DELTA = 1
+    END = 2
+
+
+class Subscription:
+    """One watcher's queue of frames; iterate it with ``async for``."""
+    def __init__(self, room: "Room", max_frames: int):
+        self.room = room
+        self.queue: asyncio.Queue = asyncio.Queue(max_frames)
+        self.dropped = False
+        self.closed = False
+
+    def _offer(self, frame: Optional[bytes]) -> bool:
+        """Queue a frame (None ends the stream); False if it is full."""
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def _finish(self):
+        """End the stream once the queued frames are read."""
+        self.closed = True
+        self._offer(None)
+
+    def _drop(self):
+        """Give up on a consumer that fell too far behind."""
+        self.dropped = True
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def close(self):
+        """Stop watching; frames already queued are discarded."""
+        self.room.unsubscribe(self)
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self._finish()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self.dropped or (self.closed and self.queue.empty()):
+            raise StopAsyncIteration
+        frame = await self.queue.get()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
+
+
+class Room(GameObserver):
+    """Broadcasts one game's state changes to its subscribers.
+
+    Pass loop when the game is played on another thread; frames are then
+    handed to the loop instead of touching its queues directly.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, max_frames: int = QUEUE_FRAMES,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.max_frames = max_frames
+        self.loop = loop
+        self.subscribers: Set[Subscription] = set()
+        self.dropped = 0
+        self.seq = 0
+        self._board_seq = 0  # seq of the last frame the board reflects
+        self._board = ""
+        self._lives = 0
+        self._max_lives = 0
+        self._guessed: List[str] = []
+        self._started = False
+        self._sync: Optional[bytes] = None
+        self._end: Optional[bytes] = None
+        # Guards the state above: the game may run on another thread.
+        self._state = threading.Lock()
+
+    def watch(self, game: HangmanGame):
+        """Observe a game that was created without this room."""
+        game.observer = self
+        self.on_start(game)
+
+    # ---------------- Subscribers ----------------
+    def subscribe(self) -> Subscription:
+        """Start watching from the current state."""
+        subscription = Subscription(self, self.max_frames)
+        with self._state:
+            started, end = self._started, self._end
+        if started:
+            subscription._offer(self.sync_frame())  # noqa: E501 pylint: disable=protected-access
+        if end is not None:
+            subscription._offer(end)  # pylint: disable=protected-access
+            subscription._finish()  # pylint: disable=protected-access
+        else:
+            self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Stop sending frames to a subscription."""
+        self.subscribers.discard(subscription)
+
+    def close(self):
+        """End every subscriber's stream, e.g. when the game is abandoned."""
+        if self.loop is not None and self.loop.is_closed():
+            self._fan_out(None)
+        else:
+            self._broadcast(None)
+
+    @property
+    def ended(self) -> bool:
+        """Whether the game is over and its END frame was sent."""
+        return self._end is not None
+
+    def sync_frame(self) -> bytes:
+        """The current state as one SYNC frame, encoded once per change."""
+        with self._state:
+            if self._sync is None:
+                board = self._board.encode("UTF-8")
+                header = SYNC.pack(Kind.SYNC, self._board_seq, self._lives,
+                                   self._max_lives, len(board))
+                self._sync = (header + board
+                              + "".join(self._guessed).encode("UTF-8"))
+            return self._sync
+
+    def _broadcast(self, frame: Optional[bytes]):
+        """Hand a frame (None: end of game) to every subscriber."""
+        if self.loop is not None:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not self.loop:
+                self.loop.call_soon_threadsafe(self._fan_out, frame)
+                return
+        self._fan_out(frame)
+
+    def _fan_out(self, frame: Optional[bytes]):
+        """Queue one frame everywhere, dropping full subscribers."""
+        # pylint: disable=protected-access
+        if frame is None:
+            for subscription in self.subscribers:
+                subscription._finish()
+            self.subscribers.clear()
+            return
+        slow = [subscription for subscription in self.subscribers
+                if not subscription._offer(frame)]
+        for subscription in slow:
+            self.subscribers.discard(subscription)
+            subscription._drop()
+        self.dropped += len(slow)
+
+    # ---------------- GameObserver ----------------
+    def on_start(self, game: HangmanGame):
+        """Take the opening state and send it as a SYNC frame."""
+        with self._state:
+            self._board = game.masked()
+            self._lives = game.lives
+            self._max_lives = game.max_lives
+            self._guessed = sorted(game.guessed)
+            self._started = True
+            self._sync = None
+        self._broadcast(self.sync_frame())
+
+    def on_guess(self, game: HangmanGame, guess: str, result: GuessResult):
+        """Send what a counted guess revealed and what it cost."""
+        if result in (GuessResult.CORRECT, GuessResult.INCORRECT):
+            self._change(game, guess.lower())
+
+    def on_timeout(self, game: HangmanGame):
+        """Send the life a timeout cost."""
+        self._change(game, "")
+
+    def _change(self, game: HangmanGame, letter: str):
+        """Encode one DELTA against the last state, then END if over."""
+        board = game.masked()
+        won = game.is_won()
+        over = won or game.is_lost()
+        letter_bytes = letter.encode("UTF-8")
+        end = None
+        # State and seq change together, so a SYNC built on the loop
+        # thread meanwhile has either both or neither.
+        with self._state:
+            revealed = [i for i, (old, new) in enumerate(zip(self._board, board))  # noqa: E501 pylint: disable= [C0301]
+                        if old != new]
+            delta = game.lives - self._lives
+            self._board, self._lives = board, game.lives
+            if letter:
+                self._guessed.append(letter)
+            self._sync = None
+            self.seq += 1
+            self._board_seq = self.seq
+            frame = DELTA.pack(Kind.DELTA, self.seq, delta, len(letter_bytes))
+            if over:
+                self.seq += 1
+                end = self._end = (END.pack(Kind.END, self.seq, won)
+                                   + game.answer.encode("UTF-8"))
+        self._broadcast(b"".join([frame, letter_bytes]
+                                 + [POSITION.pack(i) for i in revealed]))
+        if end is not None:
+            self._broadcast(end)
+            self._broadcast(None)
+
+
+class Rooms(GameObserver):
+    """A Room per game, for hosts such as GameServer that share one observer.
+
+    Games are numbered in start order; a room is forgotten once its game
+    ends and its last frames are sent, or once the game is garbage
+    collected unfinished (say evicted by the host), which also ends its
+    subscribers' streams.
+    """
+    def __init__(self, max_frames: int = QUEUE_FRAMES,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.max_frames = max_frames
+        self.loop = loop
+        self.rooms: Dict[int, Room] = {}
+        self._ids: Dict[int, int] = {}
+        self._next_id = 1
+
+    def get(self, game_id: int) -> Optional[Room]:
+        """The room of a game still in progress."""
+        return self.rooms.get(game_id)
+
+    def on_start(self, game: HangmanGame):
+        """Open a room for the new game."""
+        room = Room(self.max_frames, self.loop)
+        key = id(game)
+        game_id = self._ids[key] = self._next_id
+        self._next_id += 1
+        self.rooms[game_id] = room
+        weakref.finalize(game, self._forget, key, game_id).atexit = False
+        room.on_start(game)
+
+    def on_guess(self, game: HangmanGame, guess: str, result: GuessResult):
+        """Pass the guess to the game's room."""
+        room = self._room(game)
+        if room is not None:
+            room.on_guess(game, guess, result)
+            self._retire(game, room)
+
+    def on_timeout(self, game: HangmanGame):
+        """Pass the timeout to the game's room."""
+        room = self._room(game)
+        if room is not None:
+            room.on_timeout(game)
+            self._retire(game, room)
+
+    def _room(self, game: HangmanGame) -> Optional[Room]:
+        """The room observing game, if any."""
+        game_id = self._ids.get(id(game))
+        return None if game_id is None else self.rooms.get(game_id)
+
+    def _retire(self, game: HangmanGame, room: Room):
+        """Forget a room once its game has ended."""
+        if room.ended:
+            self.rooms.pop(self._ids.pop(id(game)), None)
+
+    def _forget(self, key: int, game_id: int):
+        """Drop an abandoned game's room and end its subscribers."""
+        if self._ids.get(key) == game_id:
+            del self._ids[key]
+        room = self.rooms.pop(game_id, None)
+        if room is not None:
+            room.close()
+
+
+@dataclass
+class SpectatorView:
+    """A watcher's copy of the game, rebuilt from frames."""
+    board: List[str] = field(default_factory=list)
+    lives: int = 0
+    max_lives: int = 0
+    guessed: List[str] = field(default_factory=list)
+    seq: int = -1
+    over: bool = False
+    won: bool = False
+    answer: str = ""
+
+    @property
+    def masked(self) -> str:
+        """The board as the GUI shows it."""
+        return "".join(self.board)
+
+    def apply(self, frame: bytes):
+        """Update the view from one frame; frames already seen are skipped."""
+        kind = frame[0]
+        if kind in (Kind.DELTA, Kind.END) and \
+                HEADER.unpack_from(frame)[1] <= self.seq:
+            return
+        if kind == Kind.SYNC:
+            _, self.seq, self.lives, self.max_lives, size = SYNC.unpack_from(frame)  # noqa: E501 pylint: disable= [C0301]
+            board_end = SYNC.size + size
+            self.board = list(frame[SYNC.size:board_end].decode("UTF-8"))
+            self.guessed = list(frame[board_end:].decode("UTF-8"))
+        elif kind == Kind.DELTA:
+            _, self.seq, delta, size = DELTA.unpack_from(frame)
+            start = DELTA.size + size
+            letter = frame[DELTA.size:start].decode("UTF-8")
+            self.lives += delta
+            if letter:
+                self.guessed.append(letter)
+                for (position,) in POSITION.iter_unpack(frame[start:]):
+                    self.board[position] = letter
+        elif kind == Kind.END:
+            _, self.seq, won = END.unpack_from(frame)
+            self.won = bool(won)
+            self.over = True
+            self.answer = frame[END.size:].decode("UTF-8")
+        else:
+            raise ValueError(f"unknown frame kind {kind}")
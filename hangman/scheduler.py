@@ -0,0 +1,115 @@
+"""Non-repeating, shardable order in which to pick the words of a pool.
+
+A WordScheduler walks a pseudo-random permutation of range(size): every
+index comes up exactly once per pass before any repeats. The permutation
+is a keyed, unbalanced Feistel network over the smallest power-of-two
+domain that holds size, with cycle walking to stay inside range(size),
+so each pick is O(1) and the state is a few integers rather than a
+shuffled list.
+Each pass uses a fresh key derived from the seed, so passes differ but
+the whole sequence is reproducible for a given seed.
+
+Shard k of N takes permutation positions k, k + N, k + 2N, ..., so
+workers sharing a seed never hand out the same word within a pass.
+"""
+
+import secrets
+import threading
+from typing import List, Optional
+
+_GOLDEN = 0x9E3779B97F4A7C15
+_WORD = 0xFFFFFFFFFFFFFFFF
+
+
+def splitmix64(value: int) -> int:
+    """Scramble a 64-bit integer; used to derive keys from a seed."""
+    value = (value + _GOLDEN) & _WORD
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _WORD
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _WORD
+    return value ^ (value >> 31)
+
+
+class FeistelPermutation:
+    """Keyed bijection on range(size)."""
+    def __init__(self, size: int, key: int):
+        if size < 1:
+            raise ValueError("cannot permute an empty range")
+        self.size = size
+        # Unbalanced halves over the smallest power-of-two domain, so cycle
+        # walking needs fewer than two passes on average.
+        bits = max(2, (size - 1).bit_length())
+        self._low = bits - bits // 2
+        self._low_mask = (1 << self._low) - 1
+        # Round function: multiplicative hashing, keeping the top bits of
+        # a 32-bit product (64-bit for pools over 2**32 entries).
+        width = 32 if self._low <= 16 else 64
+        self._multiplier = 0x9E3779B1 if width == 32 else _GOLDEN
+        self._word = (1 << width) - 1
+        self._high_shift = width - bits // 2
+        self._low_shift = width - self._low
+        # Three rounds already give a pseudo-random permutation; the fourth
+        # evens out the order on tiny pools such as the phrase list.
+        self._keys: List[int] = []
+        for _ in range(4):
+            key = splitmix64(key)
+            self._keys.append(key & self._word)
+
+    def _encrypt(self, value: int) -> int:
+        """One pass of the Feistel network over the power-of-two domain."""
+        multiplier, word = self._multiplier, self._word
+        high_shift, low_shift = self._high_shift, self._low_shift
+        first, second, third, fourth = self._keys
+        high, low = value >> self._low, value & self._low_mask
+        high ^= ((low ^ first) * multiplier & word) >> high_shift
+        low ^= ((high ^ second) * multiplier & word) >> low_shift
+        high ^= ((low ^ third) * multiplier & word) >> high_shift
+        low ^= ((high ^ fourth) * multiplier & word) >> low_shift
+        return (high << self._low) | low
+
+    def walk(self, index: int) -> int:
+        """Map an index known to be in range to its permuted position."""
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def __call__(self, index: int) -> int:
+        """Map index to its position in the permutation."""
+        if not 0 <= index < self.size:
+            raise IndexError("index out of range")
+        return self.walk(index)
+
+
+class WordScheduler:
+    """Thread-safe walk through seeded permutations of range(size)."""
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, size: int, seed: Optional[int] = None,
+                 shard: int = 0, shards: int = 1):
+        if not 0 <= shard < shards:
+            raise ValueError(f"shard {shard} is not in range({shards})")
+        if shard >= size:
+            raise ValueError(f"shard {shard} gets no words from {size}")
+        self.size = size
+        self.seed = secrets.randbits(64) if seed is None else seed
+        self.shard = shard
+        self.shards = shards
+        self.epoch = 0
+        self._next = shard
+        self._lock = threading.Lock()
+        self._permutation = self._for_epoch(0)
+
+    def _for_epoch(self, epoch: int) -> FeistelPermutation:
+        """The permutation used for one pass over the pool."""
+        return FeistelPermutation(self.size, self.seed ^ splitmix64(epoch))
+
+    def next(self) -> int:
+        """Return the next pool index for this shard."""
+        with self._lock:
+            if self._next >= self.size:
+                self.epoch += 1
+                self._permutation = self._for_epoch(self.epoch)
+                self._next = self.shard
+            position = self._next
+            self._next += self.shards
+            permutation = self._permutation
+        return permutation.walk(position)
@@ -1,15 +1,18 @@
 """Module for selecting words or phrases based on difficulty level."""
 
-import random as rnd
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List
-import requests
+from typing import Dict, List, Optional, Sequence
+from hangman.scheduler import WordScheduler  # pylint: disable= [E0401]
+from hangman.source import DATA_DIR, WordSource  # noqa: E501 pylint: disable= [E0401]
 
 # A list of valid basic words extarcted from a larger online dictionary.
+# It is loaded on first use (see basic_words) instead of at import time.
 WORD_LINK = "https://www.mit.edu/~ecprice/wordlist.10000"
-RESPONSE = requests.get(WORD_LINK, timeout=10)
-BASIC_WORDS = RESPONSE.content.splitlines()
+BASIC_SOURCE = WordSource(WORD_LINK, DATA_DIR / "wordlist.10000",
+                          "wordlist.10000")
+_BASIC_WORDS: Optional[List[bytes]] = None
 
 # A list of intermediate phrases for intermediate players.
 INTERMEDIATE_PHRASES: List[str] = [
@@ -36,24 +39,90 @@ INTERMEDIATE_PHRASES: List[str] = [
 ]
 
 
+def basic_words() -> List[bytes]:
+    """Return the basic word list, loading it on the first call."""
+    global _BASIC_WORDS  # pylint: disable=global-statement
+    if _BASIC_WORDS is None:
+        _BASIC_WORDS = BASIC_SOURCE.load()
+    return _BASIC_WORDS
+
+
+def __getattr__(name):
+    """Keep BASIC_WORDS importable while loading it lazily."""
+    if name == "BASIC_WORDS":
+        return basic_words()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class Level(Enum):
     """Game difficulty levels."""
     BASIC = auto()
     INTERMEDIATE = auto()
+    # Graded by precomputed solver difficulty, see hangman.difficulty.
+    EASY = auto()
+    MEDIUM = auto()
+    HARD = auto()
+    EXPERT = auto()
 
 
 @dataclass
 class WordSelector:
-    """Select words or phrases based on difficulty level."""
+    """Select words or phrases based on difficulty level.
+
+    Each level's pool is walked in a seeded, non-repeating order (see
+    hangman.scheduler); workers with the same seed and shards each take
+    their own shard and never pick the same word within a pass.
+    """
     level: Level = Level.BASIC
+    # Optional replacement for BASIC_WORDS, e.g. a hangman.wordindex.WordIndex.
+    basic_pool: Optional[Sequence[bytes]] = None
+    # None seeds from the OS, so separate selectors never share an order.
+    seed: Optional[int] = None
+    shard: int = 0
+    shards: int = 1
+    _schedulers: Dict[Level, WordScheduler] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock,
+                                  init=False, repr=False, compare=False)
 
-    def pick_a_word(self, level: Level) -> str:
-        """Pick a random word or phrase based on the selected level."""
-        selected_word = ""
+    def pool(self, level: Level) -> Sequence:
+        """Return the words (bytes) or phrases (str) for a level."""
         if level == Level.BASIC:
-            selected_word = rnd.choice(BASIC_WORDS).decode('UTF-8')
-        elif level == Level.INTERMEDIATE:
-            selected_word = rnd.choice(INTERMEDIATE_PHRASES)
-        else:
-            raise ValueError("Unknown level")
+            return self.basic_pool if self.basic_pool is not None else basic_words()  # noqa: E501 pylint: disable= [C0301]
+        if level == Level.INTERMEDIATE:
+            return INTERMEDIATE_PHRASES
+        if level in (Level.EASY, Level.MEDIUM, Level.HARD, Level.EXPERT):
+            from hangman.difficulty import graded_pools  # noqa: E501 pylint: disable=import-outside-toplevel,cyclic-import
+            return graded_pools()[level]
+        raise ValueError("Unknown level")
+
+    def scheduler(self, level: Level, size: int) -> WordScheduler:
+        """The level's scheduler, restarted if its pool changed size."""
+        scheduler = self._schedulers.get(level)
+        if scheduler is None or scheduler.size != size:
+            with self._lock:
+                scheduler = self._schedulers.get(level)
+                if scheduler is None or scheduler.size != size:
+                    seed = None if self.seed is None else hash((self.seed, level.value))  # noqa: E501 pylint: disable= [C0301]
+                    scheduler = WordScheduler(size, seed, self.shard,
+                                              self.shards)
+                    self._schedulers[level] = scheduler
+        return scheduler
+
+    def pick_a_word(self, level: Level) -> str:
+        """Pick the next word or phrase of the level's shuffled order."""
+        pool = self.pool(level)
+        selected_word = pool[self.scheduler(level, len(pool)).next()]
+        if isinstance(selected_word, bytes):
+            selected_word = selected_word.decode('UTF-8')
         return selected_word
+
+
+@dataclass
+class FixedWordSelector(WordSelector):
+    """Always pick the same word; used to rebuild saved games."""
+    word: str = ""
+
+    def pick_a_word(self, level: Level) -> str:
+        """Return the fixed word whatever the level."""
+        return self.word
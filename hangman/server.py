@@ -0,0 +1,308 @@
+"""Headless asyncio Hangman server speaking line-delimited JSON over TCP.
+
+Each request is one JSON object per line and gets one JSON reply line:
+
+    {"op": "start", "level": "basic"}        -> {"ok": true, "session": 1, ...}
+    {"op": "guess", "session": 1, "letter": "a"}
+    {"op": "state", "session": 1}
+
+Per-guess timeouts live on one shared TimingWheel driven by the event
+loop, so no GUI or display is needed, arming or cancelling a session's
+timeout is O(1) and thousands of sessions share one loop callback.
+Finished games move to a compact SessionStore so they can still be
+queried for a while without keeping the live game around.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+from typing import Callable, Dict, Optional
+from hangman.game import GameObserver, HangmanGame, Observers, GUESS_SECONDS  # noqa: E501 pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+from hangman.store import SessionStore  # pylint: disable= [E0401]
+from hangman.timers import Timer, WheelDriver  # pylint: disable= [E0401]
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Finished games stay queryable this long, up to this many of them.
+FINISHED_TTL = 300
+FINISHED_MAX = 100_000
+
+LOG = logging.getLogger(__name__)
+
+
+class ProtocolError(Exception):
+    """Raised for a malformed or unknown request."""
+
+
+class Session:  # pylint: disable=too-few-public-methods
+    """A hosted game plus its pending timeout."""
+    __slots__ = ("game", "timer", "deadline")
+
+    def __init__(self, game: HangmanGame):
+        self.game = game
+        self.timer: Optional[Timer] = None
+        self.deadline = 0.0
+
+
+class GameServer:
+    """Host many HangmanGame sessions on one asyncio event loop."""
+    def __init__(self, selector: Optional[WordSelector] = None,
+                 timeout: float = GUESS_SECONDS,
+                 game_factory: Callable[..., HangmanGame] = HangmanGame,
+                 max_lives: int = 6,
+                 finished: Optional[SessionStore] = None,
+                 observer: Optional[GameObserver] = None):
+        self.selector = selector or WordSelector()
+        self.timeout = timeout
+        self.game_factory = game_factory
+        self.max_lives = max_lives
+        self.observer = observer
+        self.sessions: Dict[int, Session] = {}
+        self.finished = finished or SessionStore(max_sessions=FINISHED_MAX,
+                                                 ttl=FINISHED_TTL)
+        self._ids = itertools.count(1)
+        self._timers: Optional[WheelDriver] = None
+
+    # ---------------- Requests ----------------
+    def handle(self, request: dict) -> dict:
+        """Dispatch one decoded request and return the reply."""
+        try:
+            if not isinstance(request, dict):
+                raise ProtocolError("request must be a JSON object")
+            op = request.get("op")
+            if op == "start":
+                return self.start(request.get("level", "basic"))
+            if op == "guess":
+                return self.guess(request.get("session"), request.get("letter"))  # noqa: E501 pylint: disable= [C0301]
+            if op == "state":
+                return self.state(request.get("session"))
+            raise ProtocolError(f"unknown op {op!r}")
+        except ProtocolError as exc:
+            return {"ok": False, "error": str(exc)}
+        except Exception:  # pylint: disable=broad-except
+            # A failing game or observer spoils this request only, never
+            # the connection or the other sessions.
+            LOG.exception("request %r failed", request)
+            return {"ok": False, "error": "internal error"}
+
+    def start(self, level_name: str) -> dict:
+        """Start a new session on the given level."""
+        try:
+            level = Level[str(level_name).upper()]
+        except KeyError as exc:
+            raise ProtocolError(f"unknown level {level_name!r}") from exc
+        extra = {"observer": self.observer} if self.observer else {}
+        game = self.game_factory(self.selector, level,
+                                 max_lives=self.max_lives, **extra)
+        session_id = next(self._ids)
+        session = Session(game)
+        self.sessions[session_id] = session
+        self._arm(session_id, session)
+        return {"ok": True, "session": session_id, **self._view(game, session)}
+
+    def guess(self, session_id, letter) -> dict:
+        """Apply a guess and restart the session's countdown."""
+        if not isinstance(letter, str):
+            raise ProtocolError("letter must be a string")
+        session = self._live(session_id)
+        if session is None:
+            if self.finished.get(session_id) is not None:
+                raise ProtocolError("game is over")
+            raise ProtocolError(f"unknown session {session_id!r}")
+        result = session.game.guess_letter(letter)
+        self._arm(session_id, session)
+        view = self._view(session.game, session)
+        if self._finished(session.game):
+            self._retire(session_id)
+        return {"ok": True, "result": result.name, **view}
+
+    def state(self, session_id) -> dict:
+        """Return the current view of a live or recently finished session."""
+        session = self._live(session_id)
+        if session is not None:
+            return {"ok": True, **self._view(session.game, session)}
+        record = self.finished.get(session_id)
+        if record is None:
+            raise ProtocolError(f"unknown session {session_id!r}")
+        return {"ok": True, **self._view(record.to_game())}
+
+    def _live(self, session_id) -> Optional[Session]:
+        """Look up a running session, rejecting ids that are not integers."""
+        if not isinstance(session_id, int):
+            raise ProtocolError(f"unknown session {session_id!r}")
+        return self.sessions.get(session_id)
+
+    def _retire(self, session_id: int):
+        """Move a finished game from the live table to the store."""
+        session = self.sessions.pop(session_id)
+        if session.timer:
+            session.timer.cancel()
+        self.finished.put_game(session_id, session.game)
+
+    @staticmethod
+    def _finished(game: HangmanGame) -> bool:
+        """Check whether the game has ended either way."""
+        return game.is_won() or game.is_lost()
+
+    def _view(self, game: HangmanGame,
+              session: Optional[Session] = None) -> dict:
+        """Describe a game the way the GUI would display it."""
+        view = {
+            "masked": game.masked(),
+            "lives": game.lives,
+            "guessed": sorted(game.guessed),
+        }
+        if game.is_won():
+            view.update(status="won", answer=game.answer)
+        elif game.is_lost():
+            view.update(status="lost", answer=game.answer)
+        else:
+            remaining = session.deadline - self._now() if session and session.timer else 0  # noqa: E501 pylint: disable= [C0301]
+            view.update(status="playing", time_left=round(max(0.0, remaining), 3))  # noqa: E501 pylint: disable= [C0301]
+        return view
+
+    # ---------------- Timer handling ----------------
+    def _now(self) -> float:
+        """Current event loop time, or 0 outside a running loop."""
+        return self._timers.now() if self._timers else 0.0
+
+    def _arm(self, session_id: int, session: Session):
+        """Cancel any pending timeout and start a fresh one."""
+        if session.timer:
+            session.timer.cancel()
+            session.timer = None
+        if self._timers is None or self._finished(session.game):
+            return
+        session.deadline = self._timers.now() + self.timeout
+        session.timer = self._timers.call_at(session.deadline, self._expire,
+                                             session_id)
+
+    def _expire(self, session_id: int):
+        """Charge a life for a missed guess and keep counting down."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return
+        session.timer = None
+        session.game.time_out()
+        if self._finished(session.game):
+            self._retire(session_id)
+        else:
+            self._arm(session_id, session)
+
+    # ---------------- Networking ----------------
+    def start_timers(self):
+        """Run timeouts on the running loop; for hosting without TCP."""
+        self._timers = WheelDriver.for_asyncio(asyncio.get_running_loop())
+        for session_id, session in self.sessions.items():
+            self._arm(session_id, session)
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Start listening and return the asyncio server."""
+        self.start_timers()
+        return await asyncio.start_server(self._client, host, port)
+
+    async def _client(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter):
+        """Answer requests from one connection until it closes."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Over the reader's limit: the rest of the line is
+                    # unread, so no later request can be framed.
+                    await _send(writer, {"ok": False, "error": "line too long"})  # noqa: E501 pylint: disable= [C0301]
+                    break
+                if not line:
+                    break
+                try:
+                    reply = self.handle(json.loads(line))
+                except ValueError:
+                    reply = {"ok": False, "error": "invalid JSON"}
+                await _send(writer, reply)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def _send(writer: asyncio.StreamWriter, reply: dict):
+    """Write one reply line."""
+    writer.write(json.dumps(reply).encode() + b"\n")
+    await writer.drain()
+
+
+class GameClient:
+    """Minimal client for the line-delimited JSON protocol."""
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):  # noqa: E501 pylint: disable= [C0301]
+        """Open a connection to a running server."""
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, **request) -> dict:
+        """Send one request and wait for its reply."""
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def close(self):
+        """Close the connection."""
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def run(host: str, port: int, timeout: float,
+              observer: Optional[GameObserver] = None):
+    """Serve until cancelled."""
+    game_server = GameServer(timeout=timeout, observer=observer)
+    server = await game_server.serve(host, port)
+    print(f"Hangman server listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Run the headless Hangman server."""
+    parser = argparse.ArgumentParser(description="Headless Hangman server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--timeout", type=float, default=GUESS_SECONDS,
+                        help="seconds allowed per guess")
+    parser.add_argument("--event-log", help="append game events to this file")
+    parser.add_argument("--stats", help="record results in this SQLite file")
+    args = parser.parse_args(argv)
+    observers = []
+    closers = []
+    if args.event_log:
+        from hangman.eventlog import EventLog  # noqa: E501 pylint: disable=import-outside-toplevel
+        log = EventLog(args.event_log)
+        observers.append(log)
+        closers.append(log)
+    if args.stats:
+        from hangman.stats import StatsRecorder, StatsStore  # noqa: E501 pylint: disable=import-outside-toplevel
+        store = StatsStore(args.stats)
+        observers.append(StatsRecorder(store, player="server"))
+        closers.append(store)
+    observer = observers[0] if len(observers) == 1 else (
+        Observers(*observers) if observers else None)
+    try:
+        asyncio.run(run(args.host, args.port, args.timeout, observer))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for closer in closers:
+            closer.close()
+
+
+if __name__ == "__main__":
+    main()
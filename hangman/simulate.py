@@ -0,0 +1,171 @@
+"""Vectorized bulk game simulator for calibrating lives and word pools.
+
+Answers are encoded as an (n, 26) letter-presence matrix and moves as an
+(n, k) int8 matrix, then all n games advance one move column at a time
+with NumPy. The rules are those of HangmanGame driven the way the GUI
+drives it: after every move the game is won if every letter is guessed,
+otherwise lost once lives reach zero. Answers must be ASCII, so a guess
+of any other letter is a miss: the first time it costs a life, like in
+HangmanGame, and after that it is a repeat.
+
+Requires numpy.
+"""
+
+from dataclasses import dataclass
+from string import ascii_lowercase
+from typing import Iterable, Optional, Sequence, Tuple, Union
+import numpy as np
+from hangman.game import HangmanGame  # pylint: disable= [E0401]
+
+# Move codes besides 0-25 for the letters a-z.
+TIMEOUT = -1
+INVALID = -2
+PAD = -3
+MISS = -4  # a letter outside a-z, which no answer holds
+
+# Outcome codes.
+PLAYING = 0
+WON = 1
+LOST = -1
+
+Move = Optional[str]
+
+
+@dataclass
+class SimulationResult:
+    """Per-game outcome arrays from simulate()."""
+    status: np.ndarray
+    moves_used: np.ndarray
+    lives: np.ndarray
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of games won."""
+        return float(np.mean(self.status == WON)) if len(self.status) else 0.0  # noqa: E501 pylint: disable= [C0301]
+
+
+def encode_answers(answers: Sequence[str]) -> np.ndarray:
+    """Return an (n, 26) bool matrix of the letters in each answer."""
+    present = np.zeros((len(answers), 26), dtype=bool)
+    for row, answer in enumerate(answers):
+        for ch in answer.lower():
+            if ch.isalpha():
+                code = ord(ch) - 97
+                if not 0 <= code < 26:
+                    raise ValueError(f"cannot encode letter {ch!r}")
+                present[row, code] = True
+    return present
+
+
+def encode_move(move: Move) -> int:
+    """Encode one move: a letter, None for a timeout, anything else invalid."""
+    if move is None:
+        return TIMEOUT
+    move = move.lower()
+    if len(move) == 1 and move in ascii_lowercase:
+        return ord(move) - 97
+    if len(move) == 1 and move.isalpha():
+        return MISS
+    return INVALID
+
+
+def _encode_row(moves: Iterable[Move]) -> list:
+    """Encode a game's moves; repeats of a non-ASCII letter cost nothing."""
+    row, missed = [], set()
+    for move in moves:
+        code = encode_move(move)
+        if code == MISS:
+            letter = move.lower()
+            code = INVALID if letter in missed else MISS
+            missed.add(letter)
+        row.append(code)
+    return row
+
+
+def encode_moves(move_lists: Sequence[Iterable[Move]],
+                 width: Optional[int] = None) -> np.ndarray:
+    """Return an (n, k) int8 matrix of moves padded with PAD."""
+    rows = [_encode_row(moves) for moves in move_lists]
+    width = max((len(row) for row in rows), default=0) if width is None else width  # noqa: E501 pylint: disable= [C0301]
+    encoded = np.full((len(rows), width), PAD, dtype=np.int8)
+    for i, row in enumerate(rows):
+        encoded[i, :len(row)] = row[:width]
+    return encoded
+
+
+def random_moves(n: int, k: int = 26, timeout_rate: float = 0.0,
+                 seed: Optional[int] = None) -> np.ndarray:
+    """Random letter orders for n games with some moves turned into timeouts."""  # noqa: E501 pylint: disable= [C0301]
+    rng = np.random.default_rng(seed)
+    moves = np.argsort(rng.random((n, 26)), axis=1)[:, :k].astype(np.int8)
+    if timeout_rate:
+        moves[rng.random(moves.shape) < timeout_rate] = TIMEOUT
+    return moves
+
+
+def simulate(answers: Union[Sequence[str], np.ndarray], moves: np.ndarray,
+             max_lives: Union[int, np.ndarray] = 6) -> SimulationResult:
+    """Play every game to its end or until its moves run out."""
+    present = answers if isinstance(answers, np.ndarray) else encode_answers(answers)  # noqa: E501 pylint: disable= [C0301]
+    n = present.shape[0]
+    guessed = np.zeros_like(present)
+    remaining = present.sum(axis=1)
+    lives = np.broadcast_to(np.asarray(max_lives, dtype=np.int32), (n,)).copy()  # noqa: E501 pylint: disable= [C0301]
+    status = np.zeros(n, dtype=np.int8)
+    used = np.zeros(n, dtype=np.int32)
+    done = np.zeros(n, dtype=bool)
+    for column in moves.T:
+        active = ~done & (column != PAD)
+        if not active.any():
+            continue
+        rows = np.flatnonzero(active & (column >= 0))
+        letters = column[rows]
+        fresh = ~guessed[rows, letters]
+        rows, letters = rows[fresh], letters[fresh]
+        guessed[rows, letters] = True
+        hit = present[rows, letters]
+        remaining[rows[hit]] -= 1
+        lives[rows[~hit]] -= 1
+        lives[active & ((column == TIMEOUT) | (column == MISS))] -= 1
+        used[active] += 1
+        won = active & (remaining == 0)
+        lost = active & ~won & (lives <= 0)
+        status[won] = WON
+        status[lost] = LOST
+        done |= won | lost
+    return SimulationResult(status, used, lives)
+
+
+def play_scalar(game: HangmanGame, moves: Iterable[Move]) -> Tuple[int, int, int]:  # noqa: E501 pylint: disable= [C0301]
+    """Reference loop over the real game; returns (status, moves used, lives)."""  # noqa: E501 pylint: disable= [C0301]
+    used = 0
+    for move in moves:
+        if move is None:
+            game.time_out()
+        else:
+            game.guess_letter(move)
+        used += 1
+        if game.is_won():
+            return WON, used, game.lives
+        if game.is_lost():
+            return LOST, used, game.lives
+    return PLAYING, used, game.lives
+
+
+def decode_moves(row: np.ndarray) -> list:
+    """Turn one encoded row back into moves for play_scalar."""
+    moves: list = []
+    misses = 0
+    for code in row:
+        if code == PAD:
+            continue
+        if code == TIMEOUT:
+            moves.append(None)
+        elif code == INVALID:
+            moves.append("1")
+        elif code == MISS:
+            moves.append(chr(0x4E00 + misses))  # a fresh non-ASCII letter
+            misses += 1
+        else:
+            moves.append(ascii_lowercase[code])
+    return moves
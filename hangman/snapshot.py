@@ -0,0 +1,87 @@
+"""Compact binary snapshots of HangmanGame state.
+
+A snapshot holds only what is needed to resume a game, never the
+selector. Each game is a fixed 12-byte header followed by its strings
+(all integers little-endian):
+
+    guessed    uint32  bit i set when ascii_lowercase[i] was guessed
+    lives      int16
+    max_lives  int16
+    level      uint8   Level value
+    answer_len uint16  bytes of UTF-8 answer that follow
+    extra_len  uint8   bytes of UTF-8 non-ASCII guesses after the answer
+
+encode_many() packs many games into one buffer behind a b"HSNP" header
+and a count, so parked games can be stored or shipped as a single blob.
+Restoring goes through HangmanGame.from_state, which skips __post_init__.
+"""
+
+import struct
+from typing import Iterable, List, Optional, Tuple, Type
+from hangman.game import HangmanGame, LETTER_BITS, letter_mask, mask_letters  # noqa: E501 pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+
+MAGIC = b"HSNP"
+VERSION = 1
+BULK_HEADER = struct.Struct("<4sBI")
+RECORD = struct.Struct("<IhhBHB")
+
+_LEVELS = {level.value: level for level in Level}
+
+
+def to_bytes(game: HangmanGame) -> bytes:
+    """Snapshot one game."""
+    guessed = game.guessed
+    extra = "".join(sorted(ch for ch in guessed if ch not in LETTER_BITS))
+    answer = game.answer.encode("UTF-8")
+    extra_bytes = extra.encode("UTF-8")
+    return RECORD.pack(letter_mask(guessed), game.lives, game.max_lives,
+                       game.level.value, len(answer),
+                       len(extra_bytes)) + answer + extra_bytes
+
+
+def read_game(buffer, offset: int = 0,
+              selector: Optional[WordSelector] = None,
+              game_cls: Type[HangmanGame] = HangmanGame) -> Tuple[HangmanGame, int]:  # noqa: E501 pylint: disable= [C0301]
+    """Restore the game at offset; return it and the offset after it."""
+    mask, lives, max_lives, level, answer_len, extra_len = RECORD.unpack_from(buffer, offset)  # noqa: E501 pylint: disable= [C0301]
+    start = offset + RECORD.size
+    middle = start + answer_len
+    end = middle + extra_len
+    answer = str(buffer[start:middle], "UTF-8")
+    letters = mask_letters(mask)
+    if extra_len:
+        letters.extend(str(buffer[middle:end], "UTF-8"))
+    game = game_cls.from_state(answer, _LEVELS[level], letters, lives,
+                               max_lives, selector)
+    return game, end
+
+
+def from_bytes(data, selector: Optional[WordSelector] = None,
+               game_cls: Type[HangmanGame] = HangmanGame) -> HangmanGame:
+    """Restore one game from to_bytes() output."""
+    game, end = read_game(data, 0, selector, game_cls)
+    if end != len(data):
+        raise ValueError("trailing bytes after game snapshot")
+    return game
+
+
+def encode_many(games: Iterable[HangmanGame]) -> bytes:
+    """Snapshot many games into one buffer."""
+    records = [to_bytes(game) for game in games]
+    return BULK_HEADER.pack(MAGIC, VERSION, len(records)) + b"".join(records)
+
+
+def decode_many(buffer, selector: Optional[WordSelector] = None,
+                game_cls: Type[HangmanGame] = HangmanGame) -> List[HangmanGame]:  # noqa: E501 pylint: disable= [C0301]
+    """Restore every game from encode_many() output."""
+    magic, version, count = BULK_HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a game snapshot buffer")
+    view = memoryview(buffer)
+    offset = BULK_HEADER.size
+    games = []
+    for _ in range(count):
+        game, offset = read_game(view, offset, selector, game_cls)
+        games.append(game)
+    return games
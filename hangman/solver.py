@@ -0,0 +1,190 @@
+"""Entropy-maximizing solver bot and a driver that reports its win rate.
+
+The solver tracks the words still consistent with a game and guesses the
+letter whose reveal pattern splits them with the highest entropy. The
+candidate groups and their position masks come from hangman.evil, so
+filtering after a guess is a single vectorized comparison. The opening
+guess for each answer shape is the same in every game; those are kept in
+an opening book cached on disk.
+
+The solver requires numpy; the module itself imports without it, so
+FREQUENCY_ORDER can be shared with hosts that lack numpy.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from string import ascii_lowercase
+from typing import Dict, Optional, Sequence
+from hangman.evil import CandidateGroup, index_for  # pylint: disable= [E0401]
+from hangman.game import HangmanGame, MASK_CHAR  # pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+from hangman.source import CACHE_DIR  # pylint: disable= [E0401]
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Letters by frequency in English text; the solver falls back to this
+# order when no known word fits the board.
+FREQUENCY_ORDER = "etaoinsrhldcumfpgwybvkxjqz"
+
+
+def shape_key(masked: str) -> str:
+    """The board with letters hidden, e.g. "____ ____" for a phrase."""
+    return "".join(MASK_CHAR if ch.isalpha() else ch for ch in masked)
+
+
+def entropy(keys: "np.ndarray") -> float:
+    """Shannon entropy in bits of the classes keys splits into."""
+    _, counts = np.unique(keys, return_counts=True)
+    p = counts / len(keys)
+    return float(-(p * np.log2(p)).sum())
+
+
+class OpeningBook:
+    """First guesses per answer shape, persisted as JSON."""
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.moves: Dict[str, str] = {}
+        if self.path and self.path.exists():
+            try:
+                self.moves = json.loads(self.path.read_text())
+            except ValueError:
+                self.moves = {}
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached opening for a shape, if any."""
+        return self.moves.get(key)
+
+    def put(self, key: str, letter: str):
+        """Remember an opening; call save() to persist it."""
+        self.moves[key] = letter
+        self._dirty = True
+
+    def save(self):
+        """Write the book atomically if it changed."""
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.moves, sort_keys=True))
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def book_path(pool: Sequence) -> Path:
+    """Cache file for a pool, named after a digest of its words."""
+    digest = hashlib.sha1()
+    for word in pool:
+        digest.update(word if isinstance(word, bytes) else word.encode("UTF-8"))  # noqa: E501 pylint: disable= [C0301]
+        digest.update(b"\n")
+    return CACHE_DIR / f"openings-{digest.hexdigest()[:16]}.json"
+
+
+class EntropySolver:
+    """Play a HangmanGame by maximizing expected information per guess."""
+    def __init__(self, pool: Sequence, book: Optional[OpeningBook] = None):
+        self.index = index_for(pool)
+        self.book = book if book is not None else OpeningBook()
+
+    @classmethod
+    def for_level(cls, selector: WordSelector, level: Level,
+                  cache: bool = True) -> "EntropySolver":
+        """Solver over a selector's pool with its on-disk opening book."""
+        pool = selector.pool(level)
+        return cls(pool, OpeningBook(book_path(pool) if cache else None))
+
+    def best_letter(self, group: CandidateGroup, candidates: "np.ndarray",
+                    guessed) -> str:
+        """Pick the unguessed letter with the most informative split."""
+        letters = [ch for ch in ascii_lowercase if ch not in guessed]
+        rows = np.array([ord(ch) - 97 for ch in letters])
+        present = (group.masks[rows[:, None], candidates] != 0).sum(axis=1)
+        if len(candidates) == 1:
+            return letters[int(np.argmax(present))]
+        useful = np.flatnonzero(present)
+        scores = [entropy(group.masks[rows[i], candidates]) for i in useful]
+        return letters[int(useful[int(np.argmax(scores))])]
+
+    def opening(self, group: CandidateGroup, key: str) -> str:
+        """First guess for a shape, from the book or computed once."""
+        letter = self.book.get(key)
+        if letter is None:
+            letter = self.best_letter(group, group.all(), ())
+            self.book.put(key, letter)
+        return letter
+
+    def precompute(self):
+        """Fill the opening book for every shape in the pool."""
+        for group in self.index.groups.values():
+            self.opening(group, shape_key(group.words[0]))
+        self.book.save()
+
+    def play(self, game: HangmanGame) -> bool:
+        """Guess through the real game API until it ends; True if won."""
+        board = game.masked()
+        group = self.index.groups.get(
+            (len(board), tuple((i, ch) for i, ch in enumerate(board)
+                               if ch != MASK_CHAR and not ch.isalpha())))
+        candidates = group.all() if group else np.arange(0)
+        fallback = iter(FREQUENCY_ORDER)
+        first = True
+        while not game.is_won() and not game.is_lost():
+            if len(candidates):
+                if first:
+                    letter = self.opening(group, shape_key(board))
+                else:
+                    letter = self.best_letter(group, candidates, game.guessed)
+            else:
+                letter = next(ch for ch in fallback if ch not in game.guessed)
+            first = False
+            game.guess_letter(letter)
+            if len(candidates):
+                board = game.masked()
+                key = sum(1 << i for i, ch in enumerate(board) if ch == letter)
+                row = group.masks[ord(letter) - 97]
+                candidates = candidates[row[candidates] == key]
+        return game.is_won()
+
+
+def run(games: int, level: Level = Level.BASIC, max_lives: int = 6,
+        seed: Optional[int] = None, cache: bool = True) -> Dict[str, float]:
+    """Play games with the solver and report win rate and throughput."""
+    selector = WordSelector(seed=seed)
+    solver = EntropySolver.for_level(selector, level, cache=cache)
+    solver.precompute()
+    wins = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        wins += solver.play(HangmanGame(selector, level, max_lives=max_lives))
+    elapsed = time.perf_counter() - start
+    return {
+        "games": games,
+        "wins": wins,
+        "win_rate": wins / games if games else 0.0,
+        "seconds": elapsed,
+        "games_per_second": games / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    """Run the solver driver from the command line."""
+    parser = argparse.ArgumentParser(description="Entropy solver driver.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--level", default="basic",
+                        choices=[level.name.lower() for level in Level])
+    parser.add_argument("--lives", type=int, default=6)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    report = run(args.games, Level[args.level.upper()], args.lives, args.seed)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
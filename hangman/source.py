@@ -0,0 +1,82 @@
+"""Word sources backed by a local cache and a bundled fallback file."""
+
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+# Directory holding word lists shipped with the package.
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+# Cached downloads live here unless HANGMAN_CACHE_DIR says otherwise.
+CACHE_DIR = Path(os.environ.get("HANGMAN_CACHE_DIR",
+                                Path.home() / ".cache" / "hangman"))
+
+# Setting HANGMAN_OFFLINE=1 skips the download and uses cache or bundle.
+OFFLINE_ENV = "HANGMAN_OFFLINE"
+
+# A cached copy younger than this is used without hitting the network.
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+@dataclass
+class WordSource:
+    """Load a word list from cache, the network or a bundled file."""
+    url: str
+    bundled: Path
+    cache_name: str
+    max_age: float = DEFAULT_MAX_AGE
+    timeout: float = 10
+    cache_dir: Path = CACHE_DIR
+    origin: str = field(default="", init=False)
+
+    @property
+    def cache_path(self) -> Path:
+        """Location of the on-disk cached copy."""
+        return Path(self.cache_dir) / self.cache_name
+
+    def is_fresh(self) -> bool:
+        """Check whether the cached copy exists and is not too old."""
+        try:
+            age = time.time() - self.cache_path.stat().st_mtime
+        except OSError:
+            return False
+        return age < self.max_age
+
+    def load(self) -> List[bytes]:
+        """Return the words, preferring fresh cache, then network."""
+        if self.is_fresh():
+            self.origin = "cache"
+            return self.cache_path.read_bytes().splitlines()
+        if not os.environ.get(OFFLINE_ENV):
+            content = self._download()
+            if content:
+                self._store(content)
+                self.origin = "network"
+                return content.splitlines()
+        if self.cache_path.exists():
+            self.origin = "stale cache"
+            return self.cache_path.read_bytes().splitlines()
+        self.origin = "bundled"
+        return Path(self.bundled).read_bytes().splitlines()
+
+    def _download(self) -> Optional[bytes]:
+        """Fetch the list, returning None when the network fails."""
+        try:
+            import requests  # pylint: disable=import-outside-toplevel
+            response = requests.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return response.content
+
+    def _store(self, content: bytes):
+        """Write the cache atomically so readers never see a partial file."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
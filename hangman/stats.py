@@ -0,0 +1,350 @@
+"""Player and word statistics in a local SQLite database.
+
+A StatsRecorder is a GameObserver: it notices the guess or timeout that
+makes is_won() or is_lost() true and hands one result row to a
+StatsStore. The store buffers rows and writes each batch with a single
+executemany in one transaction, so a busy host pays for one commit per
+batch rather than per game. A timer thread writes a batch that is not yet
+full once its oldest row has waited flush_seconds, so results reach the
+database on an idle host too.
+
+Aggregates are kept up to date by triggers on the results table: every
+inserted row bumps its player's games, wins and streaks and its word's
+games, wins and misses. Player and word lookups are primary-key reads and
+leaderboards walk an index, so no query scans the results table.
+
+The database runs in WAL mode, so readers never block the writer. Each
+process opens its own StatsStore; batches start with BEGIN IMMEDIATE and
+wait up to busy_timeout for another process's batch to commit.
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from hangman.game import GameObserver, GuessResult, HangmanGame  # noqa: E501 pylint: disable= [E0401]
+
+# Rows buffered before a batch is written, and the longest a row waits
+# before a timer writes a partial batch.
+FLUSH_ROWS = 256
+FLUSH_SECONDS = 1.0
+
+# Milliseconds to wait for another writer's transaction.
+BUSY_TIMEOUT = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    lives INTEGER NOT NULL,
+    misses INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    timeouts INTEGER NOT NULL,
+    finished REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    player TEXT PRIMARY KEY,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    streak INTEGER NOT NULL DEFAULT 0,
+    best_streak INTEGER NOT NULL DEFAULT 0,
+    last_finished REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS words (
+    answer TEXT PRIMARY KEY,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS players_by_wins ON players (wins DESC);
+CREATE INDEX IF NOT EXISTS players_by_streak ON players (best_streak DESC);
+CREATE INDEX IF NOT EXISTS words_by_win_rate
+    ON words (CAST(wins AS REAL) / games);
+CREATE TRIGGER IF NOT EXISTS results_aggregate AFTER INSERT ON results
+BEGIN
+    INSERT OR IGNORE INTO players (player) VALUES (NEW.player);
+    UPDATE players SET
+        games = games + 1,
+        wins = wins + NEW.won,
+        streak = CASE WHEN NEW.won THEN streak + 1 ELSE 0 END,
+        best_streak = MAX(best_streak,
+                          CASE WHEN NEW.won THEN streak + 1 ELSE 0 END),
+        last_finished = NEW.finished
+    WHERE player = NEW.player;
+    INSERT OR IGNORE INTO words (answer) VALUES (NEW.answer);
+    UPDATE words SET
+        games = games + 1,
+        wins = wins + NEW.won,
+        misses = misses + NEW.misses
+    WHERE answer = NEW.answer;
+END;
+"""
+
+INSERT = ("INSERT INTO results (player, answer, level, won, lives, misses, "
+          "guesses, timeouts, finished) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+Row = Tuple[str, str, int, int, int, int, int, int, float]
+
+
+@dataclass
+class PlayerStats:
+    """Totals and streaks for one player."""
+    player: str
+    games: int
+    wins: int
+    streak: int
+    best_streak: int
+    last_finished: float
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of games won."""
+        return self.wins / self.games if self.games else 0.0
+
+
+@dataclass
+class WordStats:
+    """How hard one answer has been."""
+    answer: str
+    games: int
+    wins: int
+    misses: int
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of games with this answer that were won."""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def misses_per_game(self) -> float:
+        """Average wrong guesses and timeouts per game."""
+        return self.misses / self.games if self.games else 0.0
+
+
+class StatsStore:
+    """Buffered batch writer and aggregate reader for one database file."""
+    def __init__(self, path, flush_rows: int = FLUSH_ROWS,
+                 flush_seconds: float = FLUSH_SECONDS):
+        self.path = Path(path)
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT / 1000,
+                                   isolation_level=None,
+                                   check_same_thread=False)
+        self._db.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT}")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        # Schema creation is serialized like any other write, so several
+        # processes may open a new database at once.
+        self._db.executescript(f"BEGIN IMMEDIATE;{SCHEMA}COMMIT;")
+        self._lock = threading.Lock()
+        self._pending: List[Row] = []
+        self._oldest = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def add(self, row: Row):
+        """Queue one result; write the batch once it is big or old enough."""
+        with self._lock:
+            if not self._pending:
+                self._oldest = time.monotonic()
+                self._arm()
+            self._pending.append(row)
+            if len(self._pending) >= self.flush_rows or \
+                    time.monotonic() - self._oldest >= self.flush_seconds:
+                self._flush()
+
+    def _arm(self):
+        """Flush a partial batch in the background once it is old enough."""
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_seconds, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _expire(self):
+        """Timer callback: write whatever is still buffered."""
+        with self._lock:
+            self._timer = None
+            if not self._closed:
+                try:
+                    self._flush()
+                finally:
+                    if self._pending:  # the write failed; try again later
+                        self._arm()
+
+    def _flush(self):
+        """Write the pending rows in one transaction; the caller holds the lock."""  # noqa: E501 pylint: disable= [C0301]
+        if not self._pending:
+            return
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.executemany(INSERT, self._pending)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        self._pending.clear()
+
+    def flush(self):
+        """Write every queued result."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Flush and close the database."""
+        with self._lock:
+            if self._closed:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._flush()
+            self._db.close()
+            self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------------- Queries ----------------
+    def player(self, player: str) -> Optional[PlayerStats]:
+        """One player's totals, or None if they never finished a game."""
+        self.flush()
+        row = self._db.execute(
+            "SELECT player, games, wins, streak, best_streak, last_finished "
+            "FROM players WHERE player = ?", (player,)).fetchone()
+        return PlayerStats(*row) if row else None
+
+    def word(self, answer: str) -> Optional[WordStats]:
+        """One answer's totals, or None if it was never played."""
+        self.flush()
+        row = self._db.execute(
+            "SELECT answer, games, wins, misses FROM words WHERE answer = ?",
+            (answer,)).fetchone()
+        return WordStats(*row) if row else None
+
+    def leaderboard(self, limit: int = 10,
+                    by: str = "wins") -> List[PlayerStats]:
+        """Top players by wins or best_streak, read from an index."""
+        if by not in ("wins", "best_streak"):
+            raise ValueError(f"cannot rank players by {by!r}")
+        self.flush()
+        rows = self._db.execute(
+            "SELECT player, games, wins, streak, best_streak, last_finished "
+            f"FROM players ORDER BY {by} DESC LIMIT ?", (limit,))
+        return [PlayerStats(*row) for row in rows]
+
+    def hardest_words(self, limit: int = 10) -> List[WordStats]:
+        """Answers with the lowest win rate, read from an index."""
+        self.flush()
+        rows = self._db.execute(
+            "SELECT answer, games, wins, misses FROM words "
+            "ORDER BY CAST(wins AS REAL) / games LIMIT ?", (limit,))
+        return [WordStats(*row) for row in rows]
+
+    def totals(self) -> Dict[str, int]:
+        """Games and wins over every player."""
+        self.flush()
+        games, wins = self._db.execute(
+            "SELECT COALESCE(SUM(games), 0), COALESCE(SUM(wins), 0) "
+            "FROM players").fetchone()
+        return {"games": games, "wins": wins}
+
+
+class StatsRecorder(GameObserver):
+    """Records each game's outcome the moment it is won or lost.
+
+    Games are credited to player unless assign() named someone else.
+    """
+    def __init__(self, store: StatsStore, player: str = "local"):
+        self.store = store
+        self.player = player
+        self._games: Dict[int, List] = {}
+
+    def assign(self, game: HangmanGame, player: str):
+        """Credit a game to a player."""
+        self._entry(game)[0] = player
+
+    def on_start(self, game: HangmanGame):
+        """Start a fresh entry for the game; assign() may rename its player."""
+        self._track(game)
+
+    def on_guess(self, game: HangmanGame, guess: str, result: GuessResult):
+        """Record the outcome if this guess ended the game."""
+        self._settle(game, self._entry(game))
+
+    def on_timeout(self, game: HangmanGame):
+        """Count the timeout and record the outcome if it ended the game."""
+        entry = self._entry(game)
+        entry[1] += 1
+        self._settle(game, entry)
+
+    def _entry(self, game: HangmanGame) -> List:
+        """The game's [player, timeouts, over] entry, made on first sight."""
+        entry = self._games.get(id(game))
+        return entry if entry is not None else self._track(game)
+
+    def _track(self, game: HangmanGame) -> List:
+        """A fresh entry holding whether the game is already over."""
+        key = id(game)
+        entry = self._games[key] = [self.player, 0,
+                                    game.is_won() or game.is_lost()]
+        # Forget abandoned games, before their id() can be reused.
+        weakref.finalize(game, self._games.pop, key, None)
+        return entry
+
+    def _settle(self, game: HangmanGame, entry: List):
+        """Record the game if the move just made flipped is_won()/is_lost()."""  # noqa: E501 pylint: disable= [C0301]
+        won = game.is_won()
+        over = won or game.is_lost()
+        if over and not entry[2]:
+            self._record(game, entry, won)
+        entry[2] = over
+
+    def _record(self, game: HangmanGame, entry: List, won: bool):
+        """Queue the result row of a game that has just ended.
+
+        Only the move that flips is_won() or is_lost() gets here, so moves
+        made after the end do not count the game twice.
+        """
+        player, timeouts = entry[0], entry[1]
+        self.store.add((player, game.answer, game.level.value, int(won),
+                        game.lives, game.max_lives - game.lives,
+                        len(game.guessed), timeouts, time.time()))
+
+
+def main():
+    """Print leaderboards and the hardest words from a stats database."""
+    parser = argparse.ArgumentParser(description="Hangman player stats.")
+    parser.add_argument("db", type=Path)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--player", help="show one player's stats")
+    parser.add_argument("--word", help="show one answer's stats")
+    args = parser.parse_args()
+    with StatsStore(args.db) as store:
+        if args.player or args.word:
+            found = store.player(args.player) if args.player else store.word(args.word)  # noqa: E501 pylint: disable= [C0301]
+            print(json.dumps(found and {**vars(found), "win_rate": found.win_rate}, indent=2))  # noqa: E501 pylint: disable= [C0301]
+            return
+        print(json.dumps({
+            **store.totals(),
+            "by_wins": [vars(p) for p in store.leaderboard(args.top)],
+            "by_streak": [vars(p) for p in store.leaderboard(args.top, "best_streak")],  # noqa: E501 pylint: disable= [C0301]
+            "hardest": [{**vars(w), "win_rate": w.win_rate}
+                        for w in store.hardest_words(args.top)],
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Compact session store with LRU, idle-TTL and memory-cap eviction."""
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Type
+from hangman.game import HangmanGame, LETTER_BITS, letter_mask, mask_letters  # noqa: E501 pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+
+
+class GameRecord:
+    """Slotted snapshot of a game without its selector or per-game set."""
+    __slots__ = ("answer", "guessed", "extra", "lives", "max_lives",
+                 "level", "last_seen", "charged")
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, answer: str, level: Level, guessed: int = 0,
+                 lives: int = 6, max_lives: int = 6, extra: str = ""):
+        self.answer = answer
+        self.level = level
+        self.guessed = guessed
+        self.extra = extra
+        self.lives = lives
+        self.max_lives = max_lives
+        self.last_seen = 0.0
+        # Bytes the owning SessionStore counts for this record.
+        self.charged = 0
+
+    @classmethod
+    def from_game(cls, game: HangmanGame) -> "GameRecord":
+        """Capture the state of a live game."""
+        guessed = game.guessed
+        extra = "".join(sorted(ch for ch in guessed if ch not in LETTER_BITS))
+        return cls(game.answer, game.level, letter_mask(guessed),
+                   game.lives, game.max_lives, extra)
+
+    def letters(self):
+        """Return the guessed letters as a set."""
+        return set(mask_letters(self.guessed)).union(self.extra)
+
+    def to_game(self, selector: Optional[WordSelector] = None,
+                game_cls: Type[HangmanGame] = HangmanGame) -> HangmanGame:
+        """Rebuild a live game from the record."""
+        return game_cls.from_state(self.answer, self.level, self.letters(),
+                                   self.lives, self.max_lives, selector)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the record and its strings."""
+        return (sys.getsizeof(self) + sys.getsizeof(self.answer)
+                + sys.getsizeof(self.extra) + sys.getsizeof(self.guessed))
+
+
+class SessionStore:
+    """Map session ids to GameRecords with O(1) lookup, insert and evict.
+
+    Records are kept in least-recently-used order. A record is evicted when
+    it has been idle for longer than ttl seconds, when max_sessions is
+    exceeded, or when the estimated footprint goes over max_bytes.
+
+    Records may be changed in place after get(). Each get() re-measures
+    the record it returns, so such a change is counted from the next read
+    of that record, or from the next put().
+    """
+    def __init__(self, max_sessions: Optional[int] = None,
+                 ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._records: "OrderedDict[Hashable, GameRecord]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions: Dict[str, int] = {"lru": 0, "ttl": 0, "memory": 0}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: Hashable) -> bool:
+        record = self._records.get(key)
+        return record is not None and not self._expired(record, self.clock())
+
+    def get(self, key: Hashable, touch: bool = True) -> Optional[GameRecord]:
+        """Return the record for key, or None if missing or expired.
+
+        Expired records are purged, and the record is re-measured; with
+        touch it also counts as used now.
+        """
+        record = self._records.get(key)
+        if record is not None and self._expired(record, self.clock()):
+            self._drop(key, "ttl")
+            record = None
+        if record is None:
+            self.misses += 1
+            self.evict()
+            return None
+        self.hits += 1
+        if touch:
+            record.last_seen = self.clock()
+            self._records.move_to_end(key)
+        self._charge(record)
+        self.evict()
+        return record
+
+    def put(self, key: Hashable, record: GameRecord):
+        """Insert or replace a record and evict whatever no longer fits."""
+        self.discard(key)
+        record.last_seen = self.clock()
+        self._records[key] = record
+        record.charged = 0
+        self._charge(record)
+        self.evict()
+
+    def put_game(self, key: Hashable, game: HangmanGame):
+        """Store a compact record of a live game."""
+        self.put(key, GameRecord.from_game(game))
+
+    def discard(self, key: Hashable) -> Optional[GameRecord]:
+        """Remove a record without counting it as an eviction."""
+        record = self._records.pop(key, None)
+        if record is not None:
+            self._bytes -= record.charged
+            record.charged = 0
+        return record
+
+    def _charge(self, record: GameRecord):
+        """Count the record's current size in place of its old one."""
+        size = record.nbytes()
+        self._bytes += size - record.charged
+        record.charged = size
+
+    def evict(self):
+        """Drop idle records, then the least recently used ones over a cap."""
+        now = self.clock()
+        while self._records:
+            key, oldest = next(iter(self._records.items()))
+            if self._expired(oldest, now):
+                self._drop(key, "ttl")
+            elif self.max_sessions is not None and len(self._records) > self.max_sessions:  # noqa: E501 pylint: disable= [C0301]
+                self._drop(key, "lru")
+            elif self.max_bytes is not None and self._bytes > self.max_bytes:
+                self._drop(key, "memory")
+            else:
+                break
+
+    def _expired(self, record: GameRecord, now: float) -> bool:
+        """Check whether a record has been idle for longer than the TTL."""
+        return self.ttl is not None and now - record.last_seen > self.ttl
+
+    def _drop(self, key: Hashable, reason: str):
+        """Evict a record and count why."""
+        self.discard(key)
+        self.evictions[reason] += 1
+
+    def metrics(self) -> Dict[str, int]:
+        """Resident sessions, estimated bytes, hit/miss and eviction counts."""
+        return {
+            "resident": len(self._records),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            **{f"evicted_{reason}": count
+               for reason, count in self.evictions.items()},
+        }
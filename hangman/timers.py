@@ -0,0 +1,253 @@
+"""Hierarchical timing wheel for per-guess deadlines of many games.
+
+Deadlines are absolute times on a monotonic clock, so a countdown never
+drifts however late its host gets to run. A TimingWheel buckets them by
+tick (``resolution`` seconds) into ``levels`` wheels of ``slots`` slots
+each; level L slots span slots**L ticks and move their timers one level
+down when the wheel reaches them. Arming a timer is one dict insert and
+cancelling it one dict delete, whatever the number of pending timers.
+
+A timer never fires before its deadline and fires on the first tick at
+or after it. The wheel does not run itself: a host calls advance(), or a
+WheelDriver wakes it through the host's own ``after`` function (Tk's
+root.after, asyncio's loop.call_later) only when a timer is due.
+"""
+
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Seconds per tick, and the wheel shape: 256**4 ticks of 10 ms is over a
+# year, and anything further out waits in the top level until it fits.
+RESOLUTION = 0.01
+SLOT_BITS = 8
+LEVELS = 4
+
+
+class Timer:
+    """A pending call; cancel() it to stop it from firing."""
+    __slots__ = ("deadline", "callback", "args", "_due", "_level", "_slot",
+                 "_wheel")
+
+    def __init__(self, wheel: "TimingWheel", deadline: float,
+                 callback: Callable[..., Any], args: tuple, due: int):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self._due = due
+        self._level = 0
+        self._slot: Optional[Dict["Timer", None]] = None
+        self._wheel = wheel
+
+    @property
+    def pending(self) -> bool:
+        """Whether the timer is still waiting to fire."""
+        return self._slot is not None
+
+    def cancel(self):
+        """Stop the timer; does nothing once it fired or was cancelled."""
+        slot = self._slot
+        if slot is not None:
+            del slot[self]
+            self._slot = None
+            self._wheel._unlink(self)  # pylint: disable=protected-access
+
+
+class TimingWheel:
+    """Monotonic deadlines with O(1) arm and cancel."""
+    def __init__(self, resolution: float = RESOLUTION,
+                 slot_bits: int = SLOT_BITS, levels: int = LEVELS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.resolution = resolution
+        self.clock = clock
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels: List[List[Dict[Timer, None]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self._span = 1 << (slot_bits * levels)
+        self._origin = clock()
+        self._tick = 0
+        self._count = 0
+        self._level_counts = [0] * levels
+
+    def __len__(self) -> int:
+        return self._count
+
+    def now(self) -> float:
+        """Current time on the wheel's clock."""
+        return self.clock()
+
+    def call_at(self, deadline: float, callback: Callable[..., Any],
+                *args) -> Timer:
+        """Call callback(*args) once deadline has passed."""
+        due = max(math.ceil((deadline - self._origin) / self.resolution),
+                  self._tick + 1)
+        timer = Timer(self, deadline, callback, args, due)
+        self._place(timer, self._tick)
+        self._count += 1
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[..., Any],
+                   *args) -> Timer:
+        """Call callback(*args) after delay seconds."""
+        return self.call_at(self.clock() + delay, callback, *args)
+
+    def _place(self, timer: Timer, tick: int):
+        """Put timer in the lowest level whose range reaches its tick."""
+        delta = timer._due - tick  # pylint: disable=protected-access
+        due = timer._due  # pylint: disable=protected-access
+        if delta >= self._span:
+            due = tick + self._span - 1
+            delta = self._span - 1
+        level = 0
+        while delta >> (self._bits * (level + 1)):
+            level += 1
+        slot = self._levels[level][(due >> (self._bits * level)) & self._mask]  # noqa: E501 pylint: disable= [C0301]
+        slot[timer] = None
+        timer._slot = slot  # pylint: disable=protected-access
+        timer._level = level  # pylint: disable=protected-access
+        self._level_counts[level] += 1
+
+    def _unlink(self, timer: Timer):
+        """Account for a timer that left its slot."""
+        self._count -= 1
+        self._level_counts[timer._level] -= 1  # pylint: disable=protected-access
+
+    def _cascade(self, tick: int):
+        """Move timers from each higher level that reaches tick down."""
+        for level in range(len(self._levels) - 1, 0, -1):
+            shift = self._bits * level
+            if tick & ((1 << shift) - 1):
+                continue
+            slot = self._levels[level][(tick >> shift) & self._mask]
+            if slot:
+                timers = list(slot)
+                slot.clear()
+                self._level_counts[level] -= len(timers)
+                for timer in timers:
+                    self._place(timer, tick)
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Fire every timer whose deadline is at or before now.
+
+        Returns how many fired. Ticks with nothing pending are skipped a
+        whole slot range at a time, so a long pause costs little.
+        """
+        now = self.clock() if now is None else now
+        # The epsilon keeps float rounding from holding back a tick that
+        # is due now.
+        target = math.floor((now - self._origin) / self.resolution + 1e-9)
+        fired = 0
+        while self._tick < target:
+            if not self._count:
+                self._tick = target
+                break
+            level = 0
+            while not self._level_counts[level]:
+                level += 1
+            if level:
+                step = 1 << (self._bits * level)
+                boundary = (self._tick // step + 1) * step
+                if boundary > target:
+                    self._tick = target
+                    break
+                self._tick = boundary - 1
+            self._tick += 1
+            self._cascade(self._tick)
+            slot = self._levels[0][self._tick & self._mask]
+            while slot:
+                timer = next(iter(slot))
+                del slot[timer]
+                timer._slot = None  # pylint: disable=protected-access
+                self._unlink(timer)
+                fired += 1
+                timer.callback(*timer.args)
+        return fired
+
+    def next_wakeup(self) -> Optional[float]:
+        """When advance() next has work: a due timer or a cascade.
+
+        None when nothing is pending. Scans at most one turn of level 0.
+        """
+        if not self._count:
+            return None
+        level = 0
+        while not self._level_counts[level]:
+            level += 1
+        if level:
+            step = 1 << (self._bits * level)
+            return self._origin + (self._tick // step + 1) * step * self.resolution  # noqa: E501 pylint: disable= [C0301]
+        for tick in range(self._tick + 1, self._tick + 2 + self._mask):
+            if self._levels[0][tick & self._mask] or not tick & self._mask:
+                break
+        return self._origin + tick * self.resolution  # pylint: disable=undefined-loop-variable
+
+
+class WheelDriver:
+    """Run a TimingWheel from a host's one-shot ``after`` callback.
+
+    ``after(delay, func)`` must call func about delay seconds later and
+    return something ``cancel`` accepts. Only one host callback is ever
+    pending, woken for the earliest due timer.
+    """
+    def __init__(self, wheel: TimingWheel,
+                 after: Callable[[float, Callable[[], None]], Any],
+                 cancel: Callable[[Any], None]):
+        self.wheel = wheel
+        self._after = after
+        self._cancel = cancel
+        self._job = None
+        self._wake_at: Optional[float] = None
+
+    @classmethod
+    def for_tk(cls, root, wheel: Optional[TimingWheel] = None) -> "WheelDriver":  # noqa: E501 pylint: disable= [C0301]
+        """Drive a wheel from a Tk root's event loop."""
+        return cls(wheel or TimingWheel(),
+                   lambda delay, func: root.after(math.ceil(delay * 1000), func),  # noqa: E501 pylint: disable= [C0301]
+                   root.after_cancel)
+
+    @classmethod
+    def for_asyncio(cls, loop, wheel: Optional[TimingWheel] = None) -> "WheelDriver":  # noqa: E501 pylint: disable= [C0301]
+        """Drive a wheel from an asyncio loop, on the loop's clock."""
+        return cls(wheel or TimingWheel(clock=loop.time), loop.call_later,
+                   lambda handle: handle.cancel())
+
+    def now(self) -> float:
+        """Current time on the wheel's clock."""
+        return self.wheel.clock()
+
+    def call_at(self, deadline: float, callback: Callable[..., Any],
+                *args) -> Timer:
+        """Arm a timer and make sure the host wakes up for it."""
+        timer = self.wheel.call_at(deadline, callback, *args)
+        if self._wake_at is None or deadline < self._wake_at:
+            self._schedule()
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[..., Any],
+                   *args) -> Timer:
+        """Arm a timer delay seconds from now."""
+        return self.call_at(self.now() + delay, callback, *args)
+
+    def _schedule(self):
+        """Replace the pending host callback with one for the next wakeup."""
+        if self._job is not None:
+            self._cancel(self._job)
+            self._job = None
+        self._wake_at = self.wheel.next_wakeup()
+        if self._wake_at is not None:
+            self._job = self._after(max(0.0, self._wake_at - self.now()),
+                                    self._run)
+
+    def _run(self):
+        """Host callback: fire due timers, then sleep until the next."""
+        self._job = None
+        self.wheel.advance()
+        self._schedule()
+
+    def stop(self):
+        """Drop the pending host callback; timers stay armed."""
+        if self._job is not None:
+            self._cancel(self._job)
+        self._job = None
+        self._wake_at = None
@@ -0,0 +1,282 @@
+"""Tournaments between guessing bots over word pools, on every core.
+
+Each matchup (a bot on a level's pool) is split into batches that run on
+a process pool. Batch k of n plays shard k of the pool's seeded order
+(see hangman.scheduler), so batches never repeat a word within a pass,
+and every bot meets the same words for a given seed. A batch returns
+only its totals, which are merged into the standings as they arrive, so
+memory does not grow with the number of games.
+
+Run with ``python -m hangman.tournament --bots frequency entropy``; the
+report is JSON with win rates per matchup and games/sec per worker.
+"""
+
+import argparse
+import json
+import os
+import random
+import secrets
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from string import ascii_lowercase
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from hangman.game import HangmanGame  # pylint: disable= [E0401]
+from hangman.scheduler import splitmix64  # pylint: disable= [E0401]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+from hangman.solver import FREQUENCY_ORDER  # pylint: disable= [E0401]
+from hangman.source import OFFLINE_ENV  # pylint: disable= [E0401]
+
+# Games per batch: big enough to amortise process hand-off, small enough
+# to keep every worker busy to the end.
+BATCH_GAMES = 500
+
+# A bot factory takes (selector, level, seed) and returns an object whose
+# play(game) guesses until the game ends and returns True if it won.
+BotFactory = Callable[[WordSelector, Level, int], object]
+BOTS: Dict[str, BotFactory] = {}
+
+
+def bot(name: str):
+    """Register a bot factory under name."""
+    def register(factory: BotFactory) -> BotFactory:
+        BOTS[name] = factory
+        return factory
+    return register
+
+
+class LetterOrderBot:  # pylint: disable=too-few-public-methods
+    """Guess letters in a fixed order."""
+    def __init__(self, order: str):
+        self.order = order
+
+    def play(self, game: HangmanGame) -> bool:
+        """Guess through the order until the game ends; True if won."""
+        for letter in self.order:
+            if game.is_won() or game.is_lost():
+                break
+            game.guess_letter(letter)
+        return game.is_won()
+
+
+@bot("frequency")
+def frequency_bot(_selector: WordSelector, _level: Level, _seed: int):
+    """Letters by English frequency."""
+    return LetterOrderBot(FREQUENCY_ORDER)
+
+
+class RandomOrderBot(LetterOrderBot):  # pylint: disable=too-few-public-methods
+    """Guess letters in a new random order every game."""
+    def __init__(self, seed: int):
+        super().__init__(ascii_lowercase)
+        self.rng = random.Random(seed)
+
+    def play(self, game: HangmanGame) -> bool:
+        """Shuffle the order, then play it."""
+        self.order = "".join(self.rng.sample(ascii_lowercase, 26))
+        return super().play(game)
+
+
+@bot("random")
+def random_bot(_selector: WordSelector, _level: Level, seed: int):
+    """A fresh random letter order every game."""
+    return RandomOrderBot(seed)
+
+
+@bot("entropy")
+def entropy_bot(selector: WordSelector, level: Level, _seed: int):
+    """The entropy solver from hangman.solver (needs numpy)."""
+    from hangman.solver import EntropySolver  # noqa: E501 pylint: disable=import-outside-toplevel
+    return EntropySolver.for_level(selector, level)
+
+
+@dataclass
+class Batch:
+    """One unit of work: a bot playing a shard of a pool."""
+    bot: str
+    level: Level
+    seed: int
+    shard: int
+    shards: int
+    games: int
+    max_lives: int = 6
+
+
+@dataclass
+class BatchResult:
+    """Totals from one batch; all a worker sends back."""
+    bot: str
+    level: Level
+    games: int
+    wins: int
+    guesses: int
+    misses: int
+    seconds: float
+    worker: int
+
+
+@dataclass
+class Tally:
+    """Running totals for one matchup or one worker."""
+    games: int = 0
+    wins: int = 0
+    guesses: int = 0
+    misses: int = 0
+    seconds: float = 0.0
+    batches: int = 0
+
+    def add(self, result: BatchResult):
+        """Fold one batch result in."""
+        self.games += result.games
+        self.wins += result.wins
+        self.guesses += result.guesses
+        self.misses += result.misses
+        self.seconds += result.seconds
+        self.batches += 1
+
+
+@dataclass
+class Standings:
+    """Streaming aggregate of batch results."""
+    matchups: Dict[Tuple[str, Level], Tally] = field(default_factory=dict)
+    workers: Dict[int, Tally] = field(default_factory=dict)
+
+    def add(self, result: BatchResult):
+        """Merge one result as it arrives."""
+        self.matchups.setdefault((result.bot, result.level), Tally()).add(result)  # noqa: E501 pylint: disable= [C0301]
+        self.workers.setdefault(result.worker, Tally()).add(result)
+
+    def report(self) -> dict:
+        """Win rates per matchup and throughput per worker."""
+        return {
+            "matchups": [{
+                "bot": name,
+                "level": level.name.lower(),
+                "games": tally.games,
+                "win_rate": tally.wins / tally.games if tally.games else 0.0,
+                "guesses_per_game": tally.guesses / tally.games if tally.games else 0.0,  # noqa: E501 pylint: disable= [C0301]
+                "misses_per_game": tally.misses / tally.games if tally.games else 0.0,  # noqa: E501 pylint: disable= [C0301]
+            } for (name, level), tally in sorted(
+                self.matchups.items(), key=lambda item: (item[0][1].value, item[0][0]))],  # noqa: E501 pylint: disable= [C0301]
+            "workers": [{
+                "worker": worker,
+                "batches": tally.batches,
+                "games": tally.games,
+                "games_per_second": tally.games / tally.seconds if tally.seconds else 0.0,  # noqa: E501 pylint: disable= [C0301]
+            } for worker, tally in sorted(self.workers.items())],
+        }
+
+
+def run_batch(batch: Batch) -> BatchResult:
+    """Play one batch; runs inside a worker process."""
+    selector = WordSelector(seed=batch.seed, shard=batch.shard,
+                            shards=batch.shards)
+    player = BOTS[batch.bot](selector, batch.level,
+                             splitmix64(batch.seed ^ batch.shard))
+    wins = guesses = misses = 0
+    start = time.perf_counter()
+    for _ in range(batch.games):
+        game = HangmanGame(selector, batch.level, max_lives=batch.max_lives)
+        wins += player.play(game)
+        guesses += len(game.guessed)
+        misses += batch.max_lives - game.lives
+    return BatchResult(batch.bot, batch.level, batch.games, wins, guesses,
+                       misses, time.perf_counter() - start, os.getpid())
+
+
+def plan(bots: Iterable[str], levels: Iterable[Level], games: int, seed: int,
+         max_lives: int = 6, batch_games: int = BATCH_GAMES) -> Iterator[Batch]:  # noqa: E501 pylint: disable= [C0301]
+    """Split every matchup into batches over shards of its pool."""
+    levels = list(levels)
+    sizes = {level: len(WordSelector().pool(level)) for level in levels}
+    for level in levels:
+        shards = max(1, min(-(-games // batch_games), sizes[level]))
+        for name in bots:
+            for shard in range(shards):
+                count = games // shards + (shard < games % shards)
+                if count:
+                    yield Batch(name, level, seed, shard, shards, count,
+                                max_lives)
+
+
+def _warm_up(bots: Iterable[str], levels: Iterable[Level]):
+    """Build the entropy solver's opening books once, before forking."""
+    if "entropy" in bots:
+        from hangman.solver import EntropySolver  # noqa: E501 pylint: disable=import-outside-toplevel
+        for level in levels:
+            EntropySolver.for_level(WordSelector(), level).precompute()
+
+
+def play_batches(batches: Iterable[Batch],
+                 workers: Optional[int] = None) -> Iterator[BatchResult]:
+    """Yield batch results in completion order.
+
+    workers=1 plays in this process. Otherwise at most two batches per
+    worker are in flight, so a huge plan is never queued all at once.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(run_batch, batches)
+        return
+    batches = iter(batches)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        while True:
+            for batch in batches:
+                pending.add(pool.submit(run_batch, batch))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def run(bots: List[str], levels: List[Level], games: int,
+        seed: Optional[int] = None, workers: Optional[int] = None,
+        max_lives: int = 6, batch_games: int = BATCH_GAMES) -> dict:
+    """Play a tournament and return the report."""
+    unknown = [name for name in bots if name not in BOTS]
+    if unknown:
+        raise ValueError(f"unknown bots: {', '.join(unknown)}")
+    seed = secrets.randbits(64) if seed is None else seed
+    workers = workers or os.cpu_count() or 1
+    _warm_up(bots, levels)
+    standings = Standings()
+    start = time.perf_counter()
+    for result in play_batches(plan(bots, levels, games, seed, max_lives,
+                                    batch_games), workers):
+        standings.add(result)
+    elapsed = time.perf_counter() - start
+    report = standings.report()
+    total = sum(tally.games for tally in standings.matchups.values())
+    report.update(seed=seed, processes=workers, games=total, seconds=elapsed,
+                  games_per_second=total / elapsed if elapsed else 0.0)
+    return report
+
+
+def main(argv=None):
+    """Run a tournament from the command line."""
+    parser = argparse.ArgumentParser(description="Hangman bot tournament.")
+    parser.add_argument("--bots", nargs="+", default=["frequency", "random"],
+                        choices=sorted(BOTS))
+    parser.add_argument("--levels", nargs="+", default=["basic"],
+                        choices=[level.name.lower() for level in Level])
+    parser.add_argument("--games", type=int, default=10_000,
+                        help="games per bot and level")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes (default: one per core)")
+    parser.add_argument("--batch", type=int, default=BATCH_GAMES,
+                        help="games per batch")
+    parser.add_argument("--lives", type=int, default=6)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    os.environ.setdefault(OFFLINE_ENV, "1")
+    report = run(args.bots, [Level[name.upper()] for name in args.levels],
+                 args.games, args.seed, args.workers, args.lives, args.batch)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
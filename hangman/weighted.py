@@ -0,0 +1,303 @@
+"""Weighted word picking with Walker alias tables.
+
+An AliasTable (Vose's construction) samples an index in proportion to
+its weight with one random number and two array reads, after O(n) work
+to build it. WeightedPool keeps one over a pool's words and absorbs
+weight changes without rebuilding on every update:
+
+* a lowered weight is handled by rejection: an index drawn from the
+  table is kept with probability new / old weight;
+* a raised weight adds its extra to a short side list, drawn from with
+  probability extra mass / total mass.
+
+Both are exact, so picks always follow the current weights. The table is
+rebuilt on the next pick once half of its mass has been taken away
+(which keeps the expected draws per pick below two) or once the side
+list outgrows about sqrt(n) entries. A rebuild only visits indices whose
+weight is non-zero, so a pass that zeroes every word it picks costs O(n)
+in rebuilds overall, O(1) per pick.
+
+WeightedWordSelector is a WordSelector built on it: words are drawn by a
+weight function (frequency, difficulty, ...) and a word's weight is
+multiplied by seen_factor once it has been picked, so fresh words come up
+first. Picks are reproducible for a given seed.
+"""
+
+import math
+import random
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence, Set  # noqa: E501 pylint: disable= [C0301]
+from hangman.selector import Level, WordSelector  # pylint: disable= [E0401]
+
+# Rebuild once the table's surviving mass falls below this fraction.
+REBUILD_FRACTION = 0.5
+
+# Smallest side list of raised weights allowed before a rebuild.
+MIN_BOOSTED = 16
+
+# Weight multiplier for a word once it has been picked.
+SEEN_FACTOR = 0.25
+
+
+class AliasTable:
+    """Sample range(len(weights)) in proportion to weights in O(1)."""
+    __slots__ = ("size", "total", "_prob", "_alias")
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        total = math.fsum(weights)
+        if size == 0 or total <= 0:
+            raise ValueError("cannot sample from weights that sum to zero")
+        self.size = size
+        self.total = total
+        self._prob = array("d", [1.0]) * size
+        self._alias = array("L", range(size))
+        scaled = [weight * size / total for weight in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1 up to rounding and keeps prob 1.0.
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw one index."""
+        u = rng.random() * self.size
+        i = min(int(u), self.size - 1)
+        return i if u - i < self._prob[i] else self._alias[i]
+
+
+class WeightedPool:
+    """Indices drawn by weights that may change between picks."""
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, weights: Iterable[float],
+                 rebuild_fraction: float = REBUILD_FRACTION,
+                 boost_limit: Optional[int] = None):
+        self._weights = array("d", weights)
+        for weight in self._weights:
+            _check(weight)
+        self.rebuild_fraction = rebuild_fraction
+        self.boost_limit = boost_limit if boost_limit is not None else max(
+            MIN_BOOSTED, math.isqrt(len(self._weights)))
+        self.rebuilds = 0
+        # Table weight of each index; zero outside the live indices.
+        self._base = array("d", bytes(8 * len(self._weights)))
+        self._live = array("L", (i for i, w in enumerate(self._weights) if w > 0))  # noqa: E501 pylint: disable= [C0301]
+        self._boosted: Dict[int, float] = {}
+        self._boost_total = 0.0
+        self._table = _EMPTY
+        self._kept = 0.0
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def weight(self, index: int) -> float:
+        """The current weight of an index."""
+        return self._weights[index]
+
+    @property
+    def total(self) -> float:
+        """Sum of the current weights."""
+        return self._kept + self._boost_total
+
+    def probability(self, index: int) -> float:
+        """The chance the next pick is index."""
+        total = self.total
+        return self._weights[index] / total if total > 0 else 0.0
+
+    def set_weight(self, index: int, weight: float):
+        """Change one weight; the table catches up on a later pick."""
+        _check(weight)
+        old = self._weights[index]
+        base = self._base[index]
+        self._weights[index] = weight
+        self._kept += min(weight, base) - min(old, base)
+        extra = weight - base
+        if extra > 0:
+            self._boost_total += extra - self._boosted.get(index, 0.0)
+            self._boosted[index] = extra
+        elif index in self._boosted:
+            self._boost_total -= self._boosted.pop(index)
+
+    def pick(self, rng: random.Random) -> int:
+        """Draw an index with probability weight / total."""
+        if len(self._boosted) > self.boost_limit or \
+                self._kept < self.rebuild_fraction * self._table.total:
+            self._rebuild()
+        total = self._kept + self._boost_total
+        if total <= 0:
+            raise ValueError("every weight in the pool is zero")
+        point = rng.random() * total
+        if point >= self._kept and self._boosted:
+            point -= self._kept
+            for index, extra in self._boosted.items():
+                point -= extra
+                if point < 0:
+                    return index
+            return index  # rounding left a sliver past the last entry
+        live, weights, base = self._live, self._weights, self._base
+        while True:
+            index = live[self._table.sample(rng)]
+            weight, old = weights[index], base[index]
+            if weight > 0 and (weight >= old or rng.random() * old < weight):
+                return index
+
+    def _rebuild(self):
+        """Build a fresh table over the indices whose weight is non-zero."""
+        weights, base = self._weights, self._base
+        live = [i for i in self._live if weights[i] > 0]
+        live += [i for i in self._boosted if base[i] == 0 and weights[i] > 0]  # noqa: E501 pylint: disable= [C0301]
+        for i in self._live:
+            base[i] = 0.0
+        for i in live:
+            base[i] = weights[i]
+        self._live = array("L", live)
+        self._boosted = {}
+        self._boost_total = 0.0
+        if live:
+            self._table = AliasTable([weights[i] for i in live])
+            self._kept = self._table.total
+        else:
+            self._table = _EMPTY
+            self._kept = 0.0
+        self.rebuilds += 1
+
+
+class _Empty:
+    """Stands in for the table of a pool whose weights are all zero."""
+    total = 0.0
+
+
+_EMPTY = _Empty()
+
+
+def _check(weight: float):
+    """Reject weights the tables cannot hold."""
+    if not weight >= 0 or math.isinf(weight):
+        raise ValueError(f"weight must be finite and non-negative, not {weight}")  # noqa: E501 pylint: disable= [C0301]
+
+
+def from_counts(counts: Mapping[str, float],
+                default: float = 1.0) -> Callable[[str], float]:
+    """Weight words by a frequency table, e.g. corpus occurrence counts."""
+    return lambda word: counts.get(word, default)
+
+
+def from_difficulty(scores: Mapping[str, int],
+                    bias: float = 1.0) -> Callable[[str], float]:
+    """Weight words by hangman.difficulty scores; bias < 0 favours easy ones."""  # noqa: E501 pylint: disable= [C0301]
+    return lambda word: (1 + scores.get(word, 0)) ** bias
+
+
+@dataclass
+class WeightedWordSelector(WordSelector):
+    """Pick words at random in proportion to a weight function.
+
+    weight maps a word to its base weight (every word weighs 1 without
+    one). Once picked, or passed to mark_seen, a word weighs base times
+    seen_factor; when nothing unseen is left with any weight, every word
+    is fresh again. Picks are reproducible for a given seed.
+    """
+    weight: Optional[Callable[[str], float]] = None
+    seen_factor: float = SEEN_FACTOR
+    _levels: Dict[Level, "_LevelState"] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.shards != 1:
+            raise ValueError("weighted picks cannot be sharded; give each worker its own seed")  # noqa: E501 pylint: disable= [C0301]
+        _check(self.seen_factor)
+
+    def pick_a_word(self, level: Level) -> str:
+        """Draw a word of the level by its current weight."""
+        pool = self.pool(level)
+        with self._lock:
+            state = self._state(level, pool)
+            try:
+                index = state.pool.pick(state.rng)
+            except ValueError:
+                if not state.seen:
+                    raise
+                state.refresh()
+                index = state.pool.pick(state.rng)
+            state.see(index, self.seen_factor)
+        return _text(pool[index])
+
+    def set_weight(self, level: Level, word: str, weight: float):
+        """Change a word's base weight, e.g. from fresh difficulty stats."""
+        _check(weight)
+        pool = self.pool(level)
+        with self._lock:
+            state = self._state(level, pool)
+            index = state.index(pool)[word]
+            state.base[index] = weight
+            factor = self.seen_factor if index in state.seen else 1.0
+            state.pool.set_weight(index, weight * factor)
+
+    def mark_seen(self, level: Level, words: Iterable[str]):
+        """Treat words as already picked, e.g. a player's history."""
+        pool = self.pool(level)
+        with self._lock:
+            state = self._state(level, pool)
+            index = state.index(pool)
+            for word in words:
+                if word in index:
+                    state.see(index[word], self.seen_factor)
+
+    def probability(self, level: Level, word: str) -> float:
+        """The chance the next pick of the level is word."""
+        pool = self.pool(level)
+        with self._lock:
+            state = self._state(level, pool)
+            return state.pool.probability(state.index(pool)[word])
+
+    def _state(self, level: Level, pool: Sequence) -> "_LevelState":
+        """The level's weights, rebuilt if its pool changed size; the caller holds the lock."""  # noqa: E501 pylint: disable= [C0301]
+        state = self._levels.get(level)
+        if state is None or len(state.base) != len(pool):
+            if self.weight is None:
+                base = array("d", [1.0]) * len(pool)
+            else:
+                base = array("d", (self.weight(_text(word)) for word in pool))  # noqa: E501 pylint: disable= [C0301]
+            seed = None if self.seed is None else hash((self.seed, level.value))  # noqa: E501 pylint: disable= [C0301]
+            state = _LevelState(base, random.Random(seed))
+            self._levels[level] = state
+        return state
+
+
+class _LevelState:
+    """One level's base weights, seen words and pool."""
+    def __init__(self, base: array, rng: random.Random):
+        self.base = base
+        self.rng = rng
+        self.seen: Set[int] = set()
+        self.pool = WeightedPool(base)
+        self._index: Optional[Dict[str, int]] = None
+
+    def index(self, pool: Sequence) -> Dict[str, int]:
+        """Word to position, built on first use."""
+        if self._index is None:
+            self._index = {_text(word): i for i, word in enumerate(pool)}
+        return self._index
+
+    def see(self, index: int, factor: float):
+        """Scale a word's weight down the first time it is seen."""
+        if factor != 1.0 and index not in self.seen:
+            self.seen.add(index)
+            self.pool.set_weight(index, self.base[index] * factor)
+
+    def refresh(self):
+        """Start over with every word fresh."""
+        self.seen.clear()
+        self.pool = WeightedPool(self.base)
+
+
+def _text(word) -> str:
+    """A pool entry as str; basic pools hold bytes."""
+    return word.decode("UTF-8") if isinstance(word, bytes) else word
+
@@ -0,0 +1,112 @@
+"""Compact memory-mapped word index shared read-only between processes.
+
+File layout (all integers little-endian):
+
+    magic   4 bytes  b"HWIX"
+    version uint32
+    count   uint64
+    offsets (count + 1) x uint64, relative to the start of the blob
+    blob    the words concatenated without separators
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Iterable, Union
+
+MAGIC = b"HWIX"
+VERSION = 1
+HEADER = struct.Struct("<4sIQ")
+OFFSET = struct.Struct("<Q")
+PAIR = struct.Struct("<QQ")
+
+
+def build_index(words: Iterable[Union[str, bytes]], dst) -> int:
+    """Write words to an index file at dst and return the word count."""
+    dst = Path(dst)
+    count = 0
+    position = 0
+    with tempfile.TemporaryFile() as offsets, \
+            tempfile.TemporaryFile() as blob:
+        offsets.write(OFFSET.pack(0))
+        for word in words:
+            if isinstance(word, str):
+                word = word.encode("UTF-8")
+            word = word.strip()
+            if not word:
+                continue
+            blob.write(word)
+            position += len(word)
+            offsets.write(OFFSET.pack(position))
+            count += 1
+        tmp = dst.with_suffix(dst.suffix + ".tmp")
+        with open(tmp, "wb") as out:
+            out.write(HEADER.pack(MAGIC, VERSION, count))
+            for part in (offsets, blob):
+                part.seek(0)
+                while chunk := part.read(1 << 20):
+                    out.write(chunk)
+        os.replace(tmp, dst)
+    return count
+
+
+def build_index_from_file(src, dst) -> int:
+    """Build an index from a plain wordlist with one word per line."""
+    with open(src, "rb") as lines:
+        return build_index(lines, dst)
+
+
+class WordIndex:
+    """A read-only sequence of words backed by a memory-mapped index."""
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a word index")
+        self._blob = HEADER.size + OFFSET.size * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        """Return the i-th word in O(1) without touching the others."""
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        start, end = PAIR.unpack_from(self._mm, HEADER.size + OFFSET.size * i)
+        return self._mm[self._blob + start:self._blob + end]
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def close(self):
+        """Release the memory map."""
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    """Build a word index from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("src", help="plain wordlist, one word per line")
+    parser.add_argument("dst", help="index file to write")
+    args = parser.parse_args()
+    count = build_index_from_file(args.src, args.dst)
+    print(f"Wrote {count} words to {args.dst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Unit tests for the micro-benchmark suite."""
+
+import unittest
+from hangman import bench
+
+
+class TestBench(unittest.TestCase):
+    """Unit tests for benchmark registration, measuring and comparing."""
+    def test_cases_cover_hot_paths(self):
+        """Test that both engines and both levels are benchmarked."""
+        for name in ("selector.pick_a_word[BASIC]",
+                     "selector.pick_a_word[INTERMEDIATE]",
+                     "HangmanGame.guess_letter", "BitmaskGame.playthrough"):
+            self.assertIn(name, bench.CASES)
+
+    def test_run_and_compare(self):
+        """Test a tiny run produces a report that compares with itself."""
+        report = bench.run(["HangmanGame.masked"], repeat=1, target=0.001)
+        result = report["results"]["HangmanGame.masked"]
+        self.assertGreater(result["ops_per_sec"], 0)
+        self.assertIn("peak_bytes", result)
+        lines = bench.compare(report, report)
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("1.00x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Unit tests for the bitmask game engine."""
+
+import random
+import unittest
+from hangman.game import BitmaskGame, HangmanGame, GuessResult, letter_mask
+from hangman.selector import WordSelector, Level
+
+
+class DummySelector(WordSelector):
+    """A dummy word selector for testing with a fixed word."""
+    def __init__(self, word):
+        self.word = word
+        super().__init__()
+
+    def pick_a_word(self, level):
+        return self.word
+
+
+class TestBitmaskGame(unittest.TestCase):
+    """Unit tests for BitmaskGame against the reference HangmanGame."""
+    def test_letter_mask(self):
+        """Test letter_mask sets one bit per distinct ASCII letter."""
+        self.assertEqual(letter_mask("abba"), 0b11)
+        self.assertEqual(letter_mask("z z!"), 1 << 25)
+
+    def test_results_and_state(self):
+        """Test the guess results for a simple word."""
+        game = BitmaskGame(DummySelector("Apple"), Level.BASIC, max_lives=3)
+        self.assertEqual(game.guess_letter("A"), GuessResult.CORRECT)
+        self.assertEqual(game.guess_letter("a"), GuessResult.REPEATED)
+        self.assertEqual(game.guess_letter("z"), GuessResult.INCORRECT)
+        self.assertEqual(game.guess_letter("1"), GuessResult.INVALID)
+        self.assertEqual(game.guessed, {"a", "z"})
+        self.assertEqual(game.lives, 2)
+        self.assertEqual(game.masked(), "a____")
+
+    def test_guessed_assignment(self):
+        """Test that assigning guessed updates the masks like the GUI tests do."""
+        game = BitmaskGame(DummySelector("go"), Level.BASIC)
+        game.guessed = game.answer
+        self.assertTrue(game.is_won())
+        game.guessed = set()
+        game.lives = 0
+        self.assertTrue(game.is_lost())
+
+    def test_guessed_set_methods_match_reference(self):
+        """Test add and discard on guessed behave as on HangmanGame."""
+        games = [cls(DummySelector("café au lait"), Level.BASIC)
+                 for cls in (HangmanGame, BitmaskGame)]
+        for game in games:
+            game.guess_letter("a")
+            game.guessed.add("t")
+            game.guessed.add("é")
+            game.guessed.add("z")
+            game.guessed.discard("a")
+            game.guessed.discard("q")
+        reference, bitmask = games
+        self.assertEqual(bitmask.guessed, reference.guessed)
+        self.assertEqual(set(bitmask.guessed), {"t", "é", "z"})
+        self.assertEqual(len(bitmask.guessed), 3)
+        self.assertIn("é", bitmask.guessed)
+        self.assertNotIn("a", bitmask.guessed)
+        self.assertEqual(bitmask.guessed | {"x"}, reference.guessed | {"x"})
+        self.assertEqual(bitmask.masked(), reference.masked())
+        self.assertEqual(bitmask.masked(), "___é __ ___t")
+        self.assertEqual(bitmask.guess_letter("t"), GuessResult.REPEATED)
+
+    def test_masked_is_incremental(self):
+        """Test masked reveals new letters and resets when guessed is replaced."""
+        game = BitmaskGame(DummySelector("letter"), Level.BASIC)
+        first = game.masked()
+        game.guess_letter("z")
+        self.assertIs(game.masked(), first)
+        game.guess_letter("e")
+        game.guess_letter("t")
+        self.assertEqual(game.masked(), "_ette_")
+        game.guessed = {"l"}
+        self.assertEqual(game.masked(), "l_____")
+
+    def test_matches_reference_engine(self):
+        """Test random guess sequences give identical results on both engines."""
+        rng = random.Random(7)
+        inputs = list("abcdefghijklmnopqrstuvwxyzAEIOU") + ["1", "", "ab", "é"]
+        for answer in ["banana", "test driven development", "café", "memory leak"]:  # noqa: E501 pylint: disable= [C0301]
+            ref = HangmanGame(DummySelector(answer), Level.INTERMEDIATE, max_lives=8)  # noqa: E501 pylint: disable= [C0301]
+            fast = BitmaskGame(DummySelector(answer), Level.INTERMEDIATE, max_lives=8)  # noqa: E501 pylint: disable= [C0301]
+            for _ in range(40):
+                guess = rng.choice(inputs)
+                if rng.random() < 0.1:
+                    ref.time_out()
+                    fast.time_out()
+                else:
+                    self.assertEqual(fast.guess_letter(guess), ref.guess_letter(guess))  # noqa: E501 pylint: disable= [C0301]
+                self.assertEqual(fast.masked(), ref.masked())
+                self.assertEqual(fast.guessed, ref.guessed)
+                self.assertEqual(fast.lives, ref.lives)
+                self.assertEqual(fast.is_won(), ref.is_won())
+                self.assertEqual(fast.is_lost(), ref.is_lost())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Unit tests for the python -m hangman command line."""
+
+import io
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from hangman.__main__ import build_parser, main
+
+
+class TestCli(unittest.TestCase):
+    """Unit tests for command dispatch and lazy imports."""
+    def test_startup_skips_heavy_imports(self):
+        """Test that starting the CLI loads no GUI, numpy or network code."""
+        code = ("import sys, hangman.__main__ as cli, hangman.game;"
+                "print(sorted(m for m in ('tkinter', 'numpy', 'requests',"
+                " 'asyncio') if m in sys.modules))")
+        out = subprocess.run([sys.executable, "-c", code], check=True,
+                             capture_output=True, text=True).stdout
+        self.assertEqual(out.strip(), "[]")
+
+    def test_forwarded_and_rejected_arguments(self):
+        """Test that serve and bench pass their flags through."""
+        with mock.patch("hangman.server.main") as serve:
+            main(["serve", "--port", "9000"])
+        serve.assert_called_once_with(["--port", "9000"])
+        with self.assertRaises(SystemExit), \
+                redirect_stdout(io.StringIO()), \
+                mock.patch("sys.stderr", io.StringIO()):
+            main(["play", "--port", "9000"])
+        args = build_parser().parse_args(["play", "--level", "intermediate"])
+        self.assertEqual(args.level, "intermediate")
+
+    def test_play_in_terminal(self):
+        """Test a scripted terminal game that guesses the whole alphabet."""
+        answers = iter(list("etaoinshrdlucmfwypvbgkjqxz") + ["n"])
+        out = io.StringIO()
+        with mock.patch("builtins.input", lambda _: next(answers)), \
+                redirect_stdout(out):
+            self.assertEqual(main(["play", "--seed", "1", "--lives", "26",
+                                   "--no-timer"]), 0)
+        self.assertIn("You won!", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Unit tests for the streaming corpus loader."""
+
+import gzip
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from hangman.corpus import (
+    BloomFilter, CorpusFilter, Progress, load_pool, reservoir, stream)
+from hangman.selector import Level, WordSelector
+from hangman.wordindex import WordIndex
+
+
+class TestCorpus(unittest.TestCase):
+    """Unit tests for filtering, dedupe, sampling and indexing."""
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()  # noqa: E501 pylint: disable=consider-using-with
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, lines, compress=False):
+        """Write a wordlist, optionally gzipped."""
+        path = self.dir / name
+        data = "".join(line + "\n" for line in lines).encode("UTF-8")
+        path.write_bytes(gzip.compress(data) if compress else data)
+        return path
+
+    def test_filter(self):
+        """Test normalisation, alphabetic checks and length limits."""
+        words = CorpusFilter(min_length=3, max_length=8)
+        self.assertEqual(words.accept(b"  Apple \n"), b"apple")
+        for line in (b"ox\n", b"toolongword\n", b"r2d2\n", b"ice cream\n",
+                     "café\n".encode("UTF-8"), b"\n"):
+            self.assertIsNone(words.accept(line))
+        phrases = CorpusFilter(max_length=20, max_words=2, ascii_only=False)
+        self.assertEqual(phrases.accept(b"Ice   Cream\n"), b"ice cream")
+        self.assertEqual(phrases.accept("Café\n".encode("UTF-8")),
+                         "café".encode("UTF-8"))
+        self.assertIsNone(phrases.accept(b"one two three\n"))
+        self.assertIsNone(phrases.accept(b"\xff\xfe\n"))
+
+    def test_stream_gzip_dedupe_and_progress(self):
+        """Test that plain and gzip files stream with duplicates dropped."""
+        plain = self.write("a.txt", ["Cat", "dog", "cat", "x1"])
+        packed = self.write("b.txt.gz", ["dog", "emu"], compress=True)
+        progress = Progress()
+        reports = []
+        entries = list(stream([plain, packed], progress=progress,
+                              report=reports.append))
+        self.assertEqual(entries, [b"cat", b"dog", b"emu"])
+        self.assertEqual((progress.lines, progress.accepted,
+                          progress.duplicates), (6, 3, 2))
+        self.assertEqual(reports, [progress])
+        self.assertIn("6 lines", progress.summary())
+
+    def test_bloom_filter(self):
+        """Test that the Bloom filter never forgets an item."""
+        bloom = BloomFilter(1 << 16)
+        items = [str(i).encode() for i in range(500)]
+        self.assertTrue(all(bloom.add(item) for item in items[:1]))
+        for item in items:
+            bloom.add(item)
+        self.assertFalse(any(bloom.add(item) for item in items))
+
+    def test_bloom_filter_sizing_and_saturation(self):
+        """Test sizing from a count, the rate estimate and the warning."""
+        sized = BloomFilter.for_count(20_000, rate=0.001)
+        for i in range(20_000):
+            sized.add(b"w%d" % i)
+        self.assertLess(sized.false_positive_rate, 0.0015)
+        false = sum(not sized.add(b"x%d" % i) for i in range(5000))
+        self.assertLess(false, 25)
+        letters = "abcdefghij"
+        words = [letters[i // 100] + letters[i // 10 % 10] + letters[i % 10]
+                 for i in range(1000)]
+        small = BloomFilter(1 << 12)
+        progress = Progress()
+        with self.assertWarnsRegex(RuntimeWarning, "dedupe filter"):
+            list(stream([self.write("many.txt", words)], progress=progress,
+                        dedupe=small))
+        self.assertGreater(small.fill, 0.3)
+        self.assertEqual(progress.false_positive_rate,
+                         small.false_positive_rate)
+        self.assertIn("false", progress.summary())
+
+    def test_reservoir_is_uniform(self):
+        """Test sizes and that every position is sampled evenly."""
+        self.assertEqual(reservoir(range(3), 5), [0, 1, 2])
+        rng = random.Random(7)
+        hits = [0] * 100
+        for _ in range(2000):
+            sample = reservoir(iter(range(100)), 10, rng)
+            self.assertEqual(len(set(sample)), 10)
+            for item in sample:
+                hits[item] += 1
+        self.assertGreater(min(hits), 140)
+        self.assertLess(max(hits), 260)
+
+    def test_load_pool_for_selector(self):
+        """Test both pool kinds plugged into a WordSelector."""
+        path = self.write("words.txt.gz", [f"w{'x' * i}" for i in range(50)],
+                          compress=True)
+        sample = load_pool([path], size=10, seed=1)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(sample, load_pool([path], size=10, seed=1))
+        index = load_pool([path], index_path=self.dir / "words.idx")
+        self.assertIsInstance(index, WordIndex)
+        self.assertEqual(len(index), 50)
+        word = WordSelector(basic_pool=index).pick_a_word(Level.BASIC)
+        self.assertTrue(word.startswith("w"))
+        index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Unit tests for difficulty scoring and graded levels."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from hangman import difficulty
+from hangman.selector import Level, WordSelector
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+WORDS = ["bake", "cake", "lake", "make", "rake", "take", "jazz", "fizz",
+         "banana", "debug mode", "syntax error", "kiwi"]
+
+
+class TestDifficulty(unittest.TestCase):
+    """Unit tests for build_scores, grade and graded selector levels."""
+    def test_grade_quartiles(self):
+        """Test that words are split into four equal ranked buckets."""
+        scores = {word: i for i, word in enumerate("abcdefgh")}
+        pools = difficulty.grade(scores)
+        self.assertEqual(list(pools), list(difficulty.GRADES))
+        self.assertEqual(pools[Level.EASY], ["a", "b"])
+        self.assertEqual(pools[Level.EXPERT], ["g", "h"])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_build_scores_is_incremental(self):
+        """Test that cached scores are reused and new words are scored."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "scores.json"
+            scores = difficulty.build_scores(WORDS[:6], path, workers=1)
+            self.assertEqual(set(scores), set(WORDS[:6]))
+            self.assertGreater(max(scores.values()), 0)
+            cached = dict(scores, bake=99)
+            difficulty.save_scores(cached, path)
+            scores = difficulty.build_scores(WORDS, path, workers=2)
+            self.assertEqual(scores["bake"], 99)
+            self.assertEqual(set(scores), set(WORDS))
+            self.assertEqual(difficulty.load_scores(path), scores)
+
+    def test_selector_serves_graded_levels(self):
+        """Test WordSelector picks graded words from the precomputed pools."""
+        saved = difficulty._POOLS  # pylint: disable=protected-access
+        difficulty._POOLS = difficulty.grade({w: i for i, w in enumerate(WORDS)})  # noqa: E501 pylint: disable=protected-access
+        try:
+            selector = WordSelector()
+            self.assertIn(selector.pick_a_word(Level.EASY), WORDS[:3])
+            self.assertIn(selector.pick_a_word(Level.EXPERT), WORDS[9:])
+        finally:
+            difficulty._POOLS = saved  # pylint: disable=protected-access
+
+    def test_bundled_scores_cover_bundled_list(self):
+        """Test the shipped artifact matches the shipped word list."""
+        scores = difficulty.load_scores(difficulty.BUNDLED_SCORES)
+        words = (difficulty.DATA_DIR / "wordlist.10000").read_text().split()
+        self.assertTrue(set(words) <= set(scores))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Unit tests for the binary game event log."""
+
+import gc
+import os
+import tempfile
+import unittest
+from string import ascii_lowercase
+from hangman.eventlog import (EventLog, Kind, MAX_GUESS_CHARS, read_events,
+                              replay, win_rates)
+from hangman.evil import EvilHangmanGame
+from hangman.game import BitmaskGame, GuessResult, HangmanGame
+from hangman.selector import FixedWordSelector, Level
+
+
+class TestEventLog(unittest.TestCase):
+    """Unit tests for writing, replaying and aggregating event logs."""
+    def setUp(self):
+        """Use a fresh log file per test."""
+        handle, self.path = tempfile.mkstemp(suffix=".hlog")
+        os.close(handle)
+        os.remove(self.path)
+        self.addCleanup(lambda: os.path.exists(self.path)
+                        and os.remove(self.path))
+
+    def play(self, log, word, letters, cls=HangmanGame, timeouts=0):
+        """Play one logged game."""
+        game = cls(FixedWordSelector(word=word), Level.BASIC, observer=log)
+        for _ in range(timeouts):
+            game.time_out()
+        for letter in letters:
+            game.guess_letter(letter)
+        return game
+
+    def test_replay_round_trip(self):
+        """Test that a replayed game matches what was played."""
+        with EventLog(self.path) as log:
+            self.play(log, "cat", "cxat", timeouts=1)
+        games = list(replay(self.path))
+        self.assertEqual(len(games), 1)
+        game = games[0]
+        self.assertEqual(game.answer, "cat")
+        self.assertEqual(game.level, Level.BASIC)
+        self.assertTrue(game.won)
+        self.assertEqual(game.timeouts, 1)
+        self.assertEqual(game.lives, 4)
+        self.assertEqual(game.guesses[:2], [("c", GuessResult.CORRECT),
+                                            ("x", GuessResult.INCORRECT)])
+
+    def test_win_rates_and_unfinished_games(self):
+        """Test per-word rates, skipping games that never ended."""
+        with EventLog(self.path, flush_bytes=16) as log:
+            self.play(log, "cat", "cat")
+            self.play(log, "cat", "zqwvxy", cls=BitmaskGame)
+            self.play(log, "dog", "d")
+        self.assertEqual(win_rates(self.path), {"cat": (1, 2)})
+        kinds = [event.kind for event in read_events(self.path)]
+        self.assertEqual(kinds.count(Kind.START), 3)
+
+    def test_long_invalid_guess_is_cut(self):
+        """Test oversized input is logged shortened instead of failing."""
+        with EventLog(self.path) as log:
+            game = self.play(log, "cat", "")
+            self.assertEqual(game.guess_letter("x" * 70_000), GuessResult.INVALID)  # noqa: E501 pylint: disable= [C0301]
+        guesses = [event.text for event in read_events(self.path)
+                   if event.kind == Kind.GUESS]
+        self.assertEqual(guesses, ["x" * MAX_GUESS_CHARS])
+
+    def test_abandoned_games_are_forgotten(self):
+        """Test a game dropped before it ends does not keep its id."""
+        with EventLog(self.path) as log:
+            game = self.play(log, "dog", "d")
+            self.assertEqual(len(log._ids), 1)  # pylint: disable=protected-access
+            del game
+            gc.collect()
+            self.assertEqual(log._ids, {})  # pylint: disable=protected-access
+
+    def test_appending_runs_restarts_ids(self):
+        """Test that a second writer appends without mixing up games."""
+        with EventLog(self.path) as log:
+            self.play(log, "dog", "d")
+        with EventLog(self.path) as log:
+            self.play(log, "cat", "cat")
+        self.assertEqual([game.answer for game in replay(self.path)], ["cat"])
+
+    def test_torn_tail_and_evil_answer(self):
+        """Test a truncated last record and the settled evil answer."""
+        with EventLog(self.path) as log:
+            game = self.play(log, "cat", "", cls=EvilHangmanGame)
+            for letter in ascii_lowercase:
+                if game.is_won() or game.is_lost():
+                    break
+                game.guess_letter(letter)
+        with open(self.path, "ab") as handle:
+            handle.write(b"\x09\x00\x02")
+        games = list(replay(self.path))
+        self.assertEqual(len(games), 1)
+        self.assertEqual(games[0].answer, game.answer)
+        self.assertEqual(games[0].won, game.is_won())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Unit tests for the adversarial Hangman mode."""
+
+import gc
+import random
+import unittest
+from unittest import mock
+from hangman import evil
+from hangman.evil import EvilHangmanGame
+from hangman.game import GuessResult
+from hangman.patterns import PatternIndex
+from hangman.selector import FixedWordSelector, Level, WordSelector
+
+WORDS = ["bake", "cake", "lake", "make", "rake", "take", "bike", "like",
+         "mike", "pike", "hike", "fish", "dish", "wish", "kiwi", "dog"]
+
+
+def make_game(max_lives=6):
+    """Create an evil game over WORDS with a four-letter shape."""
+    selector = WordSelector(basic_pool=[w.encode() for w in WORDS])
+    selector.pick_a_word = lambda level: "bake"
+    return EvilHangmanGame(selector, Level.BASIC, max_lives=max_lives)
+
+
+class TestEvilHangman(unittest.TestCase):
+    """Unit tests for EvilHangmanGame partitioning and results."""
+    def test_dodges_common_letters(self):
+        """Test that a guess hits only when every class reveals it."""
+        game = make_game()
+        self.assertEqual(game.remaining, 15)
+        self.assertEqual(game.guess_letter("e"), GuessResult.CORRECT)
+        self.assertEqual(game.masked(), "___e")
+        self.assertEqual(game.guess_letter("z"), GuessResult.INCORRECT)
+        self.assertEqual(game.guess_letter("i"), GuessResult.INCORRECT)
+        self.assertEqual(game.remaining, 6)
+        self.assertEqual(game.guess_letter("a"), GuessResult.CORRECT)
+        self.assertEqual(game.masked(), "_a_e")
+        self.assertEqual(game.guess_letter("a"), GuessResult.REPEATED)
+        self.assertEqual(game.guess_letter("7"), GuessResult.INVALID)
+        self.assertEqual(game.lives, 4)
+
+    def test_candidates_match_pattern_index(self):
+        """Test that survivors are exactly the words fitting the board."""
+        index = PatternIndex(WORDS)
+        rng = random.Random(1)
+        for _ in range(30):
+            game = make_game(max_lives=26)
+            for letter in rng.sample("abcdefghijklmnopqrstuvwxyz", 10):
+                game.guess_letter(letter)
+                wrong = game.guessed - set(game.answer)
+                survivors = {game.group.words[int(i)] for i in game.candidates}
+                self.assertEqual(survivors, set(index.match(game.masked(), wrong)))  # noqa: E501 pylint: disable= [C0301]
+
+    def test_pure_python_partition(self):
+        """Test the fallback path without numpy gives the same game."""
+        moves = "eaiklt"
+        expected = make_game()
+        results = [expected.guess_letter(ch) for ch in moves]
+        saved, evil.np = evil.np, None
+        evil._INDEXES.clear()  # pylint: disable=protected-access
+        try:
+            game = make_game()
+            self.assertEqual([game.guess_letter(ch) for ch in moves], results)
+            self.assertEqual(game.masked(), expected.masked())
+        finally:
+            evil.np = saved
+            evil._INDEXES.clear()  # pylint: disable=protected-access
+
+    def test_splits_are_memoised_by_guess_path(self):
+        """Test games on one path share splits and the memo stays bounded."""
+        selector = WordSelector(basic_pool=[w.encode() for w in WORDS])
+        selector.pick_a_word = lambda level: "bake"
+        first, second = (EvilHangmanGame(selector, Level.BASIC)
+                         for _ in range(2))
+        for ch in "eak":
+            first.guess_letter(ch)
+            second.guess_letter(ch)
+        self.assertIs(second.candidates, first.candidates)
+        group = first.group
+        splits = evil._SPLITS  # pylint: disable=protected-access
+        with mock.patch.object(evil, "MEMO_BUDGET", splits.size + 15):
+            group.partition(group.all(), "z", ("q",))
+        self.assertIsNotNone(splits.get((id(group), ("q", "z"))))
+        self.assertLessEqual(splits.size, evil.MEMO_BUDGET)
+
+    def test_caches_are_bounded(self):
+        """Test old pools are dropped and their splits with them."""
+        splits = evil._SPLITS  # pylint: disable=protected-access
+        evil._INDEXES.clear()  # pylint: disable=protected-access
+        gc.collect()
+        before = (len(splits), splits.size)
+        with mock.patch.object(evil, "MAX_INDEXES", 2):
+            for _ in range(4):
+                make_game().guess_letter("e")
+                gc.collect()
+                self.assertLessEqual(len(evil._INDEXES), 2)  # noqa: E501 pylint: disable=protected-access
+        evil._INDEXES.clear()  # pylint: disable=protected-access
+        gc.collect()
+        self.assertEqual((len(splits), splits.size), before)
+
+    def test_words_past_64_letters_use_pure_python(self):
+        """Test masks of very long words do not overflow."""
+        words = ["a" * 70, "a" * 69 + "b", "b" * 70]
+        group = evil.CandidateGroup(words)
+        self.assertFalse(group.numpy)
+        best, survivors = group.partition(group.all(), "b")
+        self.assertEqual((best, list(survivors)), (0, [0]))
+
+    def test_wide_keys_are_counted_by_sorting(self):
+        """Test long words split the same with and without numpy."""
+        rng = random.Random(4)
+        words = ["".join(rng.choice("abcde") for _ in range(30))
+                 for _ in range(300)]
+        numpy_group = evil.CandidateGroup(words)
+        saved, evil.np = evil.np, None
+        try:
+            python_group = evil.CandidateGroup(words)
+        finally:
+            evil.np = saved
+        self.assertFalse(python_group.numpy)
+        for letter in "abcde":
+            best, survivors = numpy_group.partition(numpy_group.all(), letter)  # noqa: E501 pylint: disable= [C0301]
+            expected = python_group.partition(python_group.all(), letter)
+            self.assertEqual((best, list(survivors)), expected)
+
+    def test_unknown_shape_plays_normally(self):
+        """Test a word with no pool neighbours acts like HangmanGame."""
+        game = EvilHangmanGame(FixedWordSelector(word="x-ray"), Level.BASIC)
+        self.assertEqual(game.guess_letter("x"), GuessResult.CORRECT)
+        self.assertEqual(game.masked(), "x-___")
+
+
+if __name__ == "__main__":
+    unittest.main()
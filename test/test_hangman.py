@@ -181,6 +181,25 @@ class TestHangmanGame(unittest.TestCase):
         game.guess_letter("t")
         self.assertEqual(game.masked(), "_ette_")
 
+    def test_masked_is_cached_between_guesses(self):
+        """Test masked returns the same string until a letter is revealed."""
+        selector = DummySelector("test driven development")
+        game = HangmanGame(selector=selector, level=Level.INTERMEDIATE)
+        first = game.masked()
+        game.guess_letter("z")
+        self.assertIs(game.masked(), first)
+        game.guess_letter("e")
+        self.assertEqual(game.masked(), "_e__ ____e_ _e_e____e__")
+
+    def test_masked_follows_guessed_reset(self):
+        """Test masked hides letters again when guessed is replaced."""
+        selector = DummySelector("banana")
+        game = HangmanGame(selector=selector, level=Level.BASIC)
+        game.guess_letter("a")
+        self.assertEqual(game.masked(), "_a_a_a")
+        game.guessed = {"n"}
+        self.assertEqual(game.masked(), "__n_n_")
+
     def test_is_won_true(self):
         """Test is_won returns True when all letters are guessed."""
         selector = DummySelector("cat")
@@ -237,6 +256,18 @@ class TestHangmanGame(unittest.TestCase):
         root.destroy()
         self.assertIs(gui.game, game)
 
+    def test_gui_close_stops_prefetch(self):
+        """Test the prefetch thread stops whichever way the window closes."""
+        for close in ("destroy", "close"):
+            with self.subTest(close=close):
+                root = tk.Tk()
+                gui = HangmanGUI(root)
+                thread = gui.games._thread  # pylint: disable=protected-access
+                self.assertTrue(thread.is_alive())
+                getattr(root if close == "destroy" else gui, close)()
+                thread.join(5)
+                self.assertFalse(thread.is_alive())
+
     def test_update_display(self):
         """Test that the GUI display updates correctly."""
         root = tk.Tk()
@@ -298,7 +329,7 @@ class TestHangmanGame(unittest.TestCase):
         game = HangmanGame(selector=selector, level=Level.BASIC)
         gui.game = game
         gui.start_game()
-        gui.remaining_time = 0
+        gui.deadline = gui.timers.now()
         gui.update_timer()
         self.assertLess(gui.game.lives, 6)
         root.destroy()
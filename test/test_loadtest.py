@@ -0,0 +1,91 @@
+"""Unit tests for the load-testing harness."""
+
+import json
+import os
+import unittest
+from unittest import mock
+from hangman import loadtest
+from hangman.metrics import Histogram
+from hangman.source import OFFLINE_ENV
+
+
+class TestLoadTest(unittest.TestCase):
+    """Unit tests for the players, hosts, report and comparison."""
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {OFFLINE_ENV: "1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def config(self, **kwargs) -> loadtest.LoadConfig:
+        """A short run."""
+        values = dict(players=4, duration=0.4, seed=1, sample=0.1,
+                      timeout=0.05)
+        values.update(kwargs)
+        return loadtest.LoadConfig(**values)
+
+    def test_direct_run_report(self):
+        """Test a direct run reports games, latency and memory."""
+        result = loadtest.run(self.config(timeout_rate=0.1))
+        self.assertGreater(result["games"], 0)
+        self.assertEqual(result["errors"], 0)
+        self.assertEqual(set(result["latency"]), {"start", "guess", "timeout"})  # noqa: E501 pylint: disable= [C0301]
+        guess = result["latency"]["guess"]
+        self.assertLessEqual(guess["p50"], guess["p95"])
+        self.assertLessEqual(guess["p95"], guess["p99"])
+        self.assertGreaterEqual(len(result["memory"]["samples"]), 2)
+        self.assertEqual(result["config"]["seed"], 1)
+        json.dumps(result)
+
+    def test_game_cap(self):
+        """Test --games stops the players after that many starts."""
+        result = loadtest.run(self.config(games=10, duration=30,
+                                          strategy="script"))
+        self.assertEqual(result["latency"]["start"]["count"], 10)
+        self.assertEqual(result["games"], 10)
+
+    def test_refused_guess_starts_a_new_game(self):
+        """Test a game the host ends early is an error, not a lost player."""
+        guess = loadtest.DirectLink.guess
+        calls = []
+
+        async def flaky(link, letter):
+            calls.append(letter)
+            if len(calls) % 7 == 0:
+                raise RuntimeError("game is over")
+            return await guess(link, letter)
+
+        with mock.patch.object(loadtest.DirectLink, "guess", flaky):
+            result = loadtest.run(self.config(players=2, games=20,
+                                              duration=30))
+        self.assertGreater(result["errors"], 0)
+        self.assertEqual(result["games"] + result["errors"], 20)
+
+    def test_servers(self):
+        """Test the in-process and loopback hosts, with timeouts."""
+        for target in ("inprocess", "loopback"):
+            with self.subTest(target=target):
+                result = loadtest.run(self.config(target=target, timeout_rate=0.2))  # noqa: E501 pylint: disable= [C0301]
+                self.assertEqual(result["errors"], 0)
+                self.assertGreater(result["latency"]["guess"]["count"], 0)
+                self.assertIn("timeout", result["latency"])
+
+    def test_client_waits_for_the_servers_timeout(self):
+        """Test a remote player's timeout wait follows the server's replies."""  # noqa: E501 pylint: disable= [C0301]
+        link = loadtest.ClientLink(client=None, timeout=9.0)
+        link._status({"ok": True, "status": "playing", "time_left": 0.2})  # noqa: E501 pylint: disable=protected-access
+        self.assertAlmostEqual(link.expire_wait, 0.2 + loadtest.TIMEOUT_MARGIN)  # noqa: E501 pylint: disable= [C0301]
+
+    def test_compare(self):
+        """Test the comparison lists throughput and p99 ratios."""
+        hist = Histogram(loadtest.LATENCY_BOUNDS)
+        hist.observe(1e-3)
+        self.assertAlmostEqual(hist.quantile(0.99), 1e-3, delta=1e-3 * 0.05)  # noqa: E501 pylint: disable= [C0301]
+        old = {"games_per_second": 100.0, "latency": {"guess": {"p99": 2e-3}}}  # noqa: E501 pylint: disable= [C0301]
+        new = {"games_per_second": 150.0, "latency": {"guess": {"p99": 1e-3}}}  # noqa: E501 pylint: disable= [C0301]
+        lines = loadtest.compare(new, old)
+        self.assertIn("1.50x", lines[0])
+        self.assertIn("0.50x", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Unit tests for the optional game metrics."""
+
+import sys
+import threading
+import unittest
+from hangman import metrics
+from hangman.game import BitmaskGame, HangmanGame
+from hangman.selector import FixedWordSelector, Level
+
+THREADS = 4
+ROUNDS = 20_000
+
+
+class TestMetrics(unittest.TestCase):
+    """Unit tests for instrumenting, counting and rendering metrics."""
+    def setUp(self):
+        """Instrument into a fresh registry."""
+        self.registry = metrics.Registry()
+        metrics.instrument(self.registry)
+        self.addCleanup(metrics.uninstrument)
+
+    def test_uninstrument_restores_methods(self):
+        """Test that the original methods come back and counting stops."""
+        self.assertIsNot(HangmanGame.guess_letter,
+                         HangmanGame.__dict__["guess_letter"].__wrapped__)
+        metrics.uninstrument()
+        self.assertFalse(metrics.enabled())
+        self.assertFalse(hasattr(HangmanGame.guess_letter, "__wrapped__"))
+        game = HangmanGame(FixedWordSelector(word="cat"), Level.BASIC)
+        game.guess_letter("c")
+        metrics.count("gui.start")
+        self.assertEqual(self.registry.counters, {})
+
+    def test_guess_results_are_counted(self):
+        """Test that each guess result and its latency are recorded."""
+        game = BitmaskGame(FixedWordSelector(word="cat"), Level.BASIC)
+        game.guess_letter("c")
+        game.guess_letter("c")
+        game.guess_letter("z")
+        game.guess_letter("1")
+        counters = self.registry.counters
+        self.assertEqual(counters["game.guess.CORRECT"], 1)
+        self.assertEqual(counters["game.guess.REPEATED"], 1)
+        self.assertEqual(counters["game.guess.INCORRECT"], 1)
+        self.assertEqual(counters["game.guess.INVALID"], 1)
+        hist = self.registry.histograms["game.guess_letter.seconds"]
+        self.assertEqual(hist.count, 4)
+
+    def test_timeout_and_selector(self):
+        """Test that timeouts and word picks are recorded."""
+        game = HangmanGame(FixedWordSelector(word="cat"), Level.BASIC)
+        game.time_out()
+        metrics.count("gui.time_expired")
+        self.assertEqual(self.registry.counters["game.timeout"], 1)
+        self.assertEqual(self.registry.counters["gui.time_expired"], 1)
+        picks = self.registry.histograms["selector.pick_a_word.seconds"]
+        self.assertEqual(picks.count, 1)
+
+    def test_snapshot_and_text(self):
+        """Test the plain data and text views of the registry."""
+        hist = self.registry.histogram("demo.seconds")
+        for seconds in (1e-6, 3e-6, 1e-3):
+            hist.observe(seconds)
+        snap = self.registry.snapshot()["histograms"]["demo.seconds"]
+        self.assertEqual(snap["count"], 3)
+        self.assertEqual(snap["p50"], 4e-6)
+        self.registry.inc("gui.won")
+        text = self.registry.render_text()
+        self.assertIn("hangman_gui_won_total 1", text)
+        self.assertIn('hangman_demo_seconds_bucket{le="+Inf"} 3', text)
+
+
+    def test_counts_from_many_threads(self):
+        """Test concurrent increments and observations are all kept."""
+        hist = self.registry.histogram("demo.seconds")
+
+        def work():
+            for _ in range(ROUNDS):
+                self.registry.inc("demo.calls")
+                hist.observe(1e-6)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            workers = [threading.Thread(target=work) for _ in range(THREADS)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(self.registry.counters["demo.calls"], THREADS * ROUNDS)  # noqa: E501 pylint: disable= [C0301]
+        self.assertEqual((hist.count, sum(hist.buckets)),
+                         (THREADS * ROUNDS, THREADS * ROUNDS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Unit tests for the masked-pattern word index."""
+
+import random
+import unittest
+from hangman.game import HangmanGame
+from hangman.patterns import PatternIndex
+from hangman.selector import FixedWordSelector, INTERMEDIATE_PHRASES, Level
+
+WORDS = ["banana", "bandana", "cabana", "canal", "panama", "salad",
+         "madam", "lemon", "melon", "apple"] + INTERMEDIATE_PHRASES
+
+
+def brute_force(pattern, excluded):
+    """Scan every word the slow way."""
+    matches = []
+    for word in WORDS:
+        game = HangmanGame(FixedWordSelector(word=word), Level.BASIC)
+        game.guessed = {ch for ch in pattern if ch.isalpha()} | set(excluded)
+        wrong = set(excluded) & set(word)
+        if game.masked() == pattern and not wrong:
+            matches.append(word)
+    return matches
+
+
+class TestPatternIndex(unittest.TestCase):
+    """Unit tests for PatternIndex.match and count."""
+    def setUp(self):
+        self.index = PatternIndex(WORDS)
+
+    def test_simple_patterns(self):
+        """Test a few hand-picked patterns."""
+        self.assertEqual(sorted(self.index.match("_a_a_a")), ["banana", "cabana", "panama"])  # noqa: E501 pylint: disable= [C0301]
+        self.assertEqual(self.index.match("_a_a_a", excluded="b"), ["panama"])
+        self.assertEqual(sorted(self.index.match("_e_o_")), ["lemon", "melon"])
+        self.assertEqual(self.index.count("_____"), 6)
+        self.assertEqual(self.index.match("___________"), [])
+
+    def test_revealed_letter_not_hidden_elsewhere(self):
+        """Test that a revealed letter cannot sit under a mask."""
+        self.assertEqual(self.index.match("ma_am"), ["madam"])
+        self.assertEqual(self.index.match("_a_a_", excluded="m"), ["canal", "salad"])
+
+    def test_phrases_keep_spaces(self):
+        """Test that phrase spaces must line up."""
+        self.assertEqual(self.index.match("_e___ _o_e"), ["debug mode"])
+
+    def test_matches_brute_force(self):
+        """Test random masked states against a full scan."""
+        rng = random.Random(5)
+        for _ in range(200):
+            word = rng.choice(WORDS)
+            guessed = set(rng.sample("abcdefghijklmnopqrstuvwxyz", rng.randint(0, 8)))  # noqa: E501 pylint: disable= [C0301]
+            game = HangmanGame(FixedWordSelector(word=word), Level.BASIC)
+            game.guessed = guessed
+            excluded = guessed - set(word)
+            pattern = game.masked()
+            self.assertEqual(sorted(self.index.match(pattern, excluded)),
+                             sorted(brute_force(pattern, excluded)))
+            self.assertEqual(self.index.count(pattern, excluded),
+                             len(brute_force(pattern, excluded)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Unit tests for the background game prefetch pool."""
+
+import time
+import unittest
+from hangman.game import GameObserver, HangmanGame
+from hangman.prefetch import GamePool
+from hangman.selector import Level, WordSelector
+
+
+class Starts(GameObserver):
+    """Observer counting on_start calls."""
+    def __init__(self):
+        self.games = []
+
+    def on_start(self, game):
+        self.games.append(game)
+
+
+class BrokenGame(HangmanGame):
+    """A game class that cannot be built."""
+    def __post_init__(self):
+        raise RuntimeError("no words")
+
+
+def wait_for(condition, timeout: float = 5.0):
+    """Poll until condition() holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestGamePool(unittest.TestCase):
+    """Unit tests for warming, taking, refilling and closing."""
+    def setUp(self):
+        self.pool = GamePool(WordSelector(seed=1), depth=3)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_warm_then_take_is_a_hit(self):
+        """Test games are built ahead and the queue refills."""
+        self.pool.warm(Level.INTERMEDIATE)
+        self.assertTrue(wait_for(lambda: self.pool.ready(Level.INTERMEDIATE) == 3))  # noqa: E501 pylint: disable= [C0301]
+        game = self.pool.take(Level.INTERMEDIATE)
+        self.assertIsInstance(game, HangmanGame)
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 0))
+        self.assertTrue(wait_for(lambda: self.pool.ready(Level.INTERMEDIATE) == 3))  # noqa: E501 pylint: disable= [C0301]
+
+    def test_cold_take_builds_on_the_caller(self):
+        """Test a kind nobody warmed is built straight away."""
+        game = self.pool.take(Level.BASIC)
+        self.assertIs(type(game), HangmanGame)
+        self.assertEqual(self.pool.misses, 1)
+
+    def test_words_do_not_repeat(self):
+        """Test prefetched games still follow the selector's order."""
+        self.pool.warm(Level.INTERMEDIATE)
+        answers = {self.pool.take(Level.INTERMEDIATE).answer
+                   for _ in range(20)}
+        self.assertEqual(len(answers), 20)
+
+    def test_observer_starts_on_take(self):
+        """Test on_start fires when the game is handed out."""
+        starts = Starts()
+        self.pool.warm(Level.INTERMEDIATE)
+        self.assertTrue(wait_for(lambda: self.pool.ready(Level.INTERMEDIATE) == 3))  # noqa: E501 pylint: disable= [C0301]
+        self.assertEqual(starts.games, [])
+        game = self.pool.take(Level.INTERMEDIATE, observer=starts)
+        self.assertEqual(starts.games, [game])
+        self.assertIs(game.observer, starts)
+
+    def test_build_errors_reach_the_caller(self):
+        """Test a failing kind stops prefetching and take() raises."""
+        self.pool.warm(Level.BASIC, BrokenGame)
+        self.assertTrue(wait_for(lambda: self.pool.errors == 1))
+        with self.assertRaises(RuntimeError):
+            self.pool.take(Level.BASIC, BrokenGame)
+
+    def test_close(self):
+        """Test close stops the worker and empties the queues."""
+        self.pool.warm(Level.INTERMEDIATE)
+        self.pool.close()
+        self.assertEqual(self.pool.ready(Level.INTERMEDIATE), 0)
+        self.assertFalse(self.pool._thread.is_alive())  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":
+    unittest.main()
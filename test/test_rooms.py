@@ -0,0 +1,169 @@
+"""Unit tests for spectator rooms and their frames."""
+
+import asyncio
+import gc
+import threading
+import unittest
+from hangman.game import HangmanGame
+from hangman.rooms import Kind, Room, Rooms, SpectatorView
+from hangman.selector import FixedWordSelector, Level
+
+
+def make_game(word: str = "debug mode", observer=None) -> HangmanGame:
+    """A game with a known answer."""
+    return HangmanGame(FixedWordSelector(word=word), Level.BASIC,
+                       observer=observer)
+
+
+async def drain(subscription) -> list:
+    """Every frame until the stream ends."""
+    return [frame async for frame in subscription]
+
+
+class TestRooms(unittest.TestCase):
+    """Unit tests for Room, Rooms, Subscription and SpectatorView."""
+    def test_view_follows_the_game(self):
+        """Test the frames rebuild the board, lives and guesses."""
+        async def run():
+            room = Room()
+            subscription = room.subscribe()
+            game = make_game(observer=room)
+            view = SpectatorView()
+            for guess in ["D", "x", "x", "1", None, "e", "b"]:
+                if guess is None:
+                    game.time_out()
+                else:
+                    game.guess_letter(guess)
+                while not subscription.queue.empty():
+                    view.apply(await subscription.__anext__())
+                self.assertEqual(view.masked, game.masked())
+                self.assertEqual(view.lives, game.lives)
+                self.assertEqual(sorted(view.guessed), sorted(game.guessed))
+            self.assertEqual(view.seq, 5)
+            self.assertFalse(view.over)
+        asyncio.run(run())
+
+    def test_delta_is_compact(self):
+        """Test a guess frame holds only the letter and new positions."""
+        async def run():
+            room = Room()
+            game = make_game(observer=room)
+            subscription = room.subscribe()
+            game.guess_letter("d")
+            frames = [subscription.queue.get_nowait() for _ in range(2)]
+            self.assertEqual(frames[0][0], Kind.SYNC)
+            self.assertEqual(frames[1][0], Kind.DELTA)
+            self.assertEqual(len(frames[1]), 7 + 1 + 2 * 2)
+        asyncio.run(run())
+
+    def test_late_subscriber_and_end(self):
+        """Test a late watcher starts from SYNC and sees the END."""
+        async def run():
+            room = Room()
+            game = make_game("cab", observer=room)
+            game.guess_letter("c")
+            game.guess_letter("z")
+            late = room.subscribe()
+            game.guess_letter("a")
+            game.guess_letter("b")
+            view = SpectatorView()
+            for frame in await drain(late):
+                view.apply(frame)
+            self.assertTrue(view.over and view.won)
+            self.assertEqual((view.masked, view.answer, view.lives), ("cab", "cab", 5))  # noqa: E501 pylint: disable= [C0301]
+            after = SpectatorView()
+            for frame in await drain(room.subscribe()):
+                after.apply(frame)
+            self.assertEqual(after, view)
+        asyncio.run(run())
+
+    def test_slow_consumer_is_dropped(self):
+        """Test a full queue drops that watcher and nobody else."""
+        async def run():
+            room = Room(max_frames=3)
+            game = make_game(observer=room)
+            slow = room.subscribe()
+            game.guess_letter("d")
+            game.guess_letter("e")
+            fast = room.subscribe()
+            for guess in "bugxz":
+                game.guess_letter(guess)
+                await fast.__anext__()
+            self.assertTrue(slow.dropped)
+            self.assertEqual(await drain(slow), [])
+            self.assertFalse(fast.dropped)
+            self.assertEqual(room.dropped, 1)
+            self.assertEqual(room.subscribers, {fast})
+            fast.close()
+            self.assertEqual(await drain(fast), [])
+        asyncio.run(run())
+
+    def test_rooms_per_game(self):
+        """Test Rooms opens a room per game and forgets finished ones."""
+        rooms = Rooms()
+        first = make_game("ab", observer=rooms)
+        second = make_game("cd", observer=rooms)
+        self.assertEqual(sorted(rooms.rooms), [1, 2])
+        first.guess_letter("a")
+        first.guess_letter("b")
+        self.assertIsNone(rooms.get(1))
+        second.time_out()
+        self.assertEqual(rooms.get(2).seq, 1)
+
+    def test_abandoned_game_closes_its_room(self):
+        """Test a game dropped unfinished takes its room and watchers along."""  # noqa: E501 pylint: disable= [C0301]
+        async def run():
+            rooms = Rooms()
+            game = make_game("ab", observer=rooms)
+            game.guess_letter("a")
+            watcher = rooms.get(1).subscribe()
+            del game
+            gc.collect()
+            self.assertIsNone(rooms.get(1))
+            self.assertEqual((rooms.rooms, rooms._ids), ({}, {}))  # noqa: E501 pylint: disable=protected-access
+            frames = await asyncio.wait_for(drain(watcher), 5)
+            self.assertEqual([frame[0] for frame in frames], [Kind.SYNC])
+        asyncio.run(run())
+
+    def test_game_on_another_thread(self):
+        """Test frames from a worker thread reach the loop's queues."""
+        async def run():
+            room = Room(loop=asyncio.get_running_loop())
+            subscription = room.subscribe()
+            game = make_game("ok")
+            worker = threading.Thread(
+                target=lambda: (room.watch(game), game.guess_letter("o"),
+                                game.guess_letter("k")))
+            worker.start()
+            frames = await asyncio.wait_for(drain(subscription), 5)
+            worker.join()
+            return [frame[0] for frame in frames]
+        self.assertEqual(asyncio.run(run()),
+                         [Kind.SYNC, Kind.DELTA, Kind.DELTA, Kind.END])
+
+    def test_subscribe_during_a_guess_on_another_thread(self):
+        """Test a SYNC that already holds an in-flight DELTA is not doubled."""
+        async def run():
+            room = Room(loop=asyncio.get_running_loop())
+            game = make_game("quiz")
+            room.watch(game)
+            await asyncio.sleep(0)
+            # The loop is blocked while the worker guesses, so the DELTA
+            # is still pending when the watcher subscribes.
+            worker = threading.Thread(target=game.guess_letter, args=("z",))
+            worker.start()
+            worker.join()
+            subscription = room.subscribe()
+            await asyncio.sleep(0)
+            view = SpectatorView()
+            while not subscription.queue.empty():
+                view.apply(subscription.queue.get_nowait())
+            return view, game
+        view, game = asyncio.run(run())
+        self.assertEqual(view.masked, game.masked())
+        self.assertEqual(view.lives, game.lives)
+        self.assertEqual(view.guessed, ["z"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Unit tests for the non-repeating word scheduler."""
+
+import threading
+import unittest
+from hangman.scheduler import FeistelPermutation, WordScheduler
+from hangman.selector import Level, WordSelector
+
+
+class TestScheduler(unittest.TestCase):
+    """Unit tests for permutations, passes, shards and seeded selectors."""
+    def test_permutation_is_a_bijection(self):
+        """Test that every size maps range(size) onto itself."""
+        for size in (1, 2, 3, 17, 64, 1000):
+            perm = FeistelPermutation(size, key=size)
+            self.assertEqual(sorted(map(perm, range(size))), list(range(size)))  # noqa: E501 pylint: disable= [C0301]
+        with self.assertRaises(ValueError):
+            FeistelPermutation(0, key=1)
+
+    def test_no_repeats_within_a_pass(self):
+        """Test each pass covers the pool once and passes differ."""
+        scheduler = WordScheduler(50, seed=3)
+        first = [scheduler.next() for _ in range(50)]
+        second = [scheduler.next() for _ in range(50)]
+        self.assertEqual(sorted(first), list(range(50)))
+        self.assertEqual(sorted(second), list(range(50)))
+        self.assertNotEqual(first, second)
+        self.assertEqual(scheduler.epoch, 1)
+        again = WordScheduler(50, seed=3)
+        self.assertEqual([again.next() for _ in range(50)], first)
+
+    def test_shards_do_not_overlap(self):
+        """Test that shards with one seed split a pass between them."""
+        shards = [WordScheduler(100, seed=9, shard=k, shards=3)
+                  for k in range(3)]
+        picks = [[s.next() for _ in range(len(range(k, 100, 3)))]
+                 for k, s in enumerate(shards)]
+        merged = sorted(i for pick in picks for i in pick)
+        self.assertEqual(merged, list(range(100)))
+        with self.assertRaises(ValueError):
+            WordScheduler(10, shard=3, shards=3)
+        with self.assertRaises(ValueError):
+            WordScheduler(2, shard=2, shards=3)
+
+    def test_thread_safe(self):
+        """Test that concurrent picks still form one permutation."""
+        scheduler = WordScheduler(4000, seed=1)
+        picked = []
+
+        def worker():
+            local = [scheduler.next() for _ in range(1000)]
+            picked.extend(local)
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(picked), list(range(4000)))
+
+    def test_selector_is_seeded(self):
+        """Test reproducible, non-repeating picks through WordSelector."""
+        pool = [f"word{i}".encode() for i in range(30)]
+        one = WordSelector(basic_pool=pool, seed=5)
+        two = WordSelector(basic_pool=pool, seed=5)
+        words = [one.pick_a_word(Level.BASIC) for _ in range(30)]
+        self.assertEqual(words, [two.pick_a_word(Level.BASIC)
+                                 for _ in range(30)])
+        self.assertEqual(len(set(words)), 30)
+        phrases = WordSelector(seed=5)
+        picked = [phrases.pick_a_word(Level.INTERMEDIATE) for _ in range(20)]
+        self.assertEqual(len(set(picked)), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Unit tests for the headless asyncio server."""
+
+import asyncio
+import json
+import unittest
+from hangman.game import GameObserver
+from hangman.selector import WordSelector
+from hangman.server import GameClient, GameServer
+
+
+class DummySelector(WordSelector):
+    """A dummy word selector for testing with a fixed word."""
+    def __init__(self, word):
+        self.word = word
+        super().__init__()
+
+    def pick_a_word(self, level):
+        return self.word
+
+
+class TestGameServer(unittest.TestCase):
+    """Unit tests for GameServer requests, timeouts and TCP protocol."""
+    def test_handle_without_loop(self):
+        """Test the request handler on its own."""
+        server = GameServer(DummySelector("cat"))
+        reply = server.handle({"op": "start", "level": "basic"})
+        self.assertTrue(reply["ok"])
+        self.assertEqual(reply["masked"], "___")
+        session = reply["session"]
+        reply = server.handle({"op": "guess", "session": session, "letter": "c"})  # noqa: E501 pylint: disable= [C0301]
+        self.assertEqual(reply["result"], "CORRECT")
+        self.assertEqual(reply["masked"], "c__")
+        for letter in "at":
+            reply = server.handle({"op": "guess", "session": session, "letter": letter})  # noqa: E501 pylint: disable= [C0301]
+        self.assertEqual(reply["status"], "won")
+        self.assertEqual(reply["answer"], "cat")
+        reply = server.handle({"op": "guess", "session": session, "letter": "x"})  # noqa: E501 pylint: disable= [C0301]
+        self.assertFalse(reply["ok"])
+        self.assertNotIn(session, server.sessions)
+        self.assertEqual(server.handle({"op": "state", "session": session})["status"], "won")  # noqa: E501 pylint: disable= [C0301]
+
+    def test_handle_errors(self):
+        """Test that bad requests produce error replies."""
+        server = GameServer(DummySelector("cat"))
+        self.assertFalse(server.handle({"op": "fly"})["ok"])
+        self.assertFalse(server.handle({"op": "start", "level": "impossible"})["ok"])  # noqa: E501 pylint: disable= [C0301]
+        self.assertFalse(server.handle({"op": "state", "session": 99})["ok"])
+        self.assertFalse(server.handle({"op": "state", "session": [1]})["ok"])
+        self.assertFalse(server.handle(["op"])["ok"])
+
+    def test_failing_observer_keeps_the_connection(self):
+        """Test an exception from game code becomes an error reply."""
+        class Broken(GameObserver):
+            """Fails on every guess."""
+            def on_guess(self, game, guess, result):
+                raise KeyError(guess)
+
+        async def scenario():
+            server = GameServer(DummySelector("cat"), observer=Broken())
+            tcp = await server.serve("127.0.0.1", 0)
+            client = await GameClient.connect("127.0.0.1", tcp.sockets[0].getsockname()[1])  # noqa: E501 pylint: disable= [C0301]
+            session = (await client.request(op="start"))["session"]
+            with self.assertLogs("hangman.server", "ERROR"):
+                failed = await client.request(op="guess", session=session, letter="c")  # noqa: E501 pylint: disable= [C0301]
+            state = await client.request(op="state", session=session)
+            await client.close()
+            tcp.close()
+            await tcp.wait_closed()
+            return failed, state
+        failed, state = asyncio.run(scenario())
+        self.assertEqual(failed, {"ok": False, "error": "internal error"})
+        self.assertTrue(state["ok"])
+
+    def test_overlong_line_gets_an_error_reply(self):
+        """Test a request past the stream limit is answered, then closed."""
+        async def scenario():
+            server = GameServer(DummySelector("cat"))
+            tcp = await server.serve("127.0.0.1", 0)
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", tcp.sockets[0].getsockname()[1])
+            writer.write(b"x" * 100_000 + b"\n")
+            await writer.drain()
+            reply = json.loads(await reader.readline())
+            rest = await reader.read()
+            writer.close()
+            tcp.close()
+            await tcp.wait_closed()
+            return reply, rest
+        reply, rest = asyncio.run(scenario())
+        self.assertEqual(reply, {"ok": False, "error": "line too long"})
+        self.assertEqual(rest, b"")
+
+    def test_timeout_costs_a_life(self):
+        """Test that the event loop charges a life when a guess times out."""
+        async def scenario():
+            server = GameServer(DummySelector("cat"), timeout=0.05)
+            tcp = await server.serve("127.0.0.1", 0)
+            session = server.start("basic")["session"]
+            await asyncio.sleep(0.12)
+            lives = server.state(session)["lives"]
+            tcp.close()
+            await tcp.wait_closed()
+            return lives
+        self.assertLessEqual(asyncio.run(scenario()), 5)
+
+    def test_tcp_protocol_many_sessions(self):
+        """Test many concurrent sessions through local TCP clients."""
+        async def player(port, word):
+            client = await GameClient.connect("127.0.0.1", port)
+            reply = await client.request(op="start", level="intermediate")
+            session = reply["session"]
+            for letter in set(word) - {" "}:
+                reply = await client.request(op="guess", session=session, letter=letter)  # noqa: E501 pylint: disable= [C0301]
+            state = await client.request(op="state", session=session)
+            await client.close()
+            return state["status"]
+
+        async def scenario():
+            server = GameServer(DummySelector("debug mode"))
+            tcp = await server.serve("127.0.0.1", 0)
+            port = tcp.sockets[0].getsockname()[1]
+            results = await asyncio.gather(*(player(port, "debug mode") for _ in range(200)))  # noqa: E501 pylint: disable= [C0301]
+            tcp.close()
+            await tcp.wait_closed()
+            return results, len(server.sessions), len(server.finished)
+        results, live, finished = asyncio.run(scenario())
+        self.assertEqual(set(results), {"won"})
+        self.assertEqual((live, finished), (0, 200))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Unit tests for the vectorized game simulator."""
+
+import random
+import unittest
+from hangman.game import HangmanGame
+from hangman.selector import FixedWordSelector, INTERMEDIATE_PHRASES, Level
+
+try:
+    import numpy as np
+    from hangman import simulate
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestSimulate(unittest.TestCase):
+    """Unit tests for simulate() against the scalar HangmanGame."""
+    def test_single_game(self):
+        """Test a hand-written game with a timeout and repeats."""
+        moves = simulate.encode_moves([["c", "z", None, "c", "1", "a", "t"]])
+        result = simulate.simulate(["cat"], moves, max_lives=6)
+        self.assertEqual(result.status.tolist(), [simulate.WON])
+        self.assertEqual(result.moves_used.tolist(), [7])
+        self.assertEqual(result.lives.tolist(), [4])
+
+    def test_loss_stops_game(self):
+        """Test that moves after a loss are ignored."""
+        moves = simulate.encode_moves([["x", "y", "z", "a"]])
+        result = simulate.simulate(["ab"], moves, max_lives=2)
+        self.assertEqual(result.status.tolist(), [simulate.LOST])
+        self.assertEqual(result.moves_used.tolist(), [2])
+        self.assertEqual(result.lives.tolist(), [0])
+
+    def test_matches_scalar_engine(self):
+        """Test random games, including timeouts, agree with HangmanGame."""
+        rng = random.Random(3)
+        words = ["banana", "apple", "zebra", "letter", "a"] + INTERMEDIATE_PHRASES  # noqa: E501 pylint: disable= [C0301]
+        answers = [rng.choice(words) for _ in range(300)]
+        moves = simulate.random_moves(300, k=26, timeout_rate=0.15, seed=11)
+        moves[::7, 5] = simulate.INVALID
+        lives = np.array([rng.randint(1, 8) for _ in answers])
+        result = simulate.simulate(answers, moves, max_lives=lives)
+        for i, answer in enumerate(answers):
+            game = HangmanGame(FixedWordSelector(word=answer), Level.BASIC,
+                               max_lives=int(lives[i]))
+            expected = simulate.play_scalar(game, simulate.decode_moves(moves[i]))  # noqa: E501 pylint: disable= [C0301]
+            actual = (int(result.status[i]), int(result.moves_used[i]),
+                      int(result.lives[i]))
+            self.assertEqual(actual, expected, answer)
+
+
+    def test_non_ascii_guess_costs_a_life(self):
+        """Test a non-ASCII letter misses once, then repeats, as in HangmanGame."""  # noqa: E501 pylint: disable= [C0301]
+        moves = ["é", "c", "É", "ß", "a", "t"]
+        encoded = simulate.encode_moves([moves])
+        result = simulate.simulate(["cat"], encoded, max_lives=6)
+        game = HangmanGame(FixedWordSelector(word="cat"), Level.BASIC)
+        expected = simulate.play_scalar(game, moves)
+        self.assertEqual((int(result.status[0]), int(result.moves_used[0]),
+                          int(result.lives[0])), expected)
+        self.assertEqual(expected, (simulate.WON, 6, 4))
+        game = HangmanGame(FixedWordSelector(word="cat"), Level.BASIC)
+        decoded = simulate.decode_moves(encoded[0])
+        self.assertEqual(simulate.play_scalar(game, decoded), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
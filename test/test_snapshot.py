@@ -0,0 +1,84 @@
+"""Unit tests for binary game snapshots."""
+
+import unittest
+from hangman.evil import EvilHangmanGame
+from hangman.game import BitmaskGame, GuessResult, HangmanGame
+from hangman.selector import FixedWordSelector, Level, WordSelector
+from hangman.snapshot import (
+    RECORD, decode_many, encode_many, from_bytes, to_bytes)
+
+
+def make_game(word, letters, cls=HangmanGame, level=Level.BASIC):
+    """Create a game with a fixed answer and some guesses."""
+    game = cls(FixedWordSelector(word=word), level)
+    for letter in letters:
+        game.guess_letter(letter)
+    return game
+
+
+class TestSnapshot(unittest.TestCase):
+    """Unit tests for snapshot round trips."""
+    def assertSameGame(self, restored, game):  # pylint: disable=invalid-name
+        """Check that a restored game matches the live one."""
+        self.assertIs(type(restored), type(game))
+        self.assertEqual(restored.answer, game.answer)
+        self.assertEqual(restored.level, game.level)
+        self.assertEqual(restored.guessed, game.guessed)
+        self.assertEqual(restored.lives, game.lives)
+        self.assertEqual(restored.max_lives, game.max_lives)
+        self.assertEqual(restored.masked(), game.masked())
+        self.assertEqual(restored.is_won(), game.is_won())
+        self.assertEqual(restored.is_lost(), game.is_lost())
+
+    def test_round_trip(self):
+        """Test that every engine survives to_bytes and from_bytes."""
+        for cls in (HangmanGame, BitmaskGame):
+            game = make_game("test driven development", "tezé", cls,
+                             Level.INTERMEDIATE)
+            data = to_bytes(game)
+            self.assertEqual(len(data), RECORD.size + 23 + 2)
+            restored = from_bytes(data, game_cls=cls)
+            self.assertSameGame(restored, game)
+            self.assertEqual(restored.guess_letter("d"),
+                             game.guess_letter("d"))
+            self.assertEqual(restored.masked(), game.masked())
+
+    def test_non_ascii_guess_survives_restore(self):
+        """Test a guessed letter outside a-z is still shown after restore."""
+        for cls in (HangmanGame, BitmaskGame):
+            game = make_game("café", "cé", cls)
+            self.assertEqual(game.masked(), "c__é")
+            self.assertSameGame(from_bytes(to_bytes(game), game_cls=cls), game)  # noqa: E501 pylint: disable= [C0301]
+            back, = decode_many(encode_many([game]), game_cls=cls)
+            self.assertSameGame(back, game)
+
+    def test_evil_game_keeps_its_answer(self):
+        """Test that a restored evil game no longer dodges."""
+        game = make_game("cat", "e", EvilHangmanGame)
+        restored = from_bytes(to_bytes(game), game_cls=EvilHangmanGame)
+        self.assertSameGame(restored, game)
+        self.assertEqual(restored.guess_letter(game.answer[0]),
+                         GuessResult.CORRECT)
+
+    def test_bulk_round_trip(self):
+        """Test that many games pack into one buffer and come back."""
+        selector = WordSelector()
+        games = [make_game(word, letters) for word, letters in
+                 (("cat", "ca"), ("banana", "xyzqwv"), ("ox", ""))]
+        restored = decode_many(encode_many(games), selector)
+        self.assertEqual(len(restored), len(games))
+        for back, game in zip(restored, games):
+            self.assertSameGame(back, game)
+            self.assertIs(back.selector, selector)
+
+    def test_rejects_bad_input(self):
+        """Test that foreign buffers and trailing bytes are refused."""
+        data = to_bytes(make_game("cat", "a"))
+        with self.assertRaises(ValueError):
+            from_bytes(data + b"x")
+        with self.assertRaises(ValueError):
+            decode_many(b"NOPE" + bytes(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Unit tests for the entropy solver bot."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from hangman.game import HangmanGame
+from hangman.selector import FixedWordSelector, Level
+
+try:
+    import numpy as np
+    from hangman.solver import EntropySolver, OpeningBook, run, shape_key
+except ImportError:  # pragma: no cover
+    np = None
+
+WORDS = ["bake", "cake", "lake", "make", "rake", "take", "bike", "like",
+         "fish", "dish", "wish", "banana", "bandana", "debug mode"]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestEntropySolver(unittest.TestCase):
+    """Unit tests for EntropySolver, its opening book and the driver."""
+    def test_solves_known_words(self):
+        """Test that every pool word is found."""
+        solver = EntropySolver(WORDS)
+        for word in WORDS:
+            game = HangmanGame(FixedWordSelector(word=word), Level.BASIC)
+            self.assertTrue(solver.play(game), word)
+
+    def test_unknown_word_uses_fallback(self):
+        """Test a word outside the pool is still played to the end."""
+        solver = EntropySolver(WORDS)
+        game = HangmanGame(FixedWordSelector(word="tea"), Level.BASIC)
+        self.assertTrue(solver.play(game))
+
+    def test_opening_book_is_cached(self):
+        """Test openings are written to disk and read back."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "book.json"
+            solver = EntropySolver(WORDS, OpeningBook(path))
+            solver.precompute()
+            book = OpeningBook(path)
+            self.assertEqual(book.get(shape_key("bake")), solver.book.get("____"))  # noqa: E501 pylint: disable= [C0301]
+            self.assertIn("_____ ____", book.moves)
+
+    def test_driver_report(self):
+        """Test the driver plays real games and reports throughput."""
+        report = run(20, Level.INTERMEDIATE, seed=1, cache=False)
+        self.assertEqual(report["games"], 20)
+        self.assertGreater(report["win_rate"], 0.5)
+        self.assertGreater(report["games_per_second"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Unit tests for the cached word source."""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from hangman.source import WordSource
+
+
+class OfflineSource(WordSource):
+    """A word source whose download always fails."""
+    def _download(self):
+        return None
+
+
+class FakeSource(WordSource):
+    """A word source that downloads a fixed payload."""
+    def _download(self):
+        return b"alpha\nbravo\n"
+
+
+class TestWordSource(unittest.TestCase):
+    """Unit tests for WordSource cache, network and bundled fallbacks."""
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.dir = Path(self.tmp.name)
+        self.bundled = self.dir / "bundled.txt"
+        self.bundled.write_bytes(b"apple\nbanana\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make(self, cls, **kwargs):
+        """Create a source of the given class rooted at the temp directory."""
+        return cls("http://example.invalid/words", self.bundled, "words.txt",
+                   cache_dir=self.dir / "cache", **kwargs)
+
+    def test_bundled_fallback_when_offline(self):
+        """Test that the bundled list is used when nothing else works."""
+        source = self.make(OfflineSource)
+        self.assertEqual(source.load(), [b"apple", b"banana"])
+        self.assertEqual(source.origin, "bundled")
+
+    def test_download_is_cached(self):
+        """Test that a downloaded list is written to the cache."""
+        source = self.make(FakeSource)
+        self.assertEqual(source.load(), [b"alpha", b"bravo"])
+        self.assertEqual(source.origin, "network")
+        self.assertTrue(source.cache_path.exists())
+        self.assertTrue(source.is_fresh())
+
+    def test_fresh_cache_skips_download(self):
+        """Test that a fresh cache is read without downloading."""
+        self.make(FakeSource).load()
+        source = self.make(OfflineSource)
+        self.assertEqual(source.load(), [b"alpha", b"bravo"])
+        self.assertEqual(source.origin, "cache")
+
+    def test_stale_cache_used_when_download_fails(self):
+        """Test that an old cache beats the bundled list when offline."""
+        self.make(FakeSource).load()
+        source = self.make(OfflineSource, max_age=60)
+        old = time.time() - 3600
+        os.utime(source.cache_path, (old, old))
+        self.assertFalse(source.is_fresh())
+        self.assertEqual(source.load(), [b"alpha", b"bravo"])
+        self.assertEqual(source.origin, "stale cache")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+"""Unit tests for the SQLite player statistics store."""
+
+import gc
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from hangman.game import GameObserver, HangmanGame, Observers
+from hangman.selector import FixedWordSelector, Level
+from hangman.stats import StatsRecorder, StatsStore
+
+WRITERS = 3
+GAMES_PER_WRITER = 200
+
+
+def _write_results(path: str, player: str):
+    """Record GAMES_PER_WRITER results from a separate process."""
+    with StatsStore(path, flush_rows=16) as store:
+        for i in range(GAMES_PER_WRITER):
+            store.add((player, f"word{i % 5}", 1, i % 2, 3, 3, 6, 0, float(i)))  # noqa: E501 pylint: disable= [C0301]
+
+
+def row(player: str, answer: str, won: bool, misses: int = 0):
+    """A result row with only the fields the aggregates read."""
+    return (player, answer, 1, int(won), 6 - misses, misses, 5, 0, 0.0)
+
+
+class TestStatsStore(unittest.TestCase):
+    """Unit tests for batching, aggregates and concurrent writers."""
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()  # noqa: E501 pylint: disable=consider-using-with
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, "stats.db")
+
+    def test_aggregates_and_streaks(self):
+        """Test triggers keep totals, streaks and word difficulty."""
+        with StatsStore(self.path) as store:
+            for won in (True, True, False, True, True, True, False):
+                store.add(row("ann", "cab", won, misses=0 if won else 6))
+            store.add(row("bob", "dog", True))
+            ann = store.player("ann")
+            self.assertEqual((ann.games, ann.wins), (7, 5))
+            self.assertEqual((ann.streak, ann.best_streak), (0, 3))
+            self.assertEqual(store.word("cab").misses, 12)
+            self.assertEqual([p.player for p in store.leaderboard(by="best_streak")], ["ann", "bob"])  # noqa: E501 pylint: disable= [C0301]
+            self.assertEqual([w.answer for w in store.hardest_words()], ["cab", "dog"])  # noqa: E501 pylint: disable= [C0301]
+            self.assertIsNone(store.player("nobody"))
+            with self.assertRaises(ValueError):
+                store.leaderboard(by="games")
+
+    def test_rows_are_written_in_batches(self):
+        """Test rows stay buffered until the batch is full."""
+        store = StatsStore(self.path, flush_rows=3, flush_seconds=60)
+        reader = StatsStore(self.path)
+        self.addCleanup(reader.close)
+        store.add(row("ann", "cab", True))
+        store.add(row("ann", "cab", True))
+        self.assertIsNone(reader.player("ann"))
+        store.add(row("ann", "cab", True))
+        self.assertEqual(reader.player("ann").games, 3)
+        store.add(row("ann", "cab", False))
+        store.close()
+        self.assertEqual(reader.player("ann").games, 4)
+
+    def test_idle_batch_is_written_by_timer(self):
+        """Test a partial batch reaches the database without more rows."""
+        store = StatsStore(self.path, flush_rows=100, flush_seconds=0.05)
+        self.addCleanup(store.close)
+        reader = StatsStore(self.path)
+        self.addCleanup(reader.close)
+        store.add(row("ann", "cab", True))
+        deadline = time.monotonic() + 5
+        while reader.player("ann") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(reader.player("ann").games, 1)
+
+    def test_concurrent_writer_processes(self):
+        """Test results from several processes all land in the totals."""
+        StatsStore(self.path).close()
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_write_results,
+                                   args=(self.path, f"p{i}"))
+                   for i in range(WRITERS)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+        with StatsStore(self.path) as store:
+            totals = store.totals()
+            self.assertEqual(totals["games"], WRITERS * GAMES_PER_WRITER)
+            self.assertEqual(totals["wins"], WRITERS * GAMES_PER_WRITER // 2)
+            self.assertEqual(sum(store.word(f"word{i}").games for i in range(5)),  # noqa: E501 pylint: disable= [C0301]
+                             WRITERS * GAMES_PER_WRITER)
+
+
+class TestStatsRecorder(unittest.TestCase):
+    """Unit tests for capturing outcomes from games."""
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()  # noqa: E501 pylint: disable=consider-using-with
+        self.addCleanup(self.dir.cleanup)
+        self.store = StatsStore(os.path.join(self.dir.name, "stats.db"))
+        self.addCleanup(self.store.close)
+
+    def test_records_each_game_once(self):
+        """Test a result is written when the game ends and only then."""
+        recorder = StatsRecorder(self.store, player="ann")
+        game = HangmanGame(FixedWordSelector(word="cab"), Level.BASIC,
+                           observer=recorder)
+        recorder.assign(game, "bob")
+        game.guess_letter("c")
+        game.guess_letter("x")
+        self.assertIsNone(self.store.player("bob"))
+        game.guess_letter("a")
+        game.guess_letter("b")
+        game.guess_letter("z")
+        bob = self.store.player("bob")
+        self.assertEqual((bob.games, bob.wins), (1, 1))
+        self.assertEqual(self.store.word("cab").misses, 1)
+
+    def test_restarted_game_does_not_inherit_state(self):
+        """Test on_start resets a game's player and timeouts; abandoned ones are dropped."""  # noqa: E501 pylint: disable= [C0301]
+        recorder = StatsRecorder(self.store, player="ann")
+        game = HangmanGame(FixedWordSelector(word="cab"), Level.BASIC,
+                           max_lives=2, observer=recorder)
+        recorder.assign(game, "bob")
+        game.time_out()
+        recorder.on_start(game)  # as if a new game reused this id()
+        game.lives = 1
+        game.time_out()
+        self.store.flush()
+        player, timeouts = self.store._db.execute(  # noqa: E501 pylint: disable=protected-access
+            "SELECT player, timeouts FROM results").fetchone()
+        self.assertEqual((player, timeouts), ("ann", 1))
+        abandoned = HangmanGame(FixedWordSelector(word="cab"), Level.BASIC,
+                                observer=recorder)
+        self.assertEqual(len(recorder._games), 2)  # noqa: E501 pylint: disable=protected-access
+        del abandoned
+        gc.collect()
+        self.assertEqual(list(recorder._games), [id(game)])  # noqa: E501 pylint: disable=protected-access
+
+    def test_timeouts_can_end_a_game(self):
+        """Test a loss by timeouts is recorded with its timeout count."""
+        recorder = StatsRecorder(self.store, player="ann")
+        game = HangmanGame(FixedWordSelector(word="cab"), Level.BASIC,
+                           max_lives=2, observer=recorder)
+        game.time_out()
+        game.time_out()
+        self.store.flush()
+        timeouts, = self.store._db.execute(  # pylint: disable=protected-access
+            "SELECT timeouts FROM results").fetchone()
+        self.assertEqual(timeouts, 2)
+        self.assertEqual(self.store.player("ann").wins, 0)
+
+    def test_end_follows_is_lost_not_lives(self):
+        """Test a move skipping past zero lives still ends the game once."""
+        class Harsh(HangmanGame):
+            """Timeouts cost two lives."""
+            def time_out(self):
+                self.lives -= 1
+                super().time_out()
+
+        recorder = StatsRecorder(self.store, player="ann")
+        game = Harsh(FixedWordSelector(word="cab"), Level.BASIC,
+                     max_lives=3, observer=recorder)
+        game.time_out()
+        game.time_out()
+        self.assertEqual(game.lives, -1)
+        game.guess_letter("z")
+        ann = self.store.player("ann")
+        self.assertEqual((ann.games, ann.wins), (1, 0))
+
+    def test_observers_fan_out(self):
+        """Test Observers passes events to every observer."""
+        seen = []
+
+        class Spy(GameObserver):
+            """Remembers the events it gets."""
+            def on_start(self, game):
+                seen.append("start")
+
+            def on_guess(self, game, guess, result):
+                seen.append(guess)
+
+        recorder = StatsRecorder(self.store)
+        game = HangmanGame(FixedWordSelector(word="ab"), Level.BASIC,
+                           observer=Observers(Spy(), recorder))
+        game.guess_letter("a")
+        game.guess_letter("b")
+        self.assertEqual(seen, ["start", "a", "b"])
+        self.assertEqual(self.store.player("local").wins, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Unit tests for the compact session store."""
+
+import unittest
+from hangman.game import BitmaskGame, HangmanGame
+from hangman.selector import FixedWordSelector, Level
+from hangman.store import GameRecord, SessionStore
+
+
+class FakeClock:
+    """A manually advanced clock."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_game(word="banana"):
+    """Create a game with a fixed answer."""
+    return HangmanGame(FixedWordSelector(word=word), Level.BASIC)
+
+
+class TestSessionStore(unittest.TestCase):
+    """Unit tests for GameRecord and SessionStore eviction."""
+    def test_record_round_trip(self):
+        """Test that a record rebuilds an equivalent game."""
+        game = make_game()
+        for letter in "anzé":
+            game.guess_letter(letter)
+        record = GameRecord.from_game(game)
+        self.assertFalse(hasattr(record, "__dict__"))
+        for cls in (HangmanGame, BitmaskGame):
+            restored = record.to_game(game_cls=cls)
+            self.assertIsInstance(restored, cls)
+            self.assertEqual(restored.answer, game.answer)
+            self.assertEqual(restored.guessed, game.guessed)
+            self.assertEqual(restored.lives, game.lives)
+            self.assertEqual(restored.masked(), "_anana")
+
+    def test_lru_eviction(self):
+        """Test that the least recently used record goes first."""
+        store = SessionStore(max_sessions=2)
+        store.put_game(1, make_game())
+        store.put_game(2, make_game())
+        store.get(1)
+        store.put_game(3, make_game())
+        self.assertIn(1, store)
+        self.assertNotIn(2, store)
+        self.assertEqual(store.metrics()["evicted_lru"], 1)
+
+    def test_ttl_eviction(self):
+        """Test that idle records expire and touched ones survive."""
+        clock = FakeClock()
+        store = SessionStore(ttl=10, clock=clock)
+        store.put_game("a", make_game())
+        store.put_game("b", make_game())
+        clock.now = 8
+        store.get("b")
+        clock.now = 15
+        self.assertIsNone(store.get("a"))
+        self.assertIsNotNone(store.get("b"))
+        self.assertEqual(store.metrics()["evicted_ttl"], 1)
+
+    def test_memory_cap(self):
+        """Test that the byte cap bounds the resident set."""
+        per_record = GameRecord.from_game(make_game()).nbytes()
+        store = SessionStore(max_bytes=per_record * 3)
+        for key in range(10):
+            store.put_game(key, make_game())
+        metrics = store.metrics()
+        self.assertEqual(metrics["resident"], 3)
+        self.assertEqual(metrics["evicted_memory"], 7)
+        self.assertLessEqual(metrics["bytes"], per_record * 3)
+
+
+    def test_changed_records_are_remeasured(self):
+        """Test a record grown after get is counted on the next get."""
+        store = SessionStore()
+        store.put_game("a", make_game())
+        record = store.get("a")
+        record.extra = "é" * 100
+        self.assertEqual(store.get("a", touch=False), record)
+        self.assertEqual(store.metrics()["bytes"], record.nbytes())
+        store.discard("a")
+        self.assertEqual(store.metrics()["bytes"], 0)
+
+    def test_get_purges_expired_records(self):
+        """Test any read drops records idle past the TTL."""
+        clock = FakeClock()
+        store = SessionStore(ttl=10, clock=clock)
+        store.put_game("a", make_game())
+        store.put_game("b", make_game())
+        clock.now = 15
+        self.assertIsNone(store.get("c"))
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.metrics()["evicted_ttl"], 2)
+        self.assertEqual(store.metrics()["bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
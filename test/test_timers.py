@@ -0,0 +1,153 @@
+"""Unit tests for the hierarchical timing wheel."""
+
+import asyncio
+import random
+import unittest
+from hangman.timers import TimingWheel, WheelDriver
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """A clock the test moves by hand."""
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class TestTimers(unittest.TestCase):
+    """Unit tests for arming, cancelling, cascading and driving timers."""
+    def setUp(self):
+        self.clock = FakeClock()
+        self.fired = []
+
+    def wheel(self, **kwargs) -> TimingWheel:
+        """A wheel on the fake clock."""
+        return TimingWheel(clock=self.clock, **kwargs)
+
+    def record(self, name):
+        """Timer callback noting when it fired."""
+        self.fired.append((name, self.clock.time))
+
+    def test_fires_at_deadline_not_before(self):
+        """Test a timer waits for its deadline and then fires once."""
+        wheel = self.wheel(resolution=0.1)
+        wheel.call_at(101.25, self.record, "a")
+        self.clock.time = 101.2
+        self.assertEqual(wheel.advance(), 0)
+        self.clock.time = 101.3
+        self.assertEqual(wheel.advance(), 1)
+        self.assertEqual(wheel.advance(), 0)
+        self.assertEqual(self.fired, [("a", 101.3)])
+        self.assertEqual(len(wheel), 0)
+
+    def test_cancel(self):
+        """Test a cancelled timer never fires and cancel is idempotent."""
+        wheel = self.wheel()
+        keep = wheel.call_later(1, self.record, "keep")
+        drop = wheel.call_later(1, self.record, "drop")
+        drop.cancel()
+        drop.cancel()
+        self.assertFalse(drop.pending)
+        self.assertEqual(len(wheel), 1)
+        self.clock.time += 2
+        wheel.advance()
+        self.assertEqual([name for name, _ in self.fired], ["keep"])
+        self.assertFalse(keep.pending)
+        keep.cancel()
+        self.assertEqual(len(wheel), 0)
+
+    def test_overdue_timer_fires_on_next_advance(self):
+        """Test a deadline already in the past fires straight away."""
+        wheel = self.wheel()
+        self.clock.time += 5
+        wheel.advance()
+        wheel.call_at(self.clock.time - 1, self.record, "late")
+        self.clock.time += 0.01
+        wheel.advance()
+        self.assertEqual(len(self.fired), 1)
+
+    def test_cascades_and_overflow_never_fire_early(self):
+        """Test random deadlines across every level on a tiny wheel."""
+        wheel = self.wheel(resolution=1.0, slot_bits=2, levels=3)
+        rng = random.Random(4)
+        deadlines = [self.clock.time + rng.uniform(0, 200) for _ in range(300)]  # noqa: E501 pylint: disable= [C0301]
+        for deadline in deadlines:
+            wheel.call_at(deadline, self.record, deadline)
+        cancelled = wheel.call_at(self.clock.time + 50, self.record, None)
+        cancelled.cancel()
+        while len(wheel):
+            self.clock.time += rng.uniform(0, 7)
+            wheel.advance()
+        self.assertEqual(sorted(name for name, _ in self.fired), sorted(deadlines))  # noqa: E501 pylint: disable= [C0301]
+        for deadline, fired_at in self.fired:
+            self.assertGreaterEqual(fired_at, deadline)
+            self.assertLess(fired_at - deadline, 8)
+
+    def test_callback_can_rearm(self):
+        """Test a callback arming another timer within one advance."""
+        wheel = self.wheel(resolution=0.5)
+
+        def again(count):
+            self.record(count)
+            if count < 3:
+                wheel.call_later(1, again, count + 1)
+        wheel.call_later(1, again, 1)
+        self.clock.time += 10
+        self.assertEqual(wheel.advance(), 1)
+        self.clock.time += 10
+        wheel.advance()
+        self.clock.time += 10
+        wheel.advance()
+        self.assertEqual([name for name, _ in self.fired], [1, 2, 3])
+
+    def test_next_wakeup(self):
+        """Test the wakeup time covers the earliest deadline."""
+        wheel = self.wheel(resolution=0.1)
+        self.assertIsNone(wheel.next_wakeup())
+        wheel.call_at(100.55, self.record, "a")
+        wheel.call_at(100.95, self.record, "b")
+        self.assertAlmostEqual(wheel.next_wakeup(), 100.6)
+        far = wheel.call_at(1000, self.record, "far")
+        self.assertAlmostEqual(wheel.next_wakeup(), 100.6)
+        self.clock.time = 101
+        wheel.advance()
+        self.assertLessEqual(wheel.next_wakeup(), far.deadline)
+
+    def test_driver_keeps_one_host_callback(self):
+        """Test the driver wakes the host only for the earliest timer."""
+        jobs = []
+        driver = WheelDriver(self.wheel(), lambda delay, func: jobs.append([delay, func]) or jobs[-1],  # noqa: E501 pylint: disable= [C0301]
+                             jobs.remove)
+        driver.call_later(5, self.record, "late")
+        driver.call_later(9, self.record, "later")
+        self.assertEqual(len(jobs), 1)
+        driver.call_later(1, self.record, "soon")
+        self.assertEqual(len(jobs), 1)
+        self.assertAlmostEqual(jobs[0][0], 1, places=1)
+        for _ in range(10):
+            if not jobs:
+                break
+            delay, func = jobs.pop()
+            self.clock.time += delay
+            func()
+        self.assertEqual([name for name, _ in self.fired], ["soon", "late", "later"])  # noqa: E501 pylint: disable= [C0301]
+        self.assertEqual(jobs, [])
+
+    def test_asyncio_driver(self):
+        """Test timers firing from a running asyncio loop."""
+        async def run():
+            loop = asyncio.get_running_loop()
+            driver = WheelDriver.for_asyncio(loop)
+            done = loop.create_future()
+            start = loop.time()
+            driver.call_later(0.05, lambda: done.set_result(loop.time()))
+            driver.call_later(0.02, self.record, "first").cancel()
+            return start, await asyncio.wait_for(done, 5)
+        start, fired = asyncio.run(run())
+        self.assertGreaterEqual(fired - start, 0.05)
+        self.assertEqual(self.fired, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
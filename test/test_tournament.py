@@ -0,0 +1,74 @@
+"""Unit tests for the multi-process tournament runner."""
+
+import os
+import unittest
+from unittest import mock
+from hangman import tournament
+from hangman.selector import Level
+from hangman.source import OFFLINE_ENV
+
+
+class TestTournament(unittest.TestCase):
+    """Unit tests for planning, bots, aggregation and the process pool."""
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {OFFLINE_ENV: "1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_plan_shards_each_matchup(self):
+        """Test batches cover the games once over disjoint shards."""
+        batches = list(tournament.plan(["frequency", "random"],
+                                       [Level.INTERMEDIATE], 45, seed=3,
+                                       batch_games=10))
+        self.assertEqual(len(batches), 10)
+        for name in ("frequency", "random"):
+            mine = [batch for batch in batches if batch.bot == name]
+            self.assertEqual(sum(batch.games for batch in mine), 45)
+            self.assertEqual(sorted(batch.shard for batch in mine), list(range(5)))  # noqa: E501 pylint: disable= [C0301]
+        small = list(tournament.plan(["frequency"], [Level.INTERMEDIATE],
+                                     1000, seed=3, batch_games=10))
+        self.assertEqual(len(small), 20)  # never more shards than phrases
+
+    def test_batches_do_not_repeat_words(self):
+        """Test shards of one pass hand out every phrase exactly once."""
+        words = []
+        for batch in tournament.plan(["frequency"], [Level.INTERMEDIATE], 20,
+                                     seed=5, batch_games=5):
+            selector = tournament.WordSelector(seed=batch.seed, shard=batch.shard,  # noqa: E501 pylint: disable= [C0301]
+                                               shards=batch.shards)
+            words += [selector.pick_a_word(batch.level)
+                      for _ in range(batch.games)]
+        self.assertEqual(len(set(words)), 20)
+
+    def test_standings_merge_results(self):
+        """Test results are folded per matchup and per worker."""
+        standings = tournament.Standings()
+        for worker in (1, 2, 1):
+            standings.add(tournament.BatchResult("frequency", Level.BASIC,
+                                                 10, 4, 90, 30, 0.5, worker))
+        report = standings.report()
+        self.assertEqual(report["matchups"][0]["games"], 30)
+        self.assertAlmostEqual(report["matchups"][0]["win_rate"], 0.4)
+        self.assertEqual([w["batches"] for w in report["workers"]], [2, 1])
+        self.assertAlmostEqual(report["workers"][0]["games_per_second"], 20)
+
+    def test_report_does_not_depend_on_workers(self):
+        """Test a seeded tournament gives the same standings on 1 or 2."""
+        args = (["frequency", "random"], [Level.INTERMEDIATE], 60)
+        one = tournament.run(*args, seed=7, workers=1, batch_games=15)
+        two = tournament.run(*args, seed=7, workers=2, batch_games=15)
+        self.assertEqual(one["matchups"], two["matchups"])
+        self.assertEqual(one["games"], 120)
+        self.assertEqual(sum(w["games"] for w in two["workers"]), 120)
+        self.assertGreater(two["games_per_second"], 0)
+        frequency = next(m for m in one["matchups"] if m["bot"] == "frequency")  # noqa: E501 pylint: disable= [C0301]
+        self.assertGreater(frequency["guesses_per_game"], 0)
+
+    def test_unknown_bot(self):
+        """Test an unregistered bot name is rejected up front."""
+        with self.assertRaises(ValueError):
+            tournament.run(["nobody"], [Level.BASIC], 1, workers=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
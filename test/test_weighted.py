@@ -0,0 +1,118 @@
+"""Unit tests for alias-table sampling and the weighted selector."""
+
+import os
+import random
+import unittest
+from collections import Counter
+from unittest import mock
+from hangman.selector import INTERMEDIATE_PHRASES, Level
+from hangman.source import OFFLINE_ENV
+from hangman.weighted import (AliasTable, WeightedPool, WeightedWordSelector,
+                              from_counts)
+
+DRAWS = 40_000
+
+
+def frequencies(draw, draws: int = DRAWS) -> Counter:
+    """Share of draws that landed on each index."""
+    counts = Counter(draw() for _ in range(draws))
+    return Counter({key: count / draws for key, count in counts.items()})
+
+
+class TestWeightedPool(unittest.TestCase):
+    """Unit tests for the alias table and weight updates."""
+    def assertShares(self, shares: Counter, weights):  # noqa: E501 pylint: disable=invalid-name
+        """Check sampled shares against weights within sampling noise."""
+        total = sum(weights)
+        for index, weight in enumerate(weights):
+            self.assertAlmostEqual(shares[index], weight / total, delta=0.01)
+
+    def test_alias_table_follows_weights(self):
+        """Test the table samples in proportion and skips zero weights."""
+        weights = [1, 0, 3, 6, 0.5, 2.5]
+        table = AliasTable(weights)
+        rng = random.Random(1)
+        self.assertShares(frequencies(lambda: table.sample(rng)), weights)
+        with self.assertRaises(ValueError):
+            AliasTable([0, 0])
+
+    def test_updates_are_exact_between_rebuilds(self):
+        """Test raised and lowered weights take effect on the next pick."""
+        pool = WeightedPool([4, 4, 4, 4, 0], boost_limit=8)
+        rebuilds = pool.rebuilds
+        pool.set_weight(0, 3)
+        pool.set_weight(1, 9)
+        pool.set_weight(4, 2)
+        rng = random.Random(2)
+        self.assertShares(frequencies(lambda: pool.pick(rng)), [3, 9, 4, 4, 2])
+        self.assertEqual(pool.rebuilds, rebuilds)
+        self.assertAlmostEqual(pool.probability(1), 9 / 22)
+        with self.assertRaises(ValueError):
+            pool.set_weight(0, -1)
+
+    def test_rebuilds_are_amortized(self):
+        """Test a pass that zeroes each pick covers every index once."""
+        size = 4096
+        pool = WeightedPool([1.0] * size)
+        rng = random.Random(3)
+        picks = []
+        for _ in range(size):
+            picks.append(pool.pick(rng))
+            pool.set_weight(picks[-1], 0)
+        self.assertEqual(sorted(picks), list(range(size)))
+        self.assertLess(pool.rebuilds, 20)  # about log2(size), not size
+        with self.assertRaises(ValueError):
+            pool.pick(rng)
+
+
+class TestWeightedWordSelector(unittest.TestCase):
+    """Unit tests for the weighted selector strategy."""
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {OFFLINE_ENV: "1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_seeded_picks_repeat(self):
+        """Test one seed gives one sequence of picks."""
+        first = WeightedWordSelector(seed=11)
+        second = WeightedWordSelector(seed=11)
+        picks = [first.pick_a_word(Level.BASIC) for _ in range(50)]
+        self.assertEqual(picks, [second.pick_a_word(Level.BASIC) for _ in range(50)])  # noqa: E501 pylint: disable= [C0301]
+        self.assertTrue(all(isinstance(word, str) for word in picks))
+
+    def test_fresh_words_first(self):
+        """Test seen words wait until the pool is used up."""
+        selector = WeightedWordSelector(seed=5, seen_factor=0)
+        selector.mark_seen(Level.INTERMEDIATE, INTERMEDIATE_PHRASES[:5])
+        picks = [selector.pick_a_word(Level.INTERMEDIATE) for _ in range(15)]
+        self.assertEqual(sorted(picks), sorted(INTERMEDIATE_PHRASES[5:]))
+        again = [selector.pick_a_word(Level.INTERMEDIATE) for _ in range(20)]
+        self.assertEqual(sorted(again), sorted(INTERMEDIATE_PHRASES))
+
+    def test_weights_and_updates(self):
+        """Test base weights, later weight changes and the seen factor."""
+        heavy = INTERMEDIATE_PHRASES[0]
+        selector = WeightedWordSelector(
+            seed=1, seen_factor=1, weight=from_counts({heavy: 81}))
+        self.assertAlmostEqual(selector.probability(Level.INTERMEDIATE, heavy), 0.81)  # noqa: E501 pylint: disable= [C0301]
+        shares = frequencies(lambda: selector.pick_a_word(Level.INTERMEDIATE), 5000)  # noqa: E501 pylint: disable= [C0301]
+        self.assertAlmostEqual(shares[heavy], 0.81, delta=0.03)
+        selector.set_weight(Level.INTERMEDIATE, heavy, 0)
+        picks = {selector.pick_a_word(Level.INTERMEDIATE) for _ in range(500)}
+        self.assertNotIn(heavy, picks)
+        with self.assertRaises(ValueError):
+            WeightedWordSelector(shards=2)
+
+    def test_rejected_weight_leaves_selector_usable(self):
+        """Test a bad weight changes nothing, even after a refresh."""
+        selector = WeightedWordSelector(seed=3, seen_factor=0)
+        word = INTERMEDIATE_PHRASES[0]
+        with self.assertRaises(ValueError):
+            selector.set_weight(Level.INTERMEDIATE, word, -1)
+        picks = [selector.pick_a_word(Level.INTERMEDIATE)
+                 for _ in range(2 * len(INTERMEDIATE_PHRASES))]
+        self.assertEqual(set(picks), set(INTERMEDIATE_PHRASES))
+
+
+if __name__ == "__main__":
+    unittest.main()
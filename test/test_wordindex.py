@@ -0,0 +1,58 @@
+"""Unit tests for the memory-mapped word index."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from hangman.selector import WordSelector, Level
+from hangman.wordindex import WordIndex, build_index, build_index_from_file
+
+
+class TestWordIndex(unittest.TestCase):
+    """Unit tests for building and reading word indexes."""
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test that every word reads back in order."""
+        words = ["apple", "banana", "kiwi"]
+        path = self.dir / "words.idx"
+        self.assertEqual(build_index(words, path), 3)
+        with WordIndex(path) as index:
+            self.assertEqual(len(index), 3)
+            self.assertEqual(index[1], b"banana")
+            self.assertEqual(index[-1], b"kiwi")
+            self.assertEqual(list(index), [w.encode() for w in words])
+            with self.assertRaises(IndexError):
+                index[3]  # pylint: disable=pointless-statement
+
+    def test_build_from_wordlist_skips_blank_lines(self):
+        """Test building from a plain wordlist file."""
+        src = self.dir / "words.txt"
+        src.write_bytes(b"dog\n\ncat\r\n")
+        path = self.dir / "words.idx"
+        self.assertEqual(build_index_from_file(src, path), 2)
+        with WordIndex(path) as index:
+            self.assertEqual(list(index), [b"dog", b"cat"])
+
+    def test_rejects_other_files(self):
+        """Test that a file without the index header is refused."""
+        path = self.dir / "bogus.idx"
+        path.write_bytes(b"not an index at all")
+        with self.assertRaises(ValueError):
+            WordIndex(path)
+
+    def test_selector_picks_from_index(self):
+        """Test that WordSelector can pick basic words from an index."""
+        path = self.dir / "words.idx"
+        build_index(["zebra", "yak"], path)
+        with WordIndex(path) as index:
+            selector = WordSelector(basic_pool=index)
+            self.assertIn(selector.pick_a_word(Level.BASIC), ["zebra", "yak"])
+
+
+if __name__ == "__main__":
+    unittest.main()